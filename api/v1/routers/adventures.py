@@ -5,72 +5,50 @@ from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.v1.routers.quiz_attempts import get_or_create_quiz_attempt
 from app.core.exceptions import InternalServerError, ResourceNotFoundError
-from app.db.models import Adventure, AdventureTheme, Quiz, Theme, User
+from app.db.models import Adventure, AdventureTheme, Theme
 from app.db.session import get_session
 from app.core.logging import logger
-from fastapi import APIRouter, Depends, Query
+from app.core.rate_limiter import get_rate_limiter, get_user_or_remote_address
+from fastapi import APIRouter, Depends, Query, Request
 from app.schemas.adventure import AdventureResponse, AssignThemesSchema, UnassignThemeSchema
 
-from app.schemas.quiz import QuestionSchema, QuizSchema
-from app.services.auth import get_admin_from_token, get_user_from_access_token
+from app.services.adventure import get_adventure_query_result
+from app.schemas.user import UserClaims
+from app.services.auth import get_admin_claims_from_token, get_user_claims_from_access_token
+from app.services.ebook import get_tts_urls_for_ebook
 from app.utils.adventure import get_or_create_adventure_progress
-from app.utils.ebook import get_tts_urls_for_ebook
+from app.utils.cache import invalidate_adventure_cache
 from app.utils.file import convert_from_bytes_to_mb
 from app.utils.quiz import has_completed_adventure_quiz
 
 
 router = APIRouter(prefix="/adventures", tags=["Adventures"])
+limiter = get_rate_limiter()
     
 
 @router.get("/{adventure_id}")
+@limiter.limit("120/minute", key_func=get_user_or_remote_address, local_buckets=True)
 async def get_adventure(
+    request: Request,
     adventure_id: UUID,
     profile_id: Optional[UUID] = Query(None),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
-        result = await session.exec(
-            select(Adventure)
-            .options(
-                joinedload(Adventure.ebook),
-                joinedload(Adventure.video),
-                joinedload(Adventure.series),
-                selectinload(Adventure.themes).selectinload(AdventureTheme.theme),
-                joinedload(Adventure.quiz).selectinload(Quiz.questions)
-            )
-            .where(Adventure.id == adventure_id)
+        adventure = await get_adventure_query_result(
+            adventure_id=adventure_id,
+            session=session
         )
-           
-        adventure = result.first()
 
         if not adventure:
             raise ResourceNotFoundError(
                 message="Adventure not found"
             )
 
-        theme_names = [adventure_theme.theme.name for adventure_theme in adventure.themes]
-        
         tts_urls = None
-        if adventure.ebook:
-             tts_urls = await get_tts_urls_for_ebook(adventure.ebook.id, session)
-               
-        quiz = None
-        if adventure.quiz: 
-            quiz = QuizSchema(
-                id=adventure.quiz.id,
-                questions=[
-                    QuestionSchema(
-                        id=question.id,
-                        text=question.text,
-                        choices=question.choices,
-                        correct_answer=question.correct_answer,
-                        timestamp_seconds=question.timestamp_seconds,
-                        question_type=question.question_type,
-                    )
-                    for question in adventure.quiz.questions
-                ],
-            )
+        if adventure.ebook_id:
+             tts_urls = await get_tts_urls_for_ebook(adventure.ebook_id, session)
             
         has_completed_quiz = None
         ongoing_attempt = None            
@@ -98,25 +76,25 @@ async def get_adventure(
         response = AdventureResponse(
             id=adventure.id,
             title=adventure.title,
-            series=adventure.series.name if adventure.series else None,
-            video_id=adventure.video.id if adventure.video else None,
-            ebook_id=adventure.ebook.id if adventure.ebook else None,
+            series=adventure.series,
+            video_id=adventure.video_id,
+            ebook_id=adventure.ebook_id,
             thumbnail=adventure.thumbnail,
-            themes=theme_names,
+            themes=adventure.themes,
             size=convert_from_bytes_to_mb(adventure.file_size) if adventure.file_size else 0,
-            hls_url=adventure.video.hls_url if adventure.video else None,
-            ebook_url=adventure.ebook.url if adventure.ebook else None,
-            duration=adventure.video.duration if adventure.video else None,
-            ebook_format=adventure.ebook.format if adventure.ebook else None,
+            hls_url=adventure.hls_url,
+            ebook_url=adventure.ebook_url,
+            duration=adventure.duration,
+            ebook_format=adventure.ebook_format,
             tts_urls=tts_urls if tts_urls else None,
-            quiz=quiz,
+            quiz=adventure.quiz,
             ongoing_attempt=ongoing_attempt, # null if profile_id is null
             has_completed_quiz=has_completed_quiz, # null if profile_id is null
             progress_id=adventure_progress.id if profile_id else None,
             is_finished=adventure_progress.is_finished if profile_id else None,
             finished_at=str(adventure_progress.finished_at) if profile_id and adventure_progress.finished_at else None,
-            video_stopped_at=adventure_progress.video_stopped_at if profile_id and adventure.video else None,
-            last_page_read=adventure_progress.last_page_read if profile_id and adventure.ebook else None,
+            video_stopped_at=adventure_progress.video_stopped_at if profile_id and adventure.video_id else None,
+            last_page_read=adventure_progress.last_page_read if profile_id and adventure.ebook_id else None,
             saved_for_later=adventure_progress.saved_for_later if profile_id else None,
         )
         return response
@@ -134,7 +112,7 @@ async def get_adventure(
 async def assign_themes(
     assign_theme_data: AssignThemesSchema, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> AdventureResponse:
     
     try:
@@ -195,6 +173,7 @@ async def assign_themes(
             await session.delete(adventure_theme)
                 
         await session.commit()
+        await invalidate_adventure_cache(adventure.id)
         await session.refresh(adventure)
         
         theme_names = [adventure_theme.theme.name for adventure_theme in adventure.themes or []]
@@ -222,7 +201,7 @@ async def assign_themes(
 async def unassign_theme(
     request: UnassignThemeSchema, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> AdventureResponse:
     
     try:
@@ -251,6 +230,7 @@ async def unassign_theme(
         
         await session.delete(adventure_theme)
         await session.commit()
+        await invalidate_adventure_cache(adventure_id)
                 
         get_adventure_query = await session.exec(
             select(Adventure)
@@ -1,22 +1,24 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlmodel import select
 from sqlalchemy.orm import joinedload
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app.core.exceptions import AuthenticationFailedError, InternalServerError, ResourceNotFoundError,  ValidationError, ErrorCode
-from app.schemas.user import ClassCodeLoginResponse, EmailSuccess, SendEmailSchema, UserResponse
+from app.schemas.user import ClassCodeLoginResponse, EmailSuccess, SendEmailSchema, UserClaims, UserResponse
 from app.schemas.auth import ClassCodeLogin, EmailPasswordCreds, GoogleUser, VerifyTokenSchema, ChangePasswordSchema, SSOProvider
 from app.db.session import get_session
-from app.core.security import create_access_token, create_passwordless_login_token, get_password_hash, verify_password
+from app.core.security import create_access_token, create_passwordless_login_token, get_password_hash_async, verify_password_async
 from app.db.models import Classroom, User, UserSSO
 from app.core.logging import logger
-from app.services.auth import get_user_from_access_token, verify_google_token, get_user_from_passwordless_login_token
+from app.services.auth import get_user_from_access_token, set_user_claims, verify_google_token_async, get_user_from_passwordless_login_token
 from app.services.email import send_email
 from app.core.config import settings
+from app.core.rate_limiter import get_rate_limiter
 
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
+limiter = get_rate_limiter()
 
 
 @router.post("/register")
@@ -42,7 +44,7 @@ async def register(
 
         new_user = User(
             email=user_data.email, 
-            password=get_password_hash(user_data.password)
+            password=await get_password_hash_async(user_data.password)
         )
         
         session.add(new_user)
@@ -73,7 +75,9 @@ async def register(
     
 
 @router.post('/password-login')
+@limiter.limit("10/minute")
 async def password_login(
+    request: Request,
     user_data: EmailPasswordCreds,
     session: AsyncSession = Depends(get_session)
 ) -> UserResponse:
@@ -82,6 +86,7 @@ async def password_login(
     Returns a token for making authenticated requests.
 
     Args:
+        request (Request): Incoming request. Used for rate limiting.
         user_data (UserCreate): Email and password.
         session (AsyncSession, optional): Asynchronous database session. Defaults to Depends(get_session).
 
@@ -105,7 +110,7 @@ async def password_login(
                 message="Email hasn't been registered with us. Perhaps you want to sign up?"
             )
             
-        if not verify_password(user_data.password, user.password):
+        if not await verify_password_async(user_data.password, user.password):
             raise ValidationError(
                 error_code=ErrorCode.WRONG_PASSWORD.value,
                 message="Wrong password. Please try again."
@@ -144,7 +149,9 @@ async def password_login(
     
     
 @router.post("/class-code-login")
+@limiter.limit("10/minute")
 async def class_code_login(
+    request: Request,
     req: ClassCodeLogin,
     session: AsyncSession = Depends(get_session)
 ) -> ClassCodeLoginResponse:
@@ -183,7 +190,9 @@ async def class_code_login(
     
     
 @router.post("/google")
+@limiter.limit("10/minute")
 async def google_auth(
+    request: Request,
     google_user: GoogleUser,
     session: AsyncSession = Depends(get_session)
 ) -> UserResponse:
@@ -191,6 +200,7 @@ async def google_auth(
     """User sends ID token from client. ID token is used to get user's email and google ID. If email is associated with an existing user, log them in, otherwise create an account. If user doesn't have an UserSSO instance for storing their Google ID, create one.
 
     Args:
+        request (Request): Incoming request. Used for rate limiting.
         google_user (GoogleUser): Contains ID token for authenticating Google user.
         session (AsyncSession, optional): Asynchronous database session. Defaults to Depends(get_session).
 
@@ -201,7 +211,7 @@ async def google_auth(
         UserResponse: A User schema.
     """
     try:
-        user_info = verify_google_token(google_user.id_token)
+        user_info = await verify_google_token_async(google_user.id_token)
 
         email = user_info["email"]
         google_id = user_info["sub"]  # Google's unique user ID
@@ -290,7 +300,9 @@ async def google_auth(
     
     
 @router.post('/request-passwordless-login')
+@limiter.limit("5/minute")
 async def send_login_link(
+    request: Request,
     login_request: SendEmailSchema,
     session: AsyncSession = Depends(get_session)
 ) -> EmailSuccess:
@@ -342,7 +354,9 @@ async def send_login_link(
         
         
 @router.post('/verify-passwordless-login')
+@limiter.limit("10/minute")
 async def verify_passwordless_login(
+    request: Request,
     verify_request: VerifyTokenSchema,
     session: AsyncSession = Depends(get_session)
 ) -> UserResponse:
@@ -402,10 +416,12 @@ async def change_password(
                 message="Passwords don't match"
             )
             
-        user.password = get_password_hash(passwords.password1)
+        user.password = await get_password_hash_async(passwords.password1)
         user.jwt_version = user.jwt_version + 1
+        claims = UserClaims(id=user.id, jwt_version=user.jwt_version, is_admin=bool(user.is_admin))
         session.add(user)
         await session.commit()
+        await set_user_claims(user.id, claims)
         
         return UserResponse(
             id=user.id,
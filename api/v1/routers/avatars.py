@@ -6,22 +6,26 @@ from sqlmodel import select
 from app.core.exceptions import InternalServerError, ResourceNotFoundError
 from app.schemas.avatar import AvatarResponse, AvatarsCreate
 from app.db.session import get_session
-from app.db.models import Avatar, User
+from app.db.models import Avatar
 from app.core.logging import logger
 from app.schemas.response import SuccessResponse
-from app.services.auth import get_user_from_access_token, get_admin_from_token
+from app.schemas.user import UserClaims
+from app.services.auth import get_user_claims_from_access_token, get_admin_claims_from_token
 
-from app.utils.gcs import delete_blob_from_gcs
+from app.services.storage_outbox import enqueue_gcs_deletion
+from app.utils.tiered_cache import TieredCache
 
 
 router = APIRouter(prefix="/avatars", tags=["Avatars"])
 
+avatars_cache = TieredCache("avatars")
+
 
 @router.post("")
 async def create(
     avatars: AvatarsCreate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> List[AvatarResponse]:
     
     try:            
@@ -42,6 +46,7 @@ async def create(
             )
             
         await session.commit()
+        await avatars_cache.clear()
         return uploaded_avatars  
         
     except Exception as e:
@@ -52,14 +57,14 @@ async def create(
 @router.get("")
 async def get_avatars(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)  
+    user: UserClaims = Depends(get_user_claims_from_access_token)  
 ) -> List[AvatarResponse]:
     
     """Get avatars
 
     Args:
         session (AsyncSession, optional): Asynchronous database session. Defaults to Depends(get_session).
-        user (User, optional): User authentication required. Defaults to Depends(get_user_from_access_token).
+        user (UserClaims, optional): User authentication required. Defaults to Depends(get_user_claims_from_access_token).
 
     Raises:
         InternalServerError: Unexpected error occurs.
@@ -67,7 +72,7 @@ async def get_avatars(
     Returns:
         List[AvatarResponse]: List of avatars.
     """
-    try:    
+    async def load_avatars() -> List[AvatarResponse]:
         result = await session.exec(
             select(Avatar)
         )
@@ -81,6 +86,9 @@ async def get_avatars(
             for avatar in avatars
         ]
     
+    try:    
+        return await avatars_cache.get_or_load("all", load_avatars, List[AvatarResponse])
+    
     except Exception as e:
         logger.error("Error getting avatars: {}", str(e), exc_info=True)
         raise InternalServerError()
@@ -90,7 +98,7 @@ async def get_avatars(
 async def delete_avatar(
     avatar_id: UUID, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> SuccessResponse:
     
     """Delete an avatar by ID. Also deletes the avatar from GCS.
@@ -98,7 +106,7 @@ async def delete_avatar(
     Args:
         avatar_id (UUID): ID of avatar to be deleted.
         session (AsyncSession, optional): Asynchronous database session. Defaults to Depends(get_session).
-        user (User, optional): User authentication required. Defaults to Depends(get_user_from_access_token).
+        user (UserClaims, optional): User must be an admin. Defaults to Depends(get_admin_claims_from_token).
 
     Raises:
         ResourceNotFoundError: Avatar with avatar_id not found
@@ -112,10 +120,11 @@ async def delete_avatar(
         if not avatar:
             raise ResourceNotFoundError(message="Avatar not found")
         
-        delete_blob_from_gcs(avatar.url)
+        enqueue_gcs_deletion(session, avatar.url)
         
         await session.delete(avatar)
         await session.commit()
+        await avatars_cache.clear()
 
         return SuccessResponse(
             message="Avatar deleted",
@@ -2,22 +2,25 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlmodel import func, select
+from sqlmodel import delete, func, select
 
 from app.core.exceptions import InternalServerError, ResourceNotFoundError
 from app.db.session import get_session
-from app.db.models import Adventure, User, eBook, eBookPage
+from app.db.models import Adventure, eBook, eBookPage
 from app.core.logging import logger
 from app.schemas.response import SuccessResponse
 from app.schemas.ebook import EbookResponse, EbookStoreMetadata, EbookUpdate, EbookCreate, EbooksResponse, EbookUpdateFile
-from app.services.auth import admin_or_ebook_processor, get_user_from_access_token, get_admin_from_token, verify_ebook_processor_token
+from app.schemas.user import UserClaims
+from app.services.auth import admin_or_ebook_processor, get_user_claims_from_access_token, get_admin_claims_from_token, verify_ebook_processor_token
 from app.utils.adventure import create_adventure, delete_adventure
-from app.utils.s3 import delete_s3_folder_contents, delete_s3_file
-from app.utils.gcs import delete_blob_from_gcs
+from app.services.async_s3 import delete_s3_files
+from app.utils.async_gcs import delete_blob_from_gcs, delete_blobs_from_gcs
+from app.services.storage_outbox import enqueue_gcs_deletion, enqueue_s3_deletion
 from app.utils.cloud_task_init import create_cloud_task, CloudTaskQueue, CloudTaskURL
 from app.utils.theme import get_themes_assigned_to_ebooks
 from app.utils.ebook import get_new_ebooks
 from app.utils.notifications import notify_all_users
+from app.utils.cache import invalidate_adventure_cache, invalidate_cache_tags
 from app.core.rate_limiter import get_rate_limiter
 from app.core.config import settings
 from app.services.email import send_email
@@ -33,7 +36,7 @@ async def upload_ebook(
     request: Request,
     ebook_data: EbookCreate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ) -> EbookResponse:
     
     try:
@@ -76,8 +79,7 @@ async def upload_ebook(
     except Exception as e:
         await session.rollback()
         logger.error("Error creating eBook: {}", str(e), exc_info=True)
-        delete_blob_from_gcs(ebook_data.thumbnail_url)
-        delete_blob_from_gcs(ebook_data.ebook_url)
+        await delete_blobs_from_gcs([ebook_data.thumbnail_url, ebook_data.ebook_url])
         raise InternalServerError()
      
     
@@ -115,6 +117,7 @@ async def store_ebook_metadata_after_create(
         
         session.add_all(ebook_pages)
         await session.commit()
+        await invalidate_cache_tags(f"adventure:{ebook.adventure_id}", f"ebook:{ebook.id}")
         
         # Notify users about new ebook content
         title = "New eBook Available!"
@@ -144,13 +147,8 @@ async def store_ebook_metadata_after_create(
         logger.error("Error storing eBook metadata: {}", str(e), exc_info=True)
         logger.info("Deleting ebook to avoid inconsistent data...")
         if ebook.url:
-            delete_blob_from_gcs(ebook.url)
-        if metadata.tts_audio_urls.values():
-            for audio_url in metadata.tts_audio_urls.values():
-                delete_s3_file(
-                    bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    url_or_key=audio_url,
-                )
+            await delete_blob_from_gcs(ebook.url)
+        await delete_s3_files(settings.AWS_STORAGE_BUCKET_NAME, list(metadata.tts_audio_urls.values()))
         await delete_adventure(ebook.adventure_id)
         raise 
     
@@ -163,7 +161,7 @@ async def get_ebooks(
     ebooks_limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ) -> EbooksResponse:
 
     try:
@@ -189,7 +187,7 @@ async def get_ebooks(
 async def delete_ebook(
     ebook_id: UUID, 
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(admin_or_ebook_processor),
+    _: UserClaims = Depends(admin_or_ebook_processor),
 ) -> SuccessResponse:
     
     """Deletes an eBook instance. Deletes the epub/mobi/pdf file from GCS, then the parent adventure (involves deleting the thumbnail from GCS and cascade deleting the eBook instance) 
@@ -197,7 +195,7 @@ async def delete_ebook(
     Args:
         video_id (UUID): Primary key of eBook
         session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
-        user (User, optional): User must be an admin. Defaults to Depends(get_admin_from_token).
+        _ (UserClaims, optional): User must be an admin or the eBook processor. Defaults to Depends(admin_or_ebook_processor).
 
     Raises:
         ResourceNotFoundError: eBook not found
@@ -212,11 +210,11 @@ async def delete_ebook(
         if not ebook:
             raise ResourceNotFoundError(message="eBook not found")
         
-        if ebook.url:
-            delete_blob_from_gcs(ebook.url)
+        # Storage objects are deleted by the storage deletion worker once the transaction below commits.
+        enqueue_gcs_deletion(session, ebook.url)
         
         tts_key_prefix = f"tts/{ebook_id}"
-        delete_s3_folder_contents(settings.AWS_STORAGE_BUCKET_NAME, tts_key_prefix)
+        enqueue_s3_deletion(session, settings.AWS_STORAGE_BUCKET_NAME, tts_key_prefix, is_prefix=True)
         
         await delete_adventure(ebook.adventure_id, session) # cascade deletes ebook
         
@@ -239,7 +237,7 @@ async def update_ebook(
     ebook_id: UUID,
     ebook_data: EbookUpdate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> EbookResponse:
     
     try:
@@ -253,13 +251,13 @@ async def update_ebook(
         
         for field, value in ebook_data.model_dump(exclude_unset=True).items():
             if field == "thumbnail_url":
-                if ebook.adventure.thumbnail:
-                    delete_blob_from_gcs(ebook.adventure.thumbnail)
+                enqueue_gcs_deletion(session, ebook.adventure.thumbnail)
                 setattr(ebook.adventure, "thumbnail", value)
             else:
                 setattr(ebook.adventure, field, value)      
         
         await session.commit()
+        await invalidate_adventure_cache(ebook.adventure_id)
         await session.refresh(ebook, ['adventure'])
 
         return EbookResponse(
@@ -282,14 +280,14 @@ async def update_ebook(
         raise InternalServerError()
     
 
-@limiter.limit("3/minute")    
 @router.patch("/{ebook_id}/file")
+@limiter.limit("3/minute")
 async def update_ebook_file(
     request: Request,
     ebook_id: UUID,
     ebook_data: EbookUpdateFile,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> EbookResponse:
     
     try: 
@@ -301,10 +299,11 @@ async def update_ebook_file(
         if not ebook:
             raise ResourceNotFoundError(message="eBook not found")
         
-        old_ebook_url = ebook.url
+        enqueue_gcs_deletion(session, ebook.url)
         
         ebook.url = ebook_data.ebook_url
         await session.commit()
+        await invalidate_adventure_cache(ebook.adventure_id)
         await session.refresh(ebook)
         
         task_name = create_cloud_task(
@@ -318,10 +317,6 @@ async def update_ebook_file(
         
         logger.info(f"Cloud task created for updating eBook {ebook.id}: {task_name}")
         
-        if old_ebook_url:
-            logger.info(f"Deleting old eBook file: {old_ebook_url}")
-            delete_blob_from_gcs(old_ebook_url)
-        
         return EbookResponse(
             id=ebook.id,
             adventure_id=ebook.adventure_id,
@@ -335,12 +330,12 @@ async def update_ebook_file(
         
     except ResourceNotFoundError as e:
         logger.error("eBook not found: {}", str(e), exc_info=True)
-        delete_blob_from_gcs(ebook_data.ebook_url)
+        await delete_blob_from_gcs(ebook_data.ebook_url)
         raise
         
     except Exception as e:
         logger.error("Error updating eBook file: {}", str(e), exc_info=True)
-        delete_blob_from_gcs(ebook_data.ebook_url)
+        await delete_blob_from_gcs(ebook_data.ebook_url)
         raise InternalServerError()
     
     
@@ -357,13 +352,21 @@ async def store_ebook_metadata_after_update(
             logger.error(f"eBook {metadata.ebook_id} not found.")
             raise ResourceNotFoundError(message="eBook not found")
         
-        old_ebook_pages_result = await session.exec(
-            select(eBookPage)
+        old_tts_urls_result = await session.exec(
+            select(eBookPage.tts_url)
             .where(eBookPage.ebook_id == ebook.id)
-            .order_by(eBookPage.page_number)
         )
-        old_ebook_pages = old_ebook_pages_result.all()
-        logger.info(f"Old eBook pages stored in memory and pending deletion.")
+        new_tts_urls = set(metadata.tts_audio_urls.values())
+        old_tts_urls = [url for url in old_tts_urls_result.all() if url and url not in new_tts_urls]
+        
+        # Replace the old pages in the same transaction as the new ones. Their audio files are deleted from S3 in
+        # batches by the storage deletion worker once it commits.
+        await session.exec(
+            delete(eBookPage).where(eBookPage.ebook_id == ebook.id)
+        )
+        for tts_url in old_tts_urls:
+            enqueue_s3_deletion(session, settings.AWS_STORAGE_BUCKET_NAME, tts_url)
+        logger.info(f"{len(old_tts_urls)} old TTS audio files queued for deletion.")
         
         adventure = await session.get(Adventure, ebook.adventure_id)
         adventure.file_size = round(metadata.file_size, 2)
@@ -389,6 +392,7 @@ async def store_ebook_metadata_after_update(
         
         session.add_all(ebook_pages)
         await session.commit()
+        await invalidate_cache_tags(f"adventure:{ebook.adventure_id}", f"ebook:{ebook.id}")
         
         logger.info(f"eBook metadata stored")
         
@@ -399,17 +403,6 @@ async def store_ebook_metadata_after_update(
             body_html=f"<p>Hi Edna,</p><p>The update of the eBook titled '{adventure.title}' was successful. Users can now read it on the Wonderspaced app.</p><p>Thanks for updating.</p>"
         )
         
-        # Delete old TTS audio files
-        if old_ebook_pages:
-            for ebook_page in old_ebook_pages:
-                delete_s3_file(
-                    bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    url_or_key=ebook_page.tts_url,
-                )
-                await session.delete(ebook_page)
-            await session.commit()
-            logger.info(f"Old TTS audio files references deleted from database.")
-        
         return EbookResponse(
             id=ebook.id,
             adventure_id=adventure.id,
@@ -425,11 +418,6 @@ async def store_ebook_metadata_after_update(
     except Exception as e:
         logger.error("Error storing eBook metadata: {}", str(e), exc_info=True)
         logger.info("Deleting the tts audio files which we failed to store.")
-        if metadata.tts_audio_urls.values():
-            for audio_url in metadata.tts_audio_urls.values():
-                delete_s3_file(
-                    bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    url_or_key=audio_url,
-                )
+        await delete_s3_files(settings.AWS_STORAGE_BUCKET_NAME, list(metadata.tts_audio_urls.values()))
         raise 
         
\ No newline at end of file
@@ -1,13 +1,14 @@
 from uuid import UUID
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.exceptions import InternalServerError
+from app.core.rate_limiter import get_rate_limiter, get_user_or_remote_address
 from app.db.session import get_session
-from app.db.models import User
 from app.core.logging import logger
 from app.schemas.explore import ExploreTabVideosResponse, ExploreTabEbooksResponse, ExploreTabInProgressResponse, ExploreTabDiysResponse
-from app.services.auth import get_user_from_access_token
+from app.schemas.user import UserClaims
+from app.services.auth import get_user_claims_from_access_token
 from app.utils.ebook import get_new_ebooks
 from app.utils.video import get_new_videos
 from app.utils.my_explorer import get_adventures_in_progress
@@ -15,16 +16,22 @@ from app.utils.adventure import get_series_adventures
 
 
 router = APIRouter(prefix="/explore-tab", tags=["ExploreTab"])
+limiter = get_rate_limiter()
+
+# Checked against in-memory buckets, since these endpoints are hit on every app open.
+EXPLORE_TAB_RATE_LIMIT = "120/minute"
 
 
 @router.get("/videos")
+@limiter.limit(EXPLORE_TAB_RATE_LIMIT, key_func=get_user_or_remote_address, local_buckets=True)
 async def explore_videos(
+    request: Request,
     q: Optional[str] = Query(None),
     offset: int = Query(0),
     limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
 
@@ -46,13 +53,15 @@ async def explore_videos(
 
 
 @router.get("/ebooks")
+@limiter.limit(EXPLORE_TAB_RATE_LIMIT, key_func=get_user_or_remote_address, local_buckets=True)
 async def explore_ebooks(
+    request: Request,
     q: Optional[str] = Query(None),
     offset: int = Query(0),
     limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
 
@@ -72,14 +81,16 @@ async def explore_ebooks(
     
     
 @router.get("/in-progress")
+@limiter.limit(EXPLORE_TAB_RATE_LIMIT, key_func=get_user_or_remote_address, local_buckets=True)
 async def explore_in_progress(
+    request: Request,
     profile_id: Optional[UUID] = Query(None),
     q: Optional[str] = Query(None),
     offset: int = Query(0),
     limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
 
@@ -100,13 +111,15 @@ async def explore_in_progress(
     
     
 @router.get("/diys")
+@limiter.limit(EXPLORE_TAB_RATE_LIMIT, key_func=get_user_or_remote_address, local_buckets=True)
 async def explore_diys(
+    request: Request,
     q: Optional[str] = Query(None),
     offset: int = Query(0),
     limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
 
@@ -3,11 +3,12 @@ from fastapi import APIRouter, Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.exceptions import InternalServerError, ValidationError
 from app.db.session import get_session
-from app.db.models import User
 from app.core.logging import logger
-from app.schemas.file_upload import AdventureURLGet, ThemeIconURLGet, ThumbnailURLGet, QuizURLGet, AvatarURLGet
-from app.services.auth import get_admin_from_token
-from app.utils.gcs import get_quiz_signed_url, get_theme_icon_signed_url, get_video_signed_url, get_thumbnail_signed_url, get_avatar_signed_url, get_ebook_signed_url
+from app.schemas.file_upload import AdventureURLGet, BatchURLGet, ThemeIconURLGet, ThumbnailURLGet, QuizURLGet, AvatarURLGet, UploadURLs
+from app.schemas.user import UserClaims
+from app.services.auth import get_admin_claims_from_token
+from app.utils.async_gcs import get_gcs_upload_signed_urls
+from app.utils.gcs import get_quiz_signed_url, get_theme_icon_signed_url, get_video_signed_url, get_thumbnail_signed_url, get_avatar_signed_url, get_ebook_signed_url, prepare_upload_targets
 
 
 router = APIRouter(prefix="/gcs-urls", tags=["File Upload"])
@@ -17,7 +18,7 @@ router = APIRouter(prefix="/gcs-urls", tags=["File Upload"])
 async def get_video_urls(
     file_upload_data: AdventureURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -52,7 +53,7 @@ async def get_video_urls(
 async def get_ebook_urls(
     file_upload_data: AdventureURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -92,7 +93,7 @@ async def get_ebook_urls(
 async def get_thumbnail_urls(
     file_upload_data: ThumbnailURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -120,7 +121,7 @@ async def get_thumbnail_urls(
 async def get_avatar_urls(
     file_upload_data: AvatarURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -148,7 +149,7 @@ async def get_avatar_urls(
 async def get_theme_icon_urls(
     file_upload_data: ThemeIconURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -176,7 +177,7 @@ async def get_theme_icon_urls(
 async def get_quiz_urls(
     file_upload_data: QuizURLGet,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)
+    user: UserClaims = Depends(get_admin_claims_from_token)
 ):
     
     try:
@@ -197,4 +198,37 @@ async def get_quiz_urls(
         
     except Exception as e:
         logger.error("Error getting quiz URLs: {}", str(e), exc_info=True)
-        raise InternalServerError()
\ No newline at end of file
+        raise InternalServerError()
+
+
+@router.post("/batch")
+async def get_batch_urls(
+    file_upload_data: BatchURLGet,
+    user: UserClaims = Depends(get_admin_claims_from_token)
+):
+    
+    try:
+        files = file_upload_data.files
+        
+        targets = prepare_upload_targets(files)
+        signed_urls = await get_gcs_upload_signed_urls(targets)
+        
+        return {
+            "files": [
+                UploadURLs(
+                    kind=file.kind,
+                    filename=file.filename,
+                    upload_url=urls['upload_url'],
+                    public_url=urls['public_url']
+                )
+                for file, urls in zip(files, signed_urls)
+            ]
+        }
+        
+    except ValidationError as e:
+        logger.error("Invalid extensions in batch: {}", str(e), exc_info=True)
+        raise
+        
+    except Exception as e:
+        logger.error("Error getting batch upload URLs: {}", str(e), exc_info=True)
+        raise InternalServerError()
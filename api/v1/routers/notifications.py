@@ -6,8 +6,7 @@ from app.db.session import get_session
 from app.db.models import User
 from app.core.logging import logger
 from app.services.auth import get_user_from_access_token
-from firebase_admin import messaging
-from app.utils.notifications import NotificationTopic
+from app.utils.notifications import NotificationTopic, subscribe_to_topic
 
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
@@ -26,9 +25,9 @@ async def get_device_token(
         session.add(user)
         await session.commit() 
 
-        messaging.subscribe_to_topic(
+        subscribe_to_topic(
             tokens=[request.token],
-            topic=NotificationTopic.ALL_USERS.value
+            topic=NotificationTopic.ALL_USERS
         )
 
         return DeviceToken(
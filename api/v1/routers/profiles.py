@@ -7,10 +7,11 @@ from app.core.exceptions import InternalServerError, ResourceNotFoundError
 from app.schemas.profile import ProfileCreate, ProfileResponse, ProfileUpdate
 from sqlalchemy.orm import joinedload
 from app.db.session import get_session
-from app.db.models import Avatar, User, UserProfile
+from app.db.models import Avatar, UserProfile
 from app.core.logging import logger
 from app.schemas.response import SuccessResponse
-from app.services.auth import get_admin_from_token, get_user_from_access_token
+from app.schemas.user import UserClaims
+from app.services.auth import get_admin_claims_from_token, get_user_claims_from_access_token
 from app.utils.profile import search_profile
 
 
@@ -21,7 +22,7 @@ router = APIRouter(prefix="/profiles", tags=["Profiles"])
 async def create(
     profile_data: ProfileCreate, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)  
+    user: UserClaims = Depends(get_user_claims_from_access_token)  
 ) -> ProfileResponse:
     
     try:          
@@ -52,7 +53,7 @@ async def create(
 @router.get("/all")
 async def get_all_profiles(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token),
+    user: UserClaims = Depends(get_admin_claims_from_token),
     q: Optional[str] = Query(None),
     offset: int = Query(0),
     limit: int = Query(10)
@@ -96,7 +97,7 @@ async def update(
     profile_id: UUID, 
     profile_data: ProfileUpdate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)  
+    user: UserClaims = Depends(get_user_claims_from_access_token)  
 ) -> ProfileResponse:
     
     try:       
@@ -147,7 +148,7 @@ async def update(
 async def get_profile(
     profile_id: UUID,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> ProfileResponse:    
     
     try:
@@ -182,7 +183,7 @@ async def get_profile(
 @router.get("")
 async def get_user_profiles(
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)  
+    user: UserClaims = Depends(get_user_claims_from_access_token)  
 ) -> List[ProfileResponse]:
     
     try:
@@ -215,7 +216,7 @@ async def get_user_profiles(
 async def delete_profile(
     profile_id: UUID, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)  
+    user: UserClaims = Depends(get_user_claims_from_access_token)  
 ) -> SuccessResponse:
     
     try:
@@ -1,19 +1,20 @@
-import os
-from pathlib import Path
+import asyncio
 from typing import List
 from uuid import UUID
-import uuid
 from fastapi import APIRouter, Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.core.exceptions import InternalServerError, ResourceNotFoundError
+from app.core.exceptions import InternalServerError, ResourceNotFoundError, ValidationError
 from app.db.session import get_session
-from app.db.models import Adventure, QuizQuestion, User, Quiz
+from app.db.models import Adventure, QuizQuestion, Quiz
 from app.core.logging import logger
 from app.schemas.quiz import QuestionSchema, QuizSchema, ParseQuizDocRequest
 from app.schemas.response import SuccessResponse
-from app.services.auth import get_admin_from_token
+from app.schemas.user import UserClaims
+from app.services.auth import get_admin_claims_from_token
 from app.utils.file import extract_text
-from app.utils.gcs import delete_blob_from_gcs, download_file_from_gcs, get_file_metadata_from_gcs_public_url
+from app.utils.async_gcs import delete_blob_from_gcs, download_file_from_gcs_to_buffer, get_file_metadata_from_gcs_public_url
+from app.utils.gcs import GCS_DOWNLOAD_MAX_BYTES, raise_file_too_large
+from app.utils.cache import invalidate_adventure_cache
 from app.utils.quiz import format_quiz_text_into_request
 
 
@@ -24,23 +25,26 @@ router = APIRouter(prefix="/quizzes", tags=["Quizzes"])
 async def parse_quiz_from_doc(
     quiz_doc: ParseQuizDocRequest,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> List[QuestionSchema]:  
     
+    quiz_buffer = None
+    
     try: 
-        file_extension = get_file_metadata_from_gcs_public_url(quiz_doc.url)["extension"]
+        metadata = await get_file_metadata_from_gcs_public_url(quiz_doc.url)
+        file_extension = metadata["extension"]
         
-        TEMP_FOLDER = Path("/tmp")
-        TEMP_FOLDER.mkdir(exist_ok=True)
-        local_quiz_path = download_file_from_gcs(
-            quiz_doc.url,
-            os.path.join(TEMP_FOLDER, "quizzes", f"quiz_{str(uuid.uuid4())}.{file_extension}")
-        )
-        logger.info(f"Downloaded quiz to {local_quiz_path}")
+        # Reject oversized documents before downloading them. The size comes from the cached metadata lookup.
+        if metadata["size"] and metadata["size"] > GCS_DOWNLOAD_MAX_BYTES:
+            raise_file_too_large(GCS_DOWNLOAD_MAX_BYTES)
+        
+        quiz_buffer = await download_file_from_gcs_to_buffer(quiz_doc.url)
+        logger.info(f"Downloaded quiz {metadata['name']} ({metadata['size']} bytes) to memory")
         
-        quiz_text = extract_text(
+        quiz_text = await asyncio.to_thread(
+            extract_text,
             extension=file_extension,
-            file_path=local_quiz_path
+            file=quiz_buffer
         )
         
         list_of_questions = format_quiz_text_into_request(quiz_text)
@@ -57,25 +61,29 @@ async def parse_quiz_from_doc(
         ]
         
     except FileNotFoundError as e:
-        logger.error("Local quiz path not found. Quiz was likely not downloaded because object doesn't exist in GCS bucket: {}", str(e), exc_info=True)
+        logger.error("Quiz doc not found in GCS bucket: {}", str(e), exc_info=True)
         raise ResourceNotFoundError(message="File not found")
+    
+    except ValidationError as e:
+        logger.error("Invalid quiz doc: {}", str(e), exc_info=True)
+        raise
         
     except Exception as e:
         logger.error("Error parsing quiz from doc: {}", str(e), exc_info=True)
         raise InternalServerError() 
     
     finally:
-        if local_quiz_path and os.path.exists(local_quiz_path):
-            os.remove(local_quiz_path)
+        if quiz_buffer:
+            quiz_buffer.close()
         if quiz_doc.url:
-            delete_blob_from_gcs(quiz_doc.url)
+            await delete_blob_from_gcs(quiz_doc.url)
 
 
 @router.post("")
 async def create(
     quiz: QuizSchema,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> QuizSchema:
     
     try:    
@@ -102,6 +110,7 @@ async def create(
             uploaded_questions.append(new_question)
         
         await session.commit()
+        await invalidate_adventure_cache(quiz.adventure_id)
         await session.refresh(new_quiz)
 
         return QuizSchema(
@@ -132,14 +141,14 @@ async def create(
 async def delete_quiz(
     quiz_id: UUID, 
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ):
     """Delete a Quiz by ID
 
     Args:
         quiz_id (UUID): ID of quiz to be deleted.
         session (AsyncSession, optional): Asynchronous database session. Defaults to Depends(get_session).
-        user (User, optional): User must be an admin. Defaults to Depends(get_admin_from_token).
+        user (UserClaims, optional): User must be an admin. Defaults to Depends(get_admin_claims_from_token).
 
     Raises:
         ResourceNotFoundError: Quiz with quiz_id not found
@@ -156,6 +165,7 @@ async def delete_quiz(
         
         await session.delete(quiz)
         await session.commit()
+        await invalidate_adventure_cache(quiz.adventure_id)
         logger.info(f"Quiz deleted: {quiz_id}")
 
         return SuccessResponse(
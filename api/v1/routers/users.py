@@ -4,11 +4,11 @@ from sqlmodel import select, delete, and_
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.exceptions import InternalServerError, ResourceNotFoundError, ValidationError
 from app.schemas.response import SuccessResponse
-from app.schemas.user import UserResponse, UserUpdate
+from app.schemas.user import UserClaims, UserResponse, UserUpdate
 from app.db.session import get_session
 from app.db.models import Classroom, User, UserProfile, UserSSO
 from app.core.logging import logger
-from app.services.auth import get_admin_from_token, get_user_from_access_token
+from app.services.auth import get_admin_from_token, get_user_from_access_token, set_user_claims
 from app.utils.user import validate_email_uniqueness
 
 
@@ -131,8 +131,10 @@ async def delete_user(
         SuccessResponse: Contains a "User deleted" message
     """
     try:
+        user_id = user.id
         await session.delete(user)
         await session.commit()
+        await set_user_claims(user_id, None)
 
         return SuccessResponse(
             message="User deleted",
@@ -171,8 +173,11 @@ async def update(
         for field, value in user_data.model_dump(exclude_unset=True).items():
             setattr(user, field, value)
         
+        claims = UserClaims(id=user.id, jwt_version=user.jwt_version, is_admin=bool(user.is_admin))
         session.add(user)
         await session.commit()
+        if user_data.email:
+            await set_user_claims(user.id, claims)
 
         return UserResponse(
             id=user.id,
@@ -4,17 +4,19 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
 from app.core.exceptions import InternalServerError, ResourceNotFoundError
 from app.db.session import get_session
-from app.db.models import Adventure, User, Video, VideoVariant
+from app.db.models import Adventure, Video, VideoVariant
 from app.core.logging import logger
 from app.schemas.response import SuccessResponse
 from app.schemas.video import VideoResponse, VideoStoreMetadata, VideoUpdate, VideoCreate, VideosResponse
-from app.services.auth import admin_or_video_processor, get_user_from_access_token, get_admin_from_token, verify_video_processor_token
+from app.schemas.user import UserClaims
+from app.services.auth import admin_or_video_processor, get_user_claims_from_access_token, get_admin_claims_from_token, verify_video_processor_token
 from app.utils.adventure import create_adventure, delete_adventure
 from app.utils.video import get_new_videos
 
-from app.utils.s3 import delete_s3_folder_contents
-from app.utils.gcs import delete_blob_from_gcs
+from app.utils.async_gcs import delete_blobs_from_gcs
+from app.services.storage_outbox import enqueue_gcs_deletion, enqueue_s3_deletion
 from app.utils.notifications import notify_all_users
+from app.utils.cache import invalidate_adventure_cache
 from app.core.rate_limiter import get_rate_limiter
 from app.core.config import settings
 from app.services.email import send_email
@@ -35,7 +37,7 @@ async def upload_video(
     request: Request,
     video_data: VideoCreate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> VideoResponse:  
     
     try:
@@ -70,8 +72,7 @@ async def upload_video(
     except Exception as e:
         await session.rollback()
         logger.error("Error creating video: {}", str(e), exc_info=True)
-        delete_blob_from_gcs(video_data.thumbnail_url)
-        delete_blob_from_gcs(video_data.video_url)
+        await delete_blobs_from_gcs([video_data.thumbnail_url, video_data.video_url])
         raise InternalServerError() 
     
 
@@ -106,6 +107,7 @@ async def store_metadata(
             session.add(variant_entry)
             
         await session.commit()
+        await invalidate_adventure_cache(video.adventure_id)
         
         # Notify users about new video content
         title = "New Video Available!"
@@ -150,7 +152,7 @@ async def get_videos(
     videos_limit: int = Query(10),
     min_similarity: float = Query(0.1, ge=0, le=1),
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_user_from_access_token)
+    user: UserClaims = Depends(get_user_claims_from_access_token)
 ):
     try:
 
@@ -175,7 +177,7 @@ async def get_videos(
 async def delete_video(
     video_id: UUID, 
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(admin_or_video_processor),
+    _: UserClaims = Depends(admin_or_video_processor),
 ):
     """
     Deletes a video and its associated resources.
@@ -183,7 +185,7 @@ async def delete_video(
     Args:
         video_id (UUID): The unique identifier of the video to delete.
         session (AsyncSession, optional): The database session dependency.
-        _ (User, optional): The authenticated user, must have admin or video processor privileges.
+        _ (UserClaims, optional): The authenticated user, must have admin or video processor privileges.
     Raises:
         ResourceNotFoundError: If the video with the given ID does not exist.
         InternalServerError: If an unexpected error occurs during deletion.
@@ -196,12 +198,12 @@ async def delete_video(
         if not video:
             raise ResourceNotFoundError(message="Video not found")
         
+        # Storage objects are deleted by the storage deletion worker once the transaction below commits.
         if video.hls_url:
             hls_key_prefix = f"hls/{video_id}"
-            delete_s3_folder_contents(settings.AWS_STORAGE_BUCKET_NAME, hls_key_prefix)
+            enqueue_s3_deletion(session, settings.AWS_STORAGE_BUCKET_NAME, hls_key_prefix, is_prefix=True)
             
-        if video.subtitle_url:
-            delete_blob_from_gcs(video.subtitle_url)
+        enqueue_gcs_deletion(session, video.subtitle_url)
         
         await delete_adventure(video.adventure_id, session) # cascade deletes video
         
@@ -224,7 +226,7 @@ async def update_video(
     video_id: UUID,
     video_data: VideoUpdate,
     session: AsyncSession = Depends(get_session),
-    user: User = Depends(get_admin_from_token)  
+    user: UserClaims = Depends(get_admin_claims_from_token)  
 ) -> VideoResponse:
     
     try:    
@@ -240,13 +242,13 @@ async def update_video(
         
         for field, value in video_data.model_dump(exclude_unset=True).items():
             if field == "thumbnail_url":
-                if video.adventure.thumbnail:
-                    delete_blob_from_gcs(video.adventure.thumbnail)
+                enqueue_gcs_deletion(session, video.adventure.thumbnail)
                 setattr(video.adventure, "thumbnail", value)
             else:
                 setattr(video.adventure, field, value)
              
         await session.commit()
+        await invalidate_adventure_cache(video.adventure_id)
         await session.refresh(video, ["adventure"])
         await session.refresh(video.adventure, ["series"])    
         
@@ -0,0 +1,125 @@
+"""Throughput benchmark for signing GCS upload URLs.
+
+Signs a batch of V4 upload URLs one at a time, the way the single-file /gcs-urls endpoints do, and then concurrently
+on the GCS executor, the way /gcs-urls/batch does. Signing is local, so the benchmark uses a throwaway RSA key in place
+of the storage admin service account and needs no network or cloud credentials.
+
+Usage (from the project root):
+    python benchmarks/signed_urls.py
+    python benchmarks/signed_urls.py --urls 5000 --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Read settings from the environment rather than Secret Manager.
+os.environ.setdefault("ENV", "bench")
+
+
+def build_throwaway_credentials():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from google.oauth2 import service_account
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+    return service_account.Credentials.from_service_account_info({
+        "type": "service_account",
+        "project_id": "benchmark",
+        "private_key_id": "benchmark",
+        "private_key": private_key,
+        "client_email": "benchmark@benchmark.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    })
+
+
+def build_targets(count: int) -> list:
+    return [
+        {
+            "filename": f"{index:06d}.mp4",
+            "folder": "videos",
+            "content_type": "video/mp4",
+            "bucket_name": "benchmark-bucket",
+        }
+        for index in range(count)
+    ]
+
+
+def sign_sequentially(targets: list) -> list:
+    from app.utils.gcs import get_gcs_upload_signed_url
+
+    return [get_gcs_upload_signed_url(**target) for target in targets]
+
+
+def sign_batch(targets: list) -> list:
+    from app.utils.async_gcs import get_gcs_upload_signed_urls
+
+    return asyncio.run(get_gcs_upload_signed_urls(targets))
+
+
+def measure(sign, targets: list, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        urls = sign(targets)
+        timings.append(time.perf_counter() - start)
+        assert len(urls) == len(targets)
+
+    seconds = statistics.median(timings)
+    return {
+        "seconds": seconds,
+        "urls_per_second": len(targets) / seconds,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=1000, help="URLs to sign per run.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode. The median is reported.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from app.core.clients import clients
+    from app.utils.async_gcs import GCS_MAX_CONCURRENT_CALLS
+
+    clients.override("gcs_credentials", build_throwaway_credentials())
+    targets = build_targets(args.urls)
+
+    # Sign once before timing so client construction isn't charged to either mode.
+    sign_sequentially(targets[:1])
+
+    results = {
+        "urls": args.urls,
+        "workers": GCS_MAX_CONCURRENT_CALLS,
+        "sequential": measure(sign_sequentially, targets, args.runs),
+        "batch": measure(sign_batch, targets, args.runs),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"Signing {args.urls} upload URLs (median of {args.runs} runs, {GCS_MAX_CONCURRENT_CALLS} GCS workers)")
+    for mode in ("sequential", "batch"):
+        result = results[mode]
+        print(f"  {mode:<12} {result['seconds'] * 1000:>10.1f} ms {result['urls_per_second']:>10.0f} URLs/s")
+    print(f"  speedup      {results['sequential']['seconds'] / results['batch']['seconds']:>10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Startup and import-time benchmark for the FastAPI app.
+
+Every measurement runs in a fresh interpreter so module caches from earlier runs don't hide import cost.
+Secret Manager and the SDK clients in the client registry are stubbed, so the benchmark needs no network
+or cloud credentials. The database is stubbed too unless --with-db is passed.
+
+Usage (from the project root):
+    python benchmarks/startup.py                   # compare against benchmarks/startup_baseline.json
+    python benchmarks/startup.py --write-baseline  # record a new baseline
+    python benchmarks/startup.py --runs 10 --threshold 0.15
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "startup_baseline.json"
+
+# Secrets whose values are parsed rather than used as opaque strings.
+FAKE_SECRET_VALUES = {
+    "REDIS_URL": "redis://localhost:6379/0",
+    "AWS_S3_FILE_OVERWRITE": "False",
+}
+
+# Imported in this order so that each package's shared dependencies are charged to the first module that needs them.
+MODULE_PACKAGES = ["core", "utils", "services", "api/v1/routers"]
+
+
+class FakeSecretPayload:
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class FakeSecretVersion:
+    def __init__(self, data: bytes):
+        self.payload = FakeSecretPayload(data)
+
+
+class FakeSecretManagerClient:
+    def access_secret_version(self, request: dict) -> FakeSecretVersion:
+        secret_name = request["name"].split("/secrets/")[1].split("/")[0]
+        return FakeSecretVersion(FAKE_SECRET_VALUES.get(secret_name, "benchmark").encode())
+
+
+class FakeClient:
+    """Stands in for any SDK client in the registry. Benchmarks must never reach the network."""
+
+    def __getattr__(self, name):
+        raise RuntimeError(f"Cloud SDK call '{name}' attempted during startup benchmark")
+
+
+def stub_cloud_sdks() -> None:
+    from app.core.clients import clients
+
+    clients.override("secret_manager", FakeSecretManagerClient())
+    for name in clients.registered():
+        if name != "secret_manager":
+            clients.override(name, FakeClient())
+
+
+def discover_modules() -> list:
+    import importlib.util
+
+    app_dir = Path(importlib.util.find_spec("app").submodule_search_locations[0])
+    modules = []
+    for package in MODULE_PACKAGES:
+        for path in sorted((app_dir / package).rglob("*.py")):
+            relative = path.relative_to(app_dir).with_suffix("")
+            modules.append(".".join(["app", *relative.parts]).removesuffix(".__init__"))
+    return modules
+
+
+def measure_modules(trace_memory: bool) -> dict:
+    """Import every core, utils, service and router module one by one, recording time and memory per module."""
+    import importlib
+
+    if trace_memory:
+        tracemalloc.start()
+
+    results = {}
+    import app.core.clients  # noqa: F401 - needed to stub SDK clients before anything reads a secret
+    stub_cloud_sdks()
+
+    for module in discover_modules():
+        if module in sys.modules:
+            continue
+        before = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+        start = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        results[module] = {"seconds": elapsed, "error": error}
+        if trace_memory:
+            results[module]["allocated_bytes"] = tracemalloc.get_traced_memory()[0] - before
+        # Factories registered by the module just imported must be stubbed too.
+        stub_cloud_sdks()
+
+    return results
+
+
+async def measure_app(with_db: bool) -> dict:
+    """Time `import main`, the lifespan startup and the first request, as a fresh Cloud Run instance would see them."""
+    import app.core.clients  # noqa: F401
+    stub_cloud_sdks()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    import main
+    import_seconds = time.perf_counter() - start
+    import_allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    stub_cloud_sdks()
+    if not with_db:
+        async def init_db_stub():
+            return None
+        main.init_db = init_db_stub
+
+    from httpx import ASGITransport, AsyncClient
+
+    lifespan_start = time.perf_counter()
+    async with main.app.router.lifespan_context(main.app):
+        lifespan_seconds = time.perf_counter() - lifespan_start
+
+        request_start = time.perf_counter()
+        async with AsyncClient(transport=ASGITransport(app=main.app), base_url="http://benchmark") as client:
+            response = await client.get("/")
+        first_request_seconds = time.perf_counter() - request_start
+
+    return {
+        "import_main_seconds": import_seconds,
+        "import_main_allocated_bytes": import_allocated_bytes,
+        "lifespan_seconds": lifespan_seconds,
+        "first_request_seconds": first_request_seconds,
+        "first_request_status": response.status_code,
+        "time_to_first_request_seconds": import_seconds + lifespan_seconds + first_request_seconds,
+    }
+
+
+def run_worker(mode: str, with_db: bool) -> dict:
+    command = [sys.executable, __file__, "--worker", mode]
+    if with_db:
+        command.append("--with-db")
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+    )
+    process_seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark worker '{mode}' failed:\n{completed.stderr}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_seconds"] = process_seconds
+    return result
+
+
+def summarize(runs: int, with_db: bool) -> dict:
+    app_runs = [run_worker("app", with_db) for _ in range(runs)]
+    module_runs = [run_worker("modules", with_db) for _ in range(runs)]
+    memory_run = run_worker("modules-memory", with_db)
+
+    totals = {
+        key: statistics.median(run[key] for run in app_runs)
+        for key in (
+            "import_main_seconds",
+            "import_main_allocated_bytes",
+            "lifespan_seconds",
+            "first_request_seconds",
+            "time_to_first_request_seconds",
+            "process_seconds",
+        )
+    }
+
+    modules = {}
+    for module, first in module_runs[0]["modules"].items():
+        modules[module] = {
+            "seconds": statistics.median(run["modules"].get(module, first)["seconds"] for run in module_runs),
+            "allocated_bytes": memory_run["modules"].get(module, {}).get("allocated_bytes"),
+            "error": first["error"],
+        }
+
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "totals": totals,
+        "modules": modules,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for key, value in current["totals"].items():
+        previous = baseline.get("totals", {}).get(key)
+        if previous and value > previous * (1 + threshold):
+            regressions.append(f"{key}: {previous:.3f} -> {value:.3f} (+{(value / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_report(summary: dict) -> None:
+    print(f"Startup benchmark (median of {summary['runs']} runs, Python {summary['python']})")
+    for key, value in summary["totals"].items():
+        if key.endswith("_bytes"):
+            print(f"  {key:<32} {value / 1024 / 1024:>10.2f} MiB")
+        else:
+            print(f"  {key:<32} {value * 1000:>10.1f} ms")
+
+    print("\nSlowest modules to import:")
+    ordered = sorted(summary["modules"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for module, result in ordered[:25]:
+        allocated = result["allocated_bytes"]
+        memory = f"{allocated / 1024:>10.0f} KiB" if allocated is not None else f"{'-':>14}"
+        note = f"  [{result['error']}]" if result["error"] else ""
+        print(f"  {module:<48} {result['seconds'] * 1000:>8.1f} ms {memory}{note}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start per measurement.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--write-baseline", action="store_true", help="Store this run as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown over the baseline (0.2 = 20%%).")
+    parser.add_argument("--with-db", action="store_true", help="Run the real init_db in the lifespan hook.")
+    parser.add_argument("--worker", choices=["app", "modules", "modules-memory"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker == "app":
+        print(json.dumps(asyncio.run(measure_app(args.with_db))))
+        return 0
+    if args.worker in ("modules", "modules-memory"):
+        print(json.dumps({"modules": measure_modules(trace_memory=args.worker == "modules-memory")}))
+        return 0
+
+    summary = summarize(args.runs, args.with_db)
+    print_report(summary)
+
+    if args.write_baseline:
+        args.baseline.write_text(json.dumps(summary, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}. Run with --write-baseline to record one.")
+        return 0
+
+    regressions = compare(summary, json.loads(args.baseline.read_text()), args.threshold)
+    if regressions:
+        print("\nStartup regressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\nNo startup regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.core.logging import logger
+
+
+class ClientRegistry:
+    """Process-wide registry of lazily built SDK clients.
+
+    Modules register a factory for each client they need instead of building the client at import time.
+    The client is built on first use, shared by every module that asks for it, and can optionally be
+    built ahead of time with warm_up() during startup.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._clients: Dict[str, Any] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a factory for a client. Registering an existing name replaces the factory but keeps a built client."""
+        with self._locks_guard:
+            self._factories[name] = factory
+            self._build_locks.setdefault(name, threading.Lock())
+
+    def get(self, name: str) -> Any:
+        """Get a client, building it on first use.
+
+        Args:
+            name (str): Name the client's factory was registered with.
+
+        Raises:
+            KeyError: If no factory is registered under name.
+
+        Returns:
+            Any: The shared client instance.
+        """
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        if name not in self._factories:
+            raise KeyError(f"No client registered as '{name}'")
+
+        with self._build_locks[name]:
+            client = self._clients.get(name)
+            if client is None:
+                start = time.perf_counter()
+                client = self._factories[name]()
+                self._clients[name] = client
+                logger.info(f"Built {name} client in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return client
+
+    def is_built(self, name: str) -> bool:
+        return name in self._clients
+
+    def registered(self) -> list:
+        return list(self._factories)
+
+    def override(self, name: str, client: Any) -> None:
+        """Use client in place of whatever the factory would build. Intended for tests and benchmarks."""
+        with self._locks_guard:
+            self._build_locks.setdefault(name, threading.Lock())
+            self._factories.setdefault(name, lambda: client)
+        self._clients[name] = client
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Forget one built client, or all of them, so the next get() builds a fresh instance."""
+        if name is None:
+            self._clients.clear()
+        else:
+            self._clients.pop(name, None)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Build clients ahead of the first request that needs them.
+
+        Args:
+            names (Optional[Iterable[str]], optional): Clients to build. Defaults to every registered client.
+
+        Returns:
+            Dict[str, float]: Seconds each client took to build, keyed by name. Clients that fail to build are
+            logged and left to be built on first use.
+        """
+        timings = {}
+        for name in list(names) if names is not None else self.registered():
+            if self.is_built(name):
+                continue
+            start = time.perf_counter()
+            try:
+                self.get(name)
+                timings[name] = time.perf_counter() - start
+            except Exception as e:
+                logger.error(f"Error warming up {name} client: {e}")
+        return timings
+
+
+# Shared by every module that needs an SDK client.
+clients = ClientRegistry()
@@ -1,134 +1,160 @@
+from contextvars import ContextVar
 import os
+import time
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
-from google.cloud import secretmanager
 from app.core.logging import logger
+from app.core.secret_providers import get_secret_provider
+from app.core.secret_store import SecretStore
 
-client = secretmanager.SecretManagerServiceClient()
 
-def get_secret(secret_name: str, version: str = "latest") -> str:
-    """Retrieves a secret from Secret Manager."""
-    project_id = os.environ.get("GCP_PROJECT_NO") 
-    name = f"projects/{project_id}/secrets/{secret_name}/versions/{version}"
+SECRET_CACHE_TTL_SECONDS = float(os.environ.get("SECRET_CACHE_TTL_SECONDS", 3600))
+SECRET_PREFETCH_WORKERS = int(os.environ.get("SECRET_PREFETCH_WORKERS", 16))
+
+# Google Secret Manager in deployed environments, a local file or env vars for ENV=local/test/bench.
+secret_provider = get_secret_provider(os.environ.get("ENV", "dev"))
+
+
+def get_secret(secret_name: str) -> str:
+    """Retrieves a secret from the configured secret provider."""
+    return secret_provider.get(secret_name)
+
+
+# Secrets are resolved once and served from memory, refreshing in the background before they expire.
+secret_store = SecretStore(
+    loader=get_secret,
+    ttl_seconds=SECRET_CACHE_TTL_SECONDS
+)
+
+# Set while Settings.known_secret_names evaluates the properties, to collect the secret names they read.
+_read_secret_names: ContextVar[Optional[List[str]]] = ContextVar("read_secret_names", default=None)
+
+
+def read_secret(secret_name: str) -> Optional[str]:
+    """Read a secret from secret_store. Every secret-backed Settings property reads through here, so the properties
+    themselves are the list of secrets to prefetch. While the names are being collected, returns None instead."""
+    names = _read_secret_names.get()
+    if names is not None:
+        names.append(secret_name)
+        return None
+    return secret_store.get(secret_name)
 
-    try:
-        response = client.access_secret_version(request={"name": name})
-        return response.payload.data.decode("UTF-8") # Decode from bytes to string
-    except Exception as e:
-        logger.error(f"Error accessing secret: {e}")
-        return None  
 
 class Settings(BaseSettings):
     
     ENV: str = os.environ.get("ENV", "dev")
     
+    # Comma-separated client names to build during startup (e.g. "s3,ses,gcs_credentials"), or "all".
+    WARM_UP_CLIENTS: str = ""
+    
     @property
     def GCP_PROJECT_ID(self):
-        return get_secret("GCP_PROJECT_ID")
+        return read_secret("GCP_PROJECT_ID")
     
     @property
     def SECRET_KEY(self):
-        return get_secret("SECRET_KEY")
+        return read_secret("SECRET_KEY")
 
     @property
     def DB_USER(self) -> str:
-        return get_secret("DB_USER")
+        return read_secret("DB_USER")
     
     @property
     def DB_PASSWORD(self) -> str:
-        return get_secret("DB_PASSWORD")
+        return read_secret("DB_PASSWORD")
     
     @property
     def DB_NAME(self) -> str:
-        return get_secret("DB_NAME")
+        return read_secret("DB_NAME")
     
     @property
     def INSTANCE_CONNECTION_NAME(self) -> str:
-        return get_secret(f"{self.ENV.upper()}_INSTANCE_CONNECTION_NAME")
+        return read_secret(f"{self.ENV.upper()}_INSTANCE_CONNECTION_NAME")
     
     @property
     def EMAIL_USER_AWS_ACCESS_KEY_ID(self):
-        return get_secret("EMAIL_USER_AWS_ACCESS_KEY_ID")
+        return read_secret("EMAIL_USER_AWS_ACCESS_KEY_ID")
 
     @property
     def EMAIL_USER_AWS_SECRET_ACCESS_KEY(self):
-        return get_secret("EMAIL_USER_AWS_SECRET_ACCESS_KEY")
+        return read_secret("EMAIL_USER_AWS_SECRET_ACCESS_KEY")
     
     @property
     def ROOT_USER_AWS_ACCESS_KEY_ID(self):
-        return get_secret("ROOT_USER_AWS_ACCESS_KEY_ID")
+        return read_secret("ROOT_USER_AWS_ACCESS_KEY_ID")
 
     @property
     def ROOT_USER_AWS_SECRET_ACCESS_KEY(self):
-        return get_secret("ROOT_USER_AWS_SECRET_ACCESS_KEY")
+        return read_secret("ROOT_USER_AWS_SECRET_ACCESS_KEY")
     
     @property
     def S3_USER_SECRET_ACCESS_KEY(self):
-        return get_secret("S3_USER_SECRET_ACCESS_KEY")
+        return read_secret("S3_USER_SECRET_ACCESS_KEY")
     
     @property
     def S3_USER_SECRET_ACCESS_KEY_ID(self):
-        return get_secret("S3_USER_SECRET_ACCESS_KEY_ID")
+        return read_secret("S3_USER_SECRET_ACCESS_KEY_ID")
 
     @property
     def AWS_STORAGE_BUCKET_NAME(self):
-        return get_secret(f"AWS_STORAGE_BUCKET_NAME_{self.ENV.upper()}")
+        return read_secret(f"AWS_STORAGE_BUCKET_NAME_{self.ENV.upper()}")
     
     @property
     def AWS_S3_REGION_NAME(self):
-        return get_secret("AWS_S3_REGION_NAME")
+        return read_secret("AWS_S3_REGION_NAME")
 
     @property
     def AWS_S3_SIGNATURE_VERSION(self):
-        return get_secret("AWS_S3_SIGNATURE_VERSION")
+        return read_secret("AWS_S3_SIGNATURE_VERSION")
 
     @property
     def AWS_S3_FILE_OVERWRITE(self):
-        value = get_secret("AWS_S3_FILE_OVERWRITE")
+        value = read_secret("AWS_S3_FILE_OVERWRITE")
         return value == "True" if value is not None else False 
 
     @property
     def AWS_DEFAULT_ACL(self):
-        return get_secret("AWS_DEFAULT_ACL")
+        return read_secret("AWS_DEFAULT_ACL")
 
     @property
     def FROM_EMAIL(self):
-        return get_secret("FROM_EMAIL")
+        return read_secret("FROM_EMAIL")
 
     @property
     def GEMINI_KEY(self):
-        return get_secret("GEMINI_KEY")
+        return read_secret("GEMINI_KEY")
     
     @property
     def ANDROID_GOOGLE_CLIENT_ID(self):
-        return get_secret("ANDROID_GOOGLE_CLIENT_ID")
+        return read_secret("ANDROID_GOOGLE_CLIENT_ID")
     
     @property
     def IOS_GOOGLE_CLIENT_ID(self):
-        return get_secret("IOS_GOOGLE_CLIENT_ID")
+        return read_secret("IOS_GOOGLE_CLIENT_ID")
     
     @property
     def GCS_TEMP_FILES_BUCKET(self):
-        return get_secret("GCS_TEMP_FILES_BUCKET")
+        return read_secret("GCS_TEMP_FILES_BUCKET")
     
     @property
     def GCS_PERMANENT_FILES_BUCKET(self):
-        return get_secret(f"GCS_PERMANENT_FILES_BUCKET_{self.ENV.upper()}")
+        return read_secret(f"GCS_PERMANENT_FILES_BUCKET_{self.ENV.upper()}")
     
     @property
     def STORAGE_ADMIN_SERVICE_ACCOUNT_KEY(self):
-        return get_secret("STORAGE_ADMIN_SERVICE_ACCOUNT_KEY")
+        return read_secret("STORAGE_ADMIN_SERVICE_ACCOUNT_KEY")
     
     @property
     def FIREBASE_SERVICE_ACCOUNT_KEY(self):
-        return get_secret("FIREBASE_SERVICE_ACCOUNT_KEY")
+        return read_secret("FIREBASE_SERVICE_ACCOUNT_KEY")
     
     @property
     def VIDEO_PROCESSOR_TOKEN(self):
-        return get_secret("VIDEO_PROCESSOR_TOKEN")
+        return read_secret("VIDEO_PROCESSOR_TOKEN")
     
     @property
     def EBOOK_PROCESSOR_TOKEN(self):
-        return get_secret("EBOOK_PROCESSOR_TOKEN")
+        return read_secret("EBOOK_PROCESSOR_TOKEN")
     
     @property
     def VIDEO_PROCESSING_TOPIC_NAME(self):
@@ -136,11 +162,53 @@ class Settings(BaseSettings):
     
     @property
     def JOBS_SERVICE_ACCOUNT_KEY(self):
-        return get_secret("JOBS_SERVICE_ACCOUNT_KEY")
+        return read_secret("JOBS_SERVICE_ACCOUNT_KEY")
+    
+    @property
+    def REDIS_URL(self):
+        return read_secret("REDIS_URL")
+
+    def known_secret_names(self) -> List[str]:
+        """Names of every secret the Settings properties read in the current ENV, found by evaluating each property
+        without fetching anything."""
+        names = []
+        token = _read_secret_names.set(names)
+        try:
+            for attribute in vars(type(self)).values():
+                if isinstance(attribute, property):
+                    attribute.fget(self)
+        finally:
+            _read_secret_names.reset(token)
+        return list(dict.fromkeys(names))
 
     # Logging
     LOG_LEVEL: str = "INFO"
 
 
 # Initialize settings globally
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+
+def prefetch_secrets() -> Dict[str, float]:
+    """Fetch every known secret concurrently so that no request (or lazily built client) waits on Secret Manager.
+    Logs how long each secret took and how much time the concurrent fetch saved over fetching them one by one.
+
+    Returns:
+        Dict[str, float]: Seconds each secret took to fetch, keyed by secret name.
+    """
+    start = time.perf_counter()
+    timings = secret_store.prefetch(
+        settings.known_secret_names(),
+        max_workers=SECRET_PREFETCH_WORKERS
+    )
+    elapsed = time.perf_counter() - start
+
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        logger.info(f"Prefetched secret {name} in {seconds * 1000:.1f} ms")
+
+    sequential = sum(timings.values())
+    logger.info(
+        f"Prefetched {len(timings)} secrets in {elapsed * 1000:.1f} ms "
+        f"(sequential fetch would take ~{sequential * 1000:.1f} ms, saved ~{(sequential - elapsed) * 1000:.1f} ms)"
+    )
+    return timings
\ No newline at end of file
@@ -15,6 +15,7 @@ class ErrorCode(Enum):
     FIELD_TOO_LONG = 'FIELD_TOO_LONG'
     VALUE_OUT_OF_RANGE = 'VALUE_OUT_OF_RANGE'
     UNSUPPORTED_FILE_TYPE = 'UNSUPPORTED_FILE_TYPE'
+    FILE_TOO_LARGE = 'FILE_TOO_LARGE'
     CONTENT_NOT_ALLOWED = 'CONTENT_NOT_ALLOWED'
 
     # BUSINESS LOGIC ERROR CODES (STATUS CODE: 422)
@@ -130,4 +131,21 @@ class InternalServerError(HTTPException):
                 "error_code": ErrorCode.INTERNAL_SERVER_ERROR.value,
                 "message": message,
             }
-        )
\ No newline at end of file
+        )
+        
+        
+class TooManyRequestsError(HTTPException):
+    def __init__(
+        self,
+        message: str = "Unable to process your request at this time. Please try again later.",
+        retry_after_seconds: Optional[int] = None
+    ):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "status": False,
+                "error_code": ErrorCode.TOO_MANY_REQUESTS.value,
+                "message": message,
+            },
+            headers={"Retry-After": str(retry_after_seconds)} if retry_after_seconds else None
+        )
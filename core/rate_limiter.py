@@ -1,53 +1,316 @@
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.errors import RateLimitExceeded
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
-from app.core.exceptions import ErrorCode
-
-# Initialize rate limiter
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["100/minute"],  # Default rate limit
-    storage_uri="memory://"  # Store rate limits in memory (you can change this to Redis for distributed systems)
-)
-
-def get_rate_limiter() -> Limiter:
+import asyncio
+from collections import defaultdict
+import functools
+import inspect
+import math
+import os
+import re
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import FastAPI, Request
+
+from app.core.exceptions import TooManyRequestsError
+from app.core.logging import logger
+from app.core.redis_pool import get_redis_client
+from app.core.security import decode_jwt
+from app.utils.ttl_cache import TTLCache
+
+
+RATE_LIMIT_KEY_PREFIX = "rate-limit"
+# How often tokens consumed from local buckets are added to the Redis counters. Limits enforced with local buckets
+# can be exceeded by roughly what all instances admit in this interval.
+RATE_LIMIT_SYNC_INTERVAL_SECONDS = float(os.environ.get("RATE_LIMIT_SYNC_INTERVAL_SECONDS", 0.25))
+RATE_LIMIT_LOCAL_BUCKETS_MAXSIZE = int(os.environ.get("RATE_LIMIT_LOCAL_BUCKETS_MAXSIZE", 10000))
+# Number of X-Forwarded-For entries appended by proxies we run behind: 1 for Cloud Run, 2 with a load balancer in front.
+# 0 keys on the peer address instead.
+RATE_LIMIT_TRUSTED_PROXY_HOPS = int(os.environ.get("RATE_LIMIT_TRUSTED_PROXY_HOPS", 1))
+
+WINDOW_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+# Sliding window counter: the previous window's count is weighted by how much of it still overlaps the sliding window.
+# Reads, checks and increments in one round trip, atomically, so concurrent requests on different instances can't
+# both take the last slot.
+# KEYS: current window counter, previous window counter. ARGV: limit, window length (ms), time into current window (ms).
+# Returns {allowed (1 or 0), remaining, retry after (ms)}.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local elapsed_ms = tonumber(ARGV[3])
+
+local current = tonumber(redis.call("GET", KEYS[1]) or "0")
+local previous = tonumber(redis.call("GET", KEYS[2]) or "0")
+local weighted = previous * (window_ms - elapsed_ms) / window_ms + current
+
+if weighted + 1 > limit then
+    return {0, 0, window_ms - elapsed_ms}
+end
+
+redis.call("INCR", KEYS[1])
+redis.call("PEXPIRE", KEYS[1], window_ms * 2)
+return {1, math.floor(limit - weighted - 1), 0}
+"""
+
+
+def parse_limit(limit: str) -> Tuple[int, int]:
+    """Parse a limit such as "3/minute" or "100/hour".
+
+    Returns:
+        Tuple[int, int]: Requests allowed and window length in seconds.
+
+    Raises:
+        ValueError: If limit isn't in the form "<count>/<second|minute|hour|day>".
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*", limit)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {limit}")
+    return int(match.group(1)), WINDOW_SECONDS[match.group(2)]
+
+
+def get_remote_address(request: Request) -> str:
+    """Get the client's IP address from X-Forwarded-For, falling back to the peer address.
+
+    Clients can put anything in X-Forwarded-For, so only the entries appended by our own proxies are trusted: the
+    address RATE_LIMIT_TRUSTED_PROXY_HOPS entries from the right. Cloud Run's front end appends the address it received
+    the request from, which is the client's, so that's the rightmost entry. The peer address itself is one of a few
+    proxy addresses shared by every client.
+    """
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    if RATE_LIMIT_TRUSTED_PROXY_HOPS > 0 and hops:
+        return hops[-min(RATE_LIMIT_TRUSTED_PROXY_HOPS, len(hops))]
+    return request.client.host if request.client else "127.0.0.1"
+
+
+def get_user_or_remote_address(request: Request) -> str:
+    """Key requests by the user ID in their access token, or by IP address if there's no valid token.
+
+    Only the token's signature and expiry are checked. Whether the user still exists is left to the endpoint.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = decode_jwt(token)
+            if payload and payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except Exception:
+            pass
+    return f"ip:{get_remote_address(request)}"
+
+
+class LocalBucket:
+    """Token bucket of one key on this instance. Refills at limit / window tokens per second, up to limit."""
+    __slots__ = ("tokens", "updated_at", "blocked_until")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """Rate limiter whose counters live in Redis, so limits hold across every instance rather than per instance.
+
+    Limits are checked against Redis on every request by default. With local_buckets=True, requests are admitted from
+    in-memory token buckets instead, and the tokens they consume are added to the same Redis counters in batches by
+    run_sync. Buckets of keys that are over the limit cluster-wide are emptied until the window rolls over.
+
+    If Redis can't be reached, requests are let through and the error is logged.
+    """
+
+    def __init__(self, key_func: Callable[[Request], str] = get_remote_address):
+        self.key_func = key_func
+        self.enabled = True
+        self._script = None
+        self._script_client = None
+        # (scope, key, limit, window seconds) -> LocalBucket
+        self.local_buckets = TTLCache(maxsize=RATE_LIMIT_LOCAL_BUCKETS_MAXSIZE)
+        # Tokens consumed from local buckets since the last sync, by bucket.
+        self.pending_hits: Dict[tuple, int] = defaultdict(int)
+
+    def get_script(self):
+        client = get_redis_client()
+        if self._script is None or self._script_client is not client:
+            # Sent with EVALSHA, and only re-sent in full if Redis doesn't have it cached.
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def hit(self, scope: str, key: str, limit: int, window_seconds: int) -> Tuple[bool, int, int]:
+        """Count a request against a limit.
+
+        Args:
+            scope (str): What's being limited, e.g. the endpoint.
+            key (str): Who's being limited, e.g. the client's IP address.
+            limit (int): Requests allowed per window.
+            window_seconds (int): Window length in seconds.
+
+        Returns:
+            Tuple[bool, int, int]: Whether the request is allowed, requests left in the window, and seconds to wait
+                before retrying if it isn't allowed.
+        """
+        window_ms = window_seconds * 1000
+        now_ms = int(time.time() * 1000)
+        window = now_ms // window_ms
+        base_key = f"{RATE_LIMIT_KEY_PREFIX}:{scope}:{key}"
+
+        allowed, remaining, retry_after_ms = await self.get_script()(
+            keys=[f"{base_key}:{window}", f"{base_key}:{window - 1}"],
+            args=[limit, window_ms, now_ms % window_ms]
+        )
+        return bool(allowed), int(remaining), math.ceil(int(retry_after_ms) / 1000)
+
+    def hit_local(self, scope: str, key: str, limit: int, window_seconds: int) -> Tuple[bool, int]:
+        """Take a token from this instance's bucket for key, without a network call.
+
+        Returns:
+            Tuple[bool, int]: Whether the request is allowed, and seconds to wait before retrying if it isn't.
+        """
+        now = time.monotonic()
+        bucket_key = (scope, key, limit, window_seconds)
+        bucket = self.local_buckets.get(bucket_key)
+        if bucket is None:
+            bucket = LocalBucket(tokens=limit, updated_at=now)
+        self.local_buckets.set(bucket_key, bucket, ttl_seconds=window_seconds * 2)
+
+        if bucket.blocked_until > now:
+            return False, math.ceil(bucket.blocked_until - now)
+
+        bucket.tokens = min(limit, bucket.tokens + (now - bucket.updated_at) * limit / window_seconds)
+        bucket.updated_at = now
+        if bucket.tokens < 1:
+            return False, math.ceil((1 - bucket.tokens) * window_seconds / limit)
+
+        bucket.tokens -= 1
+        self.pending_hits[bucket_key] += 1
+        return True, 0
+
+    async def sync(self) -> None:
+        """Add tokens consumed from local buckets to the Redis counters in one pipelined round trip, then cap each
+        bucket at what's left of its limit cluster-wide."""
+        if not self.pending_hits:
+            return
+
+        pending_hits, self.pending_hits = self.pending_hits, defaultdict(int)
+        now_ms = int(time.time() * 1000)
+
+        try:
+            async with get_redis_client().pipeline(transaction=False) as pipe:
+                for (scope, key, _, window_seconds), hits in pending_hits.items():
+                    window_ms = window_seconds * 1000
+                    window = now_ms // window_ms
+                    base_key = f"{RATE_LIMIT_KEY_PREFIX}:{scope}:{key}"
+                    pipe.incrby(f"{base_key}:{window}", hits)
+                    pipe.pexpire(f"{base_key}:{window}", window_ms * 2)
+                    pipe.get(f"{base_key}:{window - 1}")
+                results = await pipe.execute()
+
+        except Exception as e:
+            logger.error("Error syncing rate limit counters: {}", str(e), exc_info=True)
+            # Counted on the next sync instead.
+            for bucket_key, hits in pending_hits.items():
+                self.pending_hits[bucket_key] += hits
+            return
+
+        for index, (bucket_key, _) in enumerate(pending_hits.items()):
+            _, _, limit, window_seconds = bucket_key
+            window_ms = window_seconds * 1000
+            elapsed_ms = now_ms % window_ms
+            current, _, previous = results[index * 3:index * 3 + 3]
+            weighted = int(previous or 0) * (window_ms - elapsed_ms) / window_ms + int(current)
+
+            bucket = self.local_buckets.get(bucket_key)
+            if bucket is None:
+                continue
+            if weighted >= limit:
+                bucket.tokens = 0
+                bucket.blocked_until = time.monotonic() + (window_ms - elapsed_ms) / 1000
+            else:
+                bucket.tokens = min(bucket.tokens, limit - weighted)
+
+    async def run_sync(self, stop_event: asyncio.Event) -> None:
+        """Sync local buckets with Redis every RATE_LIMIT_SYNC_INTERVAL_SECONDS until stop_event is set. Runs as a
+        background task started in the app's lifespan."""
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=RATE_LIMIT_SYNC_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            await self.sync()
+
+    def limit(
+        self,
+        limit_value: str,
+        key_func: Optional[Callable[[Request], str]] = None,
+        local_buckets: bool = False
+    ) -> Callable:
+        """Limit how often an endpoint can be called, e.g. @limiter.limit("3/minute"). Place it below @router.<method>.
+
+        The endpoint must take a `request: Request` parameter.
+
+        Args:
+            limit_value (str): Requests allowed per window, e.g. "3/minute".
+            key_func (Optional[Callable[[Request], str]], optional): Who's being limited. Defaults to the limiter's
+                key_func, the client's IP address.
+            local_buckets (bool, optional): Admit requests from this instance's token buckets and sync with Redis in
+                the background, for hot endpoints where a Redis round trip per request costs too much. The limit is
+                then enforced approximately. Defaults to False.
+
+        Raises:
+            TooManyRequestsError: From the endpoint, once the limit is reached. Carries a Retry-After header.
+        """
+        limit, window_seconds = parse_limit(limit_value)
+        key_func = key_func or self.key_func
+
+        def decorator(func: Callable) -> Callable:
+            request_param = next(
+                (name for name, param in inspect.signature(func).parameters.items() if param.annotation is Request),
+                None
+            )
+            if request_param is None:
+                raise TypeError(f"{func.__name__} needs a `request: Request` parameter to be rate limited")
+
+            scope = f"{func.__module__}.{func.__name__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get(request_param)
+                if self.enabled and request is not None and local_buckets:
+                    allowed, retry_after_seconds = self.hit_local(scope, key_func(request), limit, window_seconds)
+                    if not allowed:
+                        raise TooManyRequestsError(retry_after_seconds=retry_after_seconds)
+
+                elif self.enabled and request is not None:
+                    try:
+                        allowed, _, retry_after_seconds = await self.hit(scope, key_func(request), limit, window_seconds)
+                    except Exception as e:
+                        logger.error("Rate limiter unavailable, allowing request: {}", str(e), exc_info=True)
+                        allowed = True
+
+                    if not allowed:
+                        raise TooManyRequestsError(retry_after_seconds=retry_after_seconds)
+
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
     """Get the rate limiter instance."""
     return limiter
 
-async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
-    """Custom handler for rate limit exceeded errors."""
-    return JSONResponse(
-        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        content={
-            "status": False,
-            "error_code": ErrorCode.TOO_MANY_REQUESTS.value,
-            "message": f"Unable to process your request at this time. Please try again later.",
-            "data": None
-        }
-    )
 
 def init_rate_limiter(app: FastAPI):
-    """Initialize rate limiting for the FastAPI application."""
-    # Enable rate limiting
+    """Expose the rate limiter on app.state. Counters are kept in the Redis instance set up in the app's lifespan."""
     limiter.enabled = True
-    
-    # Add rate limiting middleware
     app.state.limiter = limiter
-    app.add_middleware(SlowAPIMiddleware)
-    
-    # Register the rate limit exceeded handler
-    app.add_exception_handler(429, rate_limit_exceeded_handler)
-    
-    # Apply rate limiting to all routes by default
-    @app.middleware("http")
-    async def rate_limit_middleware(request: Request, call_next):
-        # Skip rate limiting for certain paths if needed
-        if request.url.path.startswith("/docs") or request.url.path.startswith("/redoc"):
-            return await call_next(request)
-            
-        # Apply rate limiting to all other routes
-        response = await call_next(request)
-        return response
\ No newline at end of file
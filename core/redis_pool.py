@@ -0,0 +1,105 @@
+import os
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from redis import asyncio as aioredis
+
+from app.core.logging import logger
+
+
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
+# Seconds a request waits for a free connection when all REDIS_MAX_CONNECTIONS are in use.
+REDIS_POOL_TIMEOUT_SECONDS = float(os.environ.get("REDIS_POOL_TIMEOUT_SECONDS", 5))
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.environ.get("REDIS_SOCKET_TIMEOUT_SECONDS", 5))
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = int(os.environ.get("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", 30))
+
+# Set by init_redis during startup. Code that runs outside a request uses it through get_redis_client().
+redis_client: Optional[aioredis.Redis] = None
+
+
+def create_redis_client(redis_url: str) -> aioredis.Redis:
+    """Build a Redis client on a bounded, health-checked connection pool.
+
+    Connections idle for longer than REDIS_HEALTH_CHECK_INTERVAL_SECONDS are pinged before reuse, so a connection
+    dropped by Memorystore or a NAT is replaced instead of failing the command sent on it.
+    """
+    pool = aioredis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_keepalive=True,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        retry_on_timeout=True,
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def init_redis(app: FastAPI, redis_url: str) -> aioredis.Redis:
+    """Create the process-wide Redis client and store it on app.state.redis. Called once from the lifespan hook."""
+    global redis_client
+
+    redis_client = create_redis_client(redis_url)
+    app.state.redis = redis_client
+    return redis_client
+
+
+async def close_redis(app: FastAPI) -> None:
+    """Close the Redis client and every connection in its pool. Called when the app shuts down."""
+    global redis_client
+
+    client = getattr(app.state, "redis", None)
+    if client is not None:
+        await client.aclose()
+    app.state.redis = None
+    redis_client = None
+
+
+def get_redis_client() -> aioredis.Redis:
+    """Shared Redis client for code that runs outside a request, e.g. cache invalidation and background tasks.
+
+    Raises:
+        RuntimeError: If called before init_redis.
+    """
+    if redis_client is None:
+        raise RuntimeError("Redis client used before init_redis was called")
+    return redis_client
+
+
+def get_redis(request: Request) -> aioredis.Redis:
+    """Dependency that returns the shared Redis client, e.g. `redis: Redis = Depends(get_redis)`."""
+    return request.app.state.redis
+
+
+def get_redis_pool_stats(client: aioredis.Redis) -> dict:
+    """Connection pool usage of a Redis client.
+
+    Returns:
+        dict: Contains the keys "max_connections", "in_use_connections" and "idle_connections".
+    """
+    pool = client.connection_pool
+    return {
+        "max_connections": pool.max_connections,
+        "in_use_connections": len(getattr(pool, "_in_use_connections", ())),
+        "idle_connections": len(getattr(pool, "_available_connections", ())),
+    }
+
+
+async def check_redis_health(client: aioredis.Redis) -> dict:
+    """Ping Redis and report the round trip time alongside the pool's usage.
+
+    Returns:
+        dict: Contains the keys "ok", "ping_ms" and "pool". "error" is included if the ping failed.
+    """
+    start = time.perf_counter()
+    try:
+        await client.ping()
+        health = {"ok": True, "ping_ms": round((time.perf_counter() - start) * 1000, 2)}
+    except Exception as e:
+        logger.error("Redis health check failed: {}", str(e), exc_info=True)
+        health = {"ok": False, "ping_ms": None, "error": str(e)}
+
+    health["pool"] = get_redis_pool_stats(client)
+    return health
@@ -0,0 +1,127 @@
+from abc import ABC, abstractmethod
+import json
+import os
+import tomllib
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.clients import clients
+from app.core.logging import logger
+
+
+# ENV values that read secrets from the local machine instead of Google Secret Manager.
+OFFLINE_ENVS = ("local", "test", "bench")
+
+
+class SecretProvider(ABC):
+    """Resolves a secret name to its value. Returns None when the secret can't be resolved."""
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, secret_name: str) -> Optional[str]:
+        ...
+
+
+def build_secret_manager_client():
+    from google.cloud import secretmanager
+    return secretmanager.SecretManagerServiceClient()
+
+
+clients.register("secret_manager", build_secret_manager_client)
+
+
+class SecretManagerProvider(SecretProvider):
+    """Reads secrets from Google Secret Manager in the project numbered GCP_PROJECT_NO."""
+
+    name = "secret_manager"
+
+    def __init__(self, project_id: Optional[str] = None, version: str = "latest"):
+        self.project_id = project_id or os.environ.get("GCP_PROJECT_NO")
+        self.version = version
+
+    def get(self, secret_name: str) -> Optional[str]:
+        name = f"projects/{self.project_id}/secrets/{secret_name}/versions/{self.version}"
+
+        try:
+            response = clients.get("secret_manager").access_secret_version(request={"name": name})
+            return response.payload.data.decode("UTF-8") # Decode from bytes to string
+        except Exception as e:
+            logger.error(f"Error accessing secret: {e}")
+            return None
+
+
+class EnvSecretProvider(SecretProvider):
+    """Reads secrets from environment variables of the same name."""
+
+    name = "env"
+
+    def get(self, secret_name: str) -> Optional[str]:
+        return os.environ.get(secret_name)
+
+
+class FileSecretProvider(SecretProvider):
+    """Reads secrets from a local JSON or TOML file mapping secret names to values.
+
+    Values that aren't strings (e.g. a service account key stored as a JSON object) are returned JSON-encoded,
+    which is what Secret Manager would hand back for the same secret. Environment variables of the same name
+    take precedence, so a single value can be overridden without editing the file.
+    """
+
+    name = "file"
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._secrets = self._read(self.path)
+
+    @staticmethod
+    def _read(path: Path) -> Dict[str, str]:
+        with open(path, "rb") as f:
+            if path.suffix == ".toml":
+                data = tomllib.load(f)
+            else:
+                data = json.load(f)
+
+        return {
+            key: value if isinstance(value, str) else json.dumps(value)
+            for key, value in data.items()
+        }
+
+    def get(self, secret_name: str) -> Optional[str]:
+        return os.environ.get(secret_name, self._secrets.get(secret_name))
+
+
+def get_secret_provider(env: str) -> SecretProvider:
+    """Choose where secrets are read from.
+
+    SECRET_BACKEND ("secret_manager", "env" or "file") selects a backend explicitly. Otherwise, ENV values in
+    OFFLINE_ENVS read from the file at SECRETS_FILE if it is set, or from environment variables if it isn't,
+    and every other ENV reads from Google Secret Manager.
+
+    Args:
+        env (str): Value of the ENV setting, e.g. "dev", "prod" or "local".
+
+    Returns:
+        SecretProvider: Provider for the Settings secret store.
+    """
+    backend = os.environ.get("SECRET_BACKEND")
+    secrets_file = os.environ.get("SECRETS_FILE")
+
+    if backend is None:
+        if env.lower() in OFFLINE_ENVS:
+            backend = FileSecretProvider.name if secrets_file else EnvSecretProvider.name
+        else:
+            backend = SecretManagerProvider.name
+
+    if backend == FileSecretProvider.name:
+        if not secrets_file:
+            raise ValueError("SECRETS_FILE must be set to use the file secret backend")
+        return FileSecretProvider(secrets_file)
+
+    if backend == EnvSecretProvider.name:
+        return EnvSecretProvider()
+
+    if backend == SecretManagerProvider.name:
+        return SecretManagerProvider()
+
+    raise ValueError(f"Unknown secret backend: {backend}")
@@ -0,0 +1,174 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+
+from app.core.logging import logger
+
+
+class CachedSecret:
+    __slots__ = ("value", "expires_at", "refresh_at")
+
+    def __init__(self, value: str, expires_at: float, refresh_at: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.refresh_at = refresh_at
+
+
+class SecretStore:
+    """In-process cache in front of a secret loader such as Google Secret Manager.
+
+    Each secret is resolved once and kept in memory for ttl_seconds. Once an entry is older than
+    refresh_ahead_ratio * ttl_seconds, the next read still returns the cached value but triggers a
+    background refresh, so hot request paths never wait on the network. If a refresh fails, the
+    last known value keeps being served until the loader succeeds again.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Optional[str]],
+        ttl_seconds: float = 3600,
+        refresh_ahead_ratio: float = 0.8,
+    ):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = ttl_seconds * refresh_ahead_ratio
+        self._entries: Dict[str, CachedSecret] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._refreshing: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def get(self, name: str) -> Optional[str]:
+        """Get a secret, loading it on first access and refreshing it in the background before it expires.
+
+        Args:
+            name (str): Secret name.
+
+        Returns:
+            Optional[str]: Secret value or None if the loader couldn't resolve it.
+        """
+        entry = self._entries.get(name)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.expires_at:
+            self.hits += 1
+            if now >= entry.refresh_at:
+                self._schedule_refresh(name)
+            return entry.value
+
+        self.misses += 1
+        return self._load(name)
+
+    def set(self, name: str, value: str) -> None:
+        """Store a secret value that was resolved elsewhere, e.g. by a bulk prefetch."""
+        now = time.monotonic()
+        self._entries[name] = CachedSecret(
+            value=value,
+            expires_at=now + self.ttl_seconds,
+            refresh_at=now + self.refresh_ahead_seconds,
+        )
+
+    def prefetch(
+        self,
+        names: Iterable[str],
+        max_workers: int = 16
+    ) -> Dict[str, float]:
+        """Resolve many secrets concurrently on a thread pool and cache them.
+
+        Args:
+            names (Iterable[str]): Secret names to resolve. Names that are already cached are skipped.
+            max_workers (int, optional): Maximum number of concurrent loader calls. Defaults to 16.
+
+        Returns:
+            Dict[str, float]: Seconds each loader call took, keyed by secret name.
+        """
+        now = time.monotonic()
+        pending = [
+            name for name in dict.fromkeys(names)
+            if name not in self._entries or now >= self._entries[name].expires_at
+        ]
+        if not pending:
+            return {}
+
+        def timed_load(name: str) -> float:
+            start = time.perf_counter()
+            self._load(name)
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            thread_name_prefix="secret-prefetch"
+        ) as executor:
+            return dict(zip(pending, executor.map(timed_load, pending)))
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one cached secret, or every cached secret if no name is given."""
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _get_load_lock(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._load_locks.get(name)
+            if lock is None:
+                lock = self._load_locks[name] = threading.Lock()
+            return lock
+
+    def _load(self, name: str) -> Optional[str]:
+        # Concurrent misses for the same secret wait for a single loader call.
+        with self._get_load_lock(name):
+            entry = self._entries.get(name)
+            if entry is not None and time.monotonic() < entry.expires_at:
+                return entry.value
+
+            value = self._loader(name)
+            if value is None:
+                # Keep serving an expired value rather than breaking callers when the backend is unreachable.
+                return entry.value if entry is not None else None
+
+            self.set(name, value)
+            return value
+
+    def _schedule_refresh(self, name: str) -> None:
+        with self._locks_guard:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        threading.Thread(
+            target=self._refresh,
+            args=(name,),
+            name=f"secret-refresh-{name}",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, name: str) -> None:
+        try:
+            value = self._loader(name)
+            if value is None:
+                self.refresh_failures += 1
+                logger.warning(f"Background refresh of secret {name} failed. Serving cached value.")
+                return
+            self.set(name, value)
+            self.refreshes += 1
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.error(f"Error refreshing secret {name}: {e}")
+        finally:
+            with self._locks_guard:
+                self._refreshing.discard(name)
@@ -1,4 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import os
+import threading
+import time
 from typing import Union, Any
 from uuid import UUID
 from jose import JWTError, jwt
@@ -14,6 +19,23 @@ from app.db.models import User
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt takes a few hundred milliseconds per call and releases the GIL, so hashing runs on its own pool, sized to the
+# CPU rather than to I/O. Queued calls wait here instead of occupying the default executor used by everything else.
+PASSWORD_HASH_MAX_WORKERS = int(os.environ.get("PASSWORD_HASH_MAX_WORKERS", min(4, os.cpu_count() or 1)))
+
+password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+_password_stats_lock = threading.Lock()
+_password_stats = {
+    "queued": 0,
+    "running": 0,
+    "completed": 0,
+    "max_wait_ms": 0.0,
+}
     
     
 async def verify_admin_from_access_token(
@@ -35,4 +57,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+
+def _run_password_task(func, queued_at: float, *args):
+    with _password_stats_lock:
+        _password_stats["queued"] -= 1
+        _password_stats["running"] += 1
+        _password_stats["max_wait_ms"] = max(_password_stats["max_wait_ms"], (time.perf_counter() - queued_at) * 1000)
+    try:
+        return func(*args)
+    finally:
+        with _password_stats_lock:
+            _password_stats["running"] -= 1
+            _password_stats["completed"] += 1
+
+
+async def run_in_password_executor(func, *args):
+    """Run a blocking password hashing call on the password executor without blocking the event loop."""
+    with _password_stats_lock:
+        _password_stats["queued"] += 1
+    future = password_executor.submit(_run_password_task, func, time.perf_counter(), *args)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # cancel() only succeeds while the call is still queued, in which case _run_password_task never runs to
+        # take it off the queue count.
+        if future.cancel():
+            with _password_stats_lock:
+                _password_stats["queued"] -= 1
+        raise
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async version of verify_password."""
+    return await run_in_password_executor(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Async version of get_password_hash."""
+    return await run_in_password_executor(get_password_hash, password)
+
+
+def get_password_executor_stats() -> dict:
+    """Usage of the password executor.
+
+    Returns:
+        dict: Contains the keys "max_workers", "queued" (calls waiting for a thread), "running", "completed" and
+            "max_wait_ms" (longest time a call has waited for a thread since startup).
+    """
+    with _password_stats_lock:
+        return {"max_workers": PASSWORD_HASH_MAX_WORKERS, **_password_stats}
\ No newline at end of file
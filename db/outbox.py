@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class StorageProvider(Enum):
+    GCS = "gcs"
+    S3 = "s3"
+
+
+class StorageDeletion(SQLModel, table=True):
+    """A storage object (or S3 prefix) waiting to be deleted.
+
+    Rows are added in the same transaction as the database change that orphans the object, and removed by the
+    storage deletion worker once the object is gone.
+    """
+
+    __tablename__ = "storage_deletions"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    provider: str = Field(max_length=8)
+    bucket: str = Field(max_length=255)
+    # Public URL for GCS objects. Key or prefix for S3.
+    target: str
+    is_prefix: bool = Field(default=False)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None)
+    next_attempt_at: datetime = Field(default_factory=utc_now, sa_type=DateTime(timezone=True), index=True)
+    created_at: datetime = Field(default_factory=utc_now, sa_type=DateTime(timezone=True))
@@ -4,13 +4,20 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
-from app.utils.cache import get_redis_client
+from app.utils.cache import CACHE_PREFIX, OrjsonCoder, TaggedRedisBackend, tagged_key_builder
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 
+from app.core.clients import clients
+from app.core.config import prefetch_secrets, settings
 from app.core.exceptions import ErrorCode, ResourceNotFoundError
+from app.core.redis_pool import check_redis_health, close_redis, init_redis
+from app.core.security import get_password_executor_stats
 from app.db.session import init_db
+from app.services.storage_outbox import run_storage_deletion_worker
+from app.utils.gcs import get_gcs_pool_stats
+from app.utils.tiered_cache import run_cache_eviction_listener
 
 from app.api.v1.routers.auth import router as AuthRouter
 from app.api.v1.routers.users import router as UserRouter
@@ -35,8 +42,7 @@ from app.api.v1.routers.explore_tab import router as ExploreTabRouter
 from app.api.v1.routers.stats import router as StatsRouter
 from app.api.v1.routers.ebooks_tab import router as EbooksTabRouter
 from app.api.v1.routers.videos_tab import router as VideoTabRouter
-from app.core.rate_limiter import init_rate_limiter
-from slowapi.errors import RateLimitExceeded
+from app.core.rate_limiter import get_rate_limiter, init_rate_limiter
 
 
 logger = logging.getLogger(__name__)
@@ -44,10 +50,30 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Warm the secret cache concurrently before the first request is served.
+    await asyncio.to_thread(prefetch_secrets)
+    if settings.WARM_UP_CLIENTS:
+        names = None if settings.WARM_UP_CLIENTS == "all" else [name.strip() for name in settings.WARM_UP_CLIENTS.split(",")]
+        await asyncio.to_thread(clients.warm_up, names)
     await init_db()
-    redis_client = await get_redis_client()
-    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
+    # One pooled Redis client shared by the cache, cache invalidation and rate limiting.
+    redis_client = await init_redis(app, settings.REDIS_URL)
+    FastAPICache.init(
+        TaggedRedisBackend(redis_client),
+        prefix=CACHE_PREFIX,
+        coder=OrjsonCoder,
+        key_builder=tagged_key_builder()
+    )
+    stop_background_tasks = asyncio.Event()
+    storage_deletion_worker = asyncio.create_task(run_storage_deletion_worker(stop_background_tasks))
+    # Evicts in-process catalog caches when another instance changes avatars, series or themes.
+    cache_eviction_listener = asyncio.create_task(run_cache_eviction_listener(stop_background_tasks))
+    # Adds requests admitted from in-memory rate limit buckets to the shared Redis counters.
+    rate_limit_sync = asyncio.create_task(get_rate_limiter().run_sync(stop_background_tasks))
     yield
+    stop_background_tasks.set()
+    await asyncio.gather(storage_deletion_worker, cache_eviction_listener, rate_limit_sync)
+    await close_redis(app)
         
 
 app=FastAPI(
@@ -98,7 +124,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "error_code": error_code,
             "message": message,
             "data": None
-        }
+        },
+        headers=exc.headers
     )
 
 
@@ -155,6 +182,25 @@ async def root():
     return {"message": "Hello Explorer!"}
 
 
+@app.get("/health/redis")
+async def redis_health(request: Request):
+    health = await check_redis_health(request.app.state.redis)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if health["ok"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=health
+    )
+
+
+@app.get("/health/password-hashing")
+async def password_hashing_health():
+    return get_password_executor_stats()
+
+
+@app.get("/health/gcs-pool")
+async def gcs_pool_health():
+    return get_gcs_pool_stats()
+
+
 origins = [
     "*",
 ]
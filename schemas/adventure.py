@@ -26,6 +26,22 @@ class AdventurePreview(BaseModel):
     created_at: Optional[str] = None
     
 
+class AdventureDetail(BaseModel):
+    id: UUID
+    title: Optional[str] = None
+    series: Optional[str] = None
+    video_id: Optional[UUID] = None
+    ebook_id: Optional[UUID] = None
+    thumbnail: Optional[str] = None
+    themes: List[str] = []
+    file_size: Optional[float] = None
+    hls_url: Optional[str] = None
+    duration: Optional[int] = None
+    ebook_url: Optional[str] = None
+    ebook_format: Optional[str] = None
+    quiz: Optional[QuizSchema] = None
+    
+
 class AdventureResponse(BaseModel):
     id: UUID
     title: Optional[str] = None
@@ -1,5 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional
+from enum import Enum
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+# Most files an admin can request upload URLs for in one batch.
+MAX_BATCH_UPLOAD_FILES = 100
 
 
 class AdventureURLGet(BaseModel):
@@ -20,4 +25,29 @@ class ThemeIconURLGet(BaseModel):
     
     
 class QuizURLGet(BaseModel):
-    filename: str
\ No newline at end of file
+    filename: str
+
+
+class UploadKind(Enum):
+    VIDEO = "video"
+    EBOOK = "ebook"
+    THUMBNAIL = "thumbnail"
+    AVATAR = "avatar"
+    THEME_ICON = "theme_icon"
+    QUIZ = "quiz"
+
+
+class UploadFile(BaseModel):
+    kind: UploadKind
+    filename: str
+
+
+class BatchURLGet(BaseModel):
+    files: List[UploadFile] = Field(min_length=1, max_length=MAX_BATCH_UPLOAD_FILES)
+
+
+class UploadURLs(BaseModel):
+    kind: UploadKind
+    filename: str
+    upload_url: str
+    public_url: str
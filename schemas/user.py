@@ -13,6 +13,12 @@ class UserUpdate(BaseModel):
     school: Optional[str] = None
      
 
+class UserClaims(BaseModel):
+    id: UUID
+    jwt_version: int
+    is_admin: bool = False
+    
+
 class UserResponse(BaseModel):
     id: UUID
     email: str
@@ -7,10 +7,13 @@ from sqlalchemy.orm import selectinload, joinedload
 from app.core.exceptions import ResourceNotFoundError
 from app.db.models import Adventure, AdventureProgress, Series, AdventureTheme, Quiz
 from app.core.logging import logger
-from app.schemas.adventure import AdventurePreview
+from app.schemas.adventure import AdventureDetail, AdventurePreview
+from app.schemas.quiz import QuestionSchema, QuizSchema
 
-from app.utils.gcs import delete_blob_from_gcs
+from app.services.storage_outbox import enqueue_gcs_deletion
 from fastapi_cache.decorator import cache
+from app.utils.cache import invalidate_adventure_cache, tagged_key_builder
+from app.utils.single_flight import single_flight
 
 
 async def create_adventure(
@@ -46,10 +49,11 @@ async def delete_adventure(
         if not adventure:
             raise ResourceNotFoundError(message="Adventure not found")
 
-        delete_blob_from_gcs(adventure.thumbnail)
+        enqueue_gcs_deletion(session, adventure.thumbnail)
 
         await session.delete(adventure)
         await session.commit()
+        await invalidate_adventure_cache(adventure_id)
         
     except ResourceNotFoundError as e:
         logger.error("Adventure not found: {}", str(e), exc_info=True)
@@ -175,11 +179,24 @@ async def get_series_adventures(
         raise
     
     
-@cache(expire=300)
+@cache(expire=300, key_builder=tagged_key_builder("adventure:{adventure_id}"))
+# Newly notified adventures are opened by many clients at once. Only one of them runs the query on a miss.
+@single_flight("adventure:{adventure_id}", distributed=True)
 async def get_adventure_query_result(
     adventure_id: UUID,
     session: AsyncSession
-):
+) -> Optional[AdventureDetail]:
+    """Load the profile-independent part of an adventure: its video, eBook, series, themes and quiz.
+    
+    The result is a schema rather than the ORM object so it can be cached. Entries are keyed on adventure_id only.
+
+    Args:
+        adventure_id (UUID): ID of the adventure.
+        session (AsyncSession): Asynchronous database session.
+
+    Returns:
+        Optional[AdventureDetail]: The adventure, or None if it doesn't exist.
+    """
     result = await session.exec(
         select(Adventure)
         .options(
@@ -191,4 +208,39 @@ async def get_adventure_query_result(
         )
         .where(Adventure.id == adventure_id)
     )
-    return result.first()
\ No newline at end of file
+    adventure = result.first()
+    if not adventure:
+        return None
+    
+    quiz = None
+    if adventure.quiz:
+        quiz = QuizSchema(
+            id=adventure.quiz.id,
+            questions=[
+                QuestionSchema(
+                    id=question.id,
+                    text=question.text,
+                    choices=question.choices,
+                    correct_answer=question.correct_answer,
+                    timestamp_seconds=question.timestamp_seconds,
+                    question_type=question.question_type,
+                )
+                for question in adventure.quiz.questions
+            ],
+        )
+    
+    return AdventureDetail(
+        id=adventure.id,
+        title=adventure.title,
+        series=adventure.series.name if adventure.series else None,
+        video_id=adventure.video.id if adventure.video else None,
+        ebook_id=adventure.ebook.id if adventure.ebook else None,
+        thumbnail=adventure.thumbnail,
+        themes=[adventure_theme.theme.name for adventure_theme in adventure.themes],
+        file_size=adventure.file_size,
+        hls_url=adventure.video.hls_url if adventure.video else None,
+        duration=adventure.video.duration if adventure.video else None,
+        ebook_url=adventure.ebook.url if adventure.ebook else None,
+        ebook_format=adventure.ebook.format if adventure.ebook else None,
+        quiz=quiz,
+    )
\ No newline at end of file
@@ -0,0 +1,46 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List
+
+from app.services import s3
+
+
+# S3 calls run on their own bounded pool so a burst of slow S3 calls can't starve the default executor.
+S3_MAX_CONCURRENT_CALLS = int(os.environ.get("S3_MAX_CONCURRENT_CALLS", 16))
+
+s3_executor = ThreadPoolExecutor(
+    max_workers=S3_MAX_CONCURRENT_CALLS,
+    thread_name_prefix="s3"
+)
+
+
+async def run_in_s3_executor(func, *args, **kwargs):
+    """Run a blocking S3 call on the S3 executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(s3_executor, partial(func, *args, **kwargs))
+
+
+async def delete_s3_folder_contents(
+    bucket: str,
+    url_or_prefix: str
+) -> dict:
+    """Async version of app.services.s3.delete_s3_folder_contents."""
+    return await run_in_s3_executor(s3.delete_s3_folder_contents, bucket, url_or_prefix)
+
+
+async def delete_s3_files(
+    bucket: str,
+    urls_or_keys: List[str]
+) -> dict:
+    """Async version of app.services.s3.delete_s3_files."""
+    return await run_in_s3_executor(s3.delete_s3_files, bucket, urls_or_keys)
+
+
+async def delete_s3_file(
+    bucket: str,
+    url_or_key: str
+) -> None:
+    """Async version of app.services.s3.delete_s3_file."""
+    return await run_in_s3_executor(s3.delete_s3_file, bucket, url_or_key)
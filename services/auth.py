@@ -1,16 +1,27 @@
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Optional
+from uuid import UUID
 from fastapi import Depends, Header, Request
+from google.auth import jwt as google_jwt
 from google.auth.transport import requests
 from jwt import InvalidSignatureError
 from app.core.logging import logger
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import select
-from google.oauth2 import id_token
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.security import decode_jwt, verify_admin_from_access_token, verify_jwt_version, verify_user_from_access_token
 from app.core.exceptions import AuthenticationFailedError, ForbiddenError, ErrorCode
 from app.db.models import User
 from app.db.session import get_session
 from app.core.config import settings
+from app.schemas.user import UserClaims
+from app.utils.tiered_cache import TieredCache
 
 
 # OAuth2 scheme for token extraction
@@ -18,6 +29,45 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 ANDROID_GOOGLE_CLIENT_ID = settings.ANDROID_GOOGLE_CLIENT_ID
 IOS_GOOGLE_CLIENT_ID = settings.IOS_GOOGLE_CLIENT_ID
 
+GOOGLE_OAUTH2_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+# Used if Google's response has no Cache-Control max-age.
+GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS = int(os.environ.get("GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS", 3600))
+# Tokens signed with an unknown key trigger a refetch at most this often, so they can't be used to hammer Google.
+GOOGLE_CERTS_MIN_REFRESH_SECONDS = int(os.environ.get("GOOGLE_CERTS_MIN_REFRESH_SECONDS", 60))
+GOOGLE_TOKEN_CLOCK_SKEW_SECONDS = int(os.environ.get("GOOGLE_TOKEN_CLOCK_SKEW_SECONDS", 10))
+
+# Reused so certificate fetches go over a pooled connection.
+google_request = requests.Request()
+_google_certs_lock = threading.Lock()
+_google_certs = {
+    "certs": None,
+    "fetched_at": 0.0,
+    "expires_at": 0.0,
+}
+
+# Kept short, since only the changes this app makes itself (password change, email change, deletion) evict entries.
+USER_CLAIMS_LOCAL_TTL_SECONDS = float(os.environ.get("USER_CLAIMS_LOCAL_TTL_SECONDS", 15))
+USER_CLAIMS_REDIS_TTL_SECONDS = int(os.environ.get("USER_CLAIMS_REDIS_TTL_SECONDS", 60))
+# Version of the claims of deleted users, so no load of the row from before the deletion can replace them.
+DELETED_USER_CLAIMS_VERSION = sys.maxsize
+
+
+def get_user_claims_version(claims: Optional[UserClaims]) -> int:
+    if claims is None:
+        return DELETED_USER_CLAIMS_VERSION
+    return claims.jwt_version
+
+
+# User ID -> UserClaims, or None for users that don't exist. Versioned by jwt_version, so a request that loaded a user
+# before their jwt_version was bumped can't put the old claims back in Redis after the bump is written through.
+user_claims_cache = TieredCache(
+    "user_claims",
+    local_ttl_seconds=USER_CLAIMS_LOCAL_TTL_SECONDS,
+    redis_ttl_seconds=USER_CLAIMS_REDIS_TTL_SECONDS,
+    version=get_user_claims_version
+)
+
 
 async def get_user_from_passwordless_login_token(
     token: str = Depends(oauth2_scheme),
@@ -121,6 +171,134 @@ async def get_user_from_access_token(
         raise
     
     
+async def get_user_claims(
+    user_id: UUID,
+    session: AsyncSession
+) -> Optional[UserClaims]:
+    """Get the fields of a user that authentication checks need. Served from user_claims_cache after the first call.
+
+    Args:
+        user_id (UUID): ID of the user.
+        session (AsyncSession): Asynchronous database session. Only used on a cache miss.
+
+    Returns:
+        Optional[UserClaims]: The user's claims, or None if the user doesn't exist.
+    """
+    async def load_user_claims() -> Optional[UserClaims]:
+        result = await session.exec(
+            select(User.id, User.jwt_version, User.is_admin)
+            .where(User.id == user_id)
+        )
+        row = result.first()
+        if not row:
+            return None
+        return UserClaims(
+            id=row.id,
+            jwt_version=row.jwt_version,
+            is_admin=bool(row.is_admin)
+        )
+
+    return await user_claims_cache.get_or_load(str(user_id), load_user_claims, Optional[UserClaims])
+
+
+async def set_user_claims(user_id: UUID, claims: Optional[UserClaims]) -> None:
+    """Write a user's new claims through to the cache of every instance. Call after committing a jwt_version bump or
+    an is_admin change, or with None after deleting the user."""
+    await user_claims_cache.set(str(user_id), claims)
+
+
+async def get_user_claims_from_access_token(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_session),
+) -> UserClaims:
+    """Dependency to authenticate a user from the JWT token without loading the full User row. Use it instead of
+    get_user_from_access_token for routes that need no more than the user's ID.
+
+    Args:
+        token (str, optional): JWT token. Defaults to Depends(oauth2_scheme).
+        session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
+
+    Raises:
+        AuthenticationFailedError: If the token is invalid, expired or revoked, or if the user is not found.
+
+    Returns:
+        UserClaims: The user's ID, jwt_version and is_admin.
+    """
+    
+    try:
+        payload = decode_jwt(token)
+        if not payload:
+            raise AuthenticationFailedError(
+                message="Invalid or expired token", 
+                error_code=ErrorCode.INVALID_TOKEN.value
+            )
+        
+        try:
+            user_id = UUID(str(payload.get("sub")))
+        except ValueError:
+            raise AuthenticationFailedError(
+                message="Invalid token payload", 
+                error_code=ErrorCode.INVALID_TOKEN.value
+            )
+            
+        claims = await get_user_claims(
+            user_id=user_id,
+            session=session
+        )
+        if not claims:
+            raise AuthenticationFailedError(
+                message="User not found"
+            )
+            
+        verify_jwt_version(
+            payload=payload,
+            user=claims
+        )
+            
+        return claims
+    
+    except AuthenticationFailedError as e:
+        logger.error("Authentication failed: {}", str(e), exc_info=True)    
+        raise
+    
+    except InvalidSignatureError as e:
+        logger.error("Invalid JWT: {}", str(e), exc_info=True)
+        raise AuthenticationFailedError(
+            message="User not found"
+        )
+    
+    except Exception as e:
+        logger.error("Unexpected error: {}", str(e), exc_info=True)
+        raise
+    
+    
+async def get_admin_claims_from_token(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_session),
+) -> UserClaims:
+    """Dependency to authenticate an admin from the JWT token without loading the full User row. Used for admin routes.
+
+    Args:
+        token (str, optional): JWT token. Defaults to Depends(oauth2_scheme).
+        session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
+
+    Raises:
+        AuthenticationFailedError: If the token is invalid, expired or revoked, or if the user is not found.
+        ForbiddenError: If the user is not an admin.
+
+    Returns:
+        UserClaims: The admin's ID, jwt_version and is_admin.
+    """
+    claims = await get_user_claims_from_access_token(
+        token=token,
+        session=session
+    )
+    if not claims.is_admin:
+        logger.error(f"User {claims.id} is not an admin")
+        raise ForbiddenError()
+    return claims
+    
+    
 async def get_admin_from_token(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
@@ -178,20 +356,95 @@ async def get_admin_from_token(
         raise
     
     
+def get_cache_max_age(cache_control: Optional[str]) -> int:
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS
+
+
+def get_google_certs(force_refresh: bool = False) -> dict:
+    """Get Google's public certificates for ID tokens by key ID. They're cached for as long as Google's Cache-Control
+    header allows.
+
+    Args:
+        force_refresh (bool, optional): Refetch even if the cached certificates haven't expired, e.g. because a token
+            was signed with a key that isn't cached. Ignored if the certificates were fetched in the last
+            GOOGLE_CERTS_MIN_REFRESH_SECONDS. Defaults to False.
+
+    Raises:
+        RuntimeError: If the certificates couldn't be fetched.
+
+    Returns:
+        dict: PEM certificates by key ID.
+    """
+    with _google_certs_lock:
+        now = time.monotonic()
+        if _google_certs["certs"] and (
+            now < _google_certs["expires_at"] and not force_refresh
+            or now - _google_certs["fetched_at"] < GOOGLE_CERTS_MIN_REFRESH_SECONDS
+        ):
+            return _google_certs["certs"]
+
+        response = google_request(GOOGLE_OAUTH2_CERTS_URL, method="GET")
+        if response.status != 200:
+            raise RuntimeError(f"Fetching Google certificates failed with status {response.status}")
+
+        _google_certs["certs"] = json.loads(response.data.decode("utf-8"))
+        _google_certs["fetched_at"] = now
+        _google_certs["expires_at"] = now + get_cache_max_age(response.headers.get("cache-control"))
+        return _google_certs["certs"]
+
+
 def verify_google_token(
     id_token_str: str
-):
-    request_obj = requests.Request()
-    for audience in (ANDROID_GOOGLE_CLIENT_ID, IOS_GOOGLE_CLIENT_ID):
-        try:
-            return id_token.verify_oauth2_token(
-                id_token=id_token_str, 
-                request=request_obj, 
-                audience=audience
-            )
-        except Exception:
-            continue
-    AuthenticationFailedError(message="Invalid Google Token")
+) -> dict:
+    """Verify a Google ID token issued to the Android or iOS app.
+
+    The signature is checked against cached certificates, so verification is local unless the certificates have
+    expired or Google has rotated its keys.
+
+    Args:
+        id_token_str (str): ID token from the client.
+
+    Raises:
+        AuthenticationFailedError: If the token is malformed, expired, wrongly signed, or issued to another client or
+            by another issuer.
+
+    Returns:
+        dict: The token's claims, e.g. "email" and "sub".
+    """
+    try:
+        key_id = google_jwt.decode_header(id_token_str).get("kid")
+    except Exception as e:
+        logger.error("Malformed Google token: {}", str(e), exc_info=True)
+        raise AuthenticationFailedError(message="Invalid Google Token")
+
+    certs = get_google_certs()
+    if key_id not in certs:
+        certs = get_google_certs(force_refresh=True)
+
+    try:
+        id_info = google_jwt.decode(
+            id_token_str,
+            certs=certs,
+            audience=[ANDROID_GOOGLE_CLIENT_ID, IOS_GOOGLE_CLIENT_ID],
+            clock_skew_in_seconds=GOOGLE_TOKEN_CLOCK_SKEW_SECONDS
+        )
+    except Exception as e:
+        logger.error("Invalid Google token: {}", str(e), exc_info=True)
+        raise AuthenticationFailedError(message="Invalid Google Token")
+
+    if id_info.get("iss") not in GOOGLE_ISSUERS:
+        logger.error(f"Google token has unexpected issuer {id_info.get('iss')}")
+        raise AuthenticationFailedError(message="Invalid Google Token")
+
+    return id_info
+
+
+async def verify_google_token_async(
+    id_token_str: str
+) -> dict:
+    """Async version of verify_google_token. Runs in a thread, since fetching certificates blocks."""
+    return await asyncio.to_thread(verify_google_token, id_token_str)
 
 
 async def verify_video_processor_token(authorization: str = Header(None)):
@@ -233,7 +486,7 @@ async def admin_or_video_processor(
             token = request.cookies.get("access_token")
         if not token:
             raise AuthenticationFailedError(message="No token found")
-        user = await get_admin_from_token(token=token, session=session)
+        user = await get_admin_claims_from_token(token=token, session=session)
         return user  
     except Exception:
         pass
@@ -260,7 +513,7 @@ async def admin_or_ebook_processor(
             token = request.cookies.get("access_token")
         if not token:
             raise AuthenticationFailedError(message="No token found")
-        user = await get_admin_from_token(token=token, session=session)
+        user = await get_admin_claims_from_token(token=token, session=session)
         return user  
     except Exception:
         pass
@@ -1,21 +1,29 @@
-from google.cloud import run_v2
 from app.core.config import settings
+from app.core.clients import clients
 from app.core.logging import logger
 import json
-from google.oauth2 import service_account
+
+
+def build_cloud_run_jobs_client():
+    from google.cloud import run_v2
+    from google.oauth2 import service_account
+
+    jobs_sa_key_json_str = settings.JOBS_SERVICE_ACCOUNT_KEY
+    jobs_sa_info = json.loads(jobs_sa_key_json_str)
+    jobs_sa_credentials = service_account.Credentials.from_service_account_info(jobs_sa_info)
+    return run_v2.JobsClient(credentials=jobs_sa_credentials)
+
+
+clients.register("cloud_run_jobs", build_cloud_run_jobs_client)
 
 
 async def execute_video_processing_job(video_id: str, video_url: str):
     """Execute the Cloud Run Job for video processing."""
     
     try:
+        from google.cloud import run_v2
         
-        jobs_sa_key_json_str = settings.JOBS_SERVICE_ACCOUNT_KEY
-        jobs_sa_info = json.loads(jobs_sa_key_json_str)
-        jobs_sa_credentials = service_account.Credentials.from_service_account_info(jobs_sa_info)
-        
-        # Instantiate the client
-        client = run_v2.JobsClient(credentials=jobs_sa_credentials)
+        client = clients.get("cloud_run_jobs")
         
         # The job name follows the format: projects/{project}/locations/{location}/jobs/{job_name}
         job_name = f"projects/wonderspaced-450711/locations/us-central1/jobs/video-processing-job-{settings.ENV.lower()}"
@@ -1,7 +1,7 @@
-from google.cloud import tasks_v2
 import json
 from enum import Enum
 from app.core.config import settings
+from app.core.clients import clients
 
 
 class CloudTaskQueue(Enum):
@@ -15,7 +15,12 @@ class CloudTaskURL(Enum):
     EBOOK_UPDATE = f""
 
 
-client = tasks_v2.CloudTasksClient()
+def build_cloud_tasks_client():
+    from google.cloud import tasks_v2
+    return tasks_v2.CloudTasksClient()
+
+
+clients.register("cloud_tasks", build_cloud_tasks_client)
 
  # empty for security reasons
 project = ""
@@ -23,7 +28,9 @@ location = ""
 
 def create_cloud_task(queue_name: str, url: str, payload: dict):
     """Creates a Google Cloud Task to execute a background job"""
+    from google.cloud import tasks_v2
     
+    client = clients.get("cloud_tasks")
     parent = client.queue_path(project, location, queue_name)
 
     task = {
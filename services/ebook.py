@@ -1,19 +1,24 @@
 from typing import List, Optional
 
-from sqlmodel import select, func
+from sqlmodel import delete, select, func
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import joinedload
 from fastapi_cache.decorator import cache
+from app.utils.cache import invalidate_ebook_cache, tagged_key_builder
+from app.utils.single_flight import single_flight
 
 from app.schemas.adventure import EbookPageSchema
 from app.schemas.adventure import AdventurePreview
-from app.db.models import eBookPage, eBook, Adventure, Theme, AdventureTheme
-from app.services.s3 import delete_s3_file
+from app.db.models import eBookPage, eBook, Adventure, AdventureTheme
+from app.services.async_s3 import delete_s3_files
+from app.services.storage_outbox import enqueue_s3_deletion
 from app.core.logging import logger
+from app.services.theme import get_theme_id_by_name
 from app.core.config import settings
 
 
-@cache(expire=300)    
+@cache(expire=300, key_builder=tagged_key_builder("ebook:{ebook_id}"))
+@single_flight("ebook:{ebook_id}")
 async def get_tts_urls_for_ebook(
     ebook_id: str,
     session: AsyncSession
@@ -57,14 +62,9 @@ async def get_new_ebooks(
         )
 
         if theme_param:
-            theme_result = await session.exec(
-                select(Theme).where(
-                    func.lower(Theme.name) == theme_param.lower()
-                )
-            )
-            theme = theme_result.first()
-            if theme:
-                ebooks_query = ebooks_query.join(AdventureTheme).where(AdventureTheme.theme_id == theme.id)
+            theme_id = await get_theme_id_by_name(theme_param, session)
+            if theme_id:
+                ebooks_query = ebooks_query.join(AdventureTheme).where(AdventureTheme.theme_id == theme_id)
 
         if q:
             cleaned_query = " & ".join([word + ":*" for word in q.split()])
@@ -106,21 +106,32 @@ async def delete_tts_audios(
     ebook_id: str,
     session: AsyncSession
 ) -> None:
+    """Delete an eBook's TTS audio files from S3 in batches, then all its page rows with a single DELETE. Files that
+    couldn't be deleted are queued for the storage deletion worker in the same transaction.
+
+    Args:
+        ebook_id (str): The eBook's ID.
+        session (AsyncSession): Asynchronous database session. Committed once the pages are deleted.
+    """
     try:
         result = await session.exec(
-            select(eBookPage)
+            select(eBookPage.tts_url)
             .where(eBookPage.ebook_id == ebook_id)
-            .order_by(eBookPage.page_number)
         )
-        rows = result.all()
+        tts_urls = result.all()
         
-        for page in rows:
-            delete_s3_file(settings.AWS_STORAGE_BUCKET_NAME, page.tts_url)
-            await session.delete(page)
+        summary = await delete_s3_files(settings.AWS_STORAGE_BUCKET_NAME, tts_urls)
+        if summary["errors"]:
+            logger.error(f"{len(summary['errors'])} TTS audio files for eBook {ebook_id} couldn't be deleted: {summary['errors']}")
+            # Retried by the storage deletion worker, since the rows pointing at them are deleted below.
+            for error in summary["errors"]:
+                enqueue_s3_deletion(session, settings.AWS_STORAGE_BUCKET_NAME, error["key"])
             
+        await session.exec(
+            delete(eBookPage).where(eBookPage.ebook_id == ebook_id)
+        )
         await session.commit()
+        await invalidate_ebook_cache(ebook_id)
     except Exception as e:
         logger.error("Error deleting TTS for ebook: {}", str(e), exc_info=True)
         raise
-   
-        
\ No newline at end of file
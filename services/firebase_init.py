@@ -1,11 +1,22 @@
 import json
-import firebase_admin
-from firebase_admin import credentials
 
 from app.core.config import settings
+from app.core.clients import clients
 
 
-cred = credentials.Certificate(
-    json.loads(settings.FIREBASE_SERVICE_ACCOUNT_KEY)
-)
-firebase_admin.initialize_app(cred)
\ No newline at end of file
+def build_firebase_app():
+    import firebase_admin
+    from firebase_admin import credentials
+
+    cred = credentials.Certificate(
+        json.loads(settings.FIREBASE_SERVICE_ACCOUNT_KEY)
+    )
+    return firebase_admin.initialize_app(cred)
+
+
+clients.register("firebase", build_firebase_app)
+
+
+def get_firebase_app():
+    """Get the default Firebase app, initializing it on first use."""
+    return clients.get("firebase")
@@ -1,8 +1,8 @@
-from firebase_admin import messaging
+from typing import List
 from app.core.logging import logger
 from app.schemas.response import SuccessResponse
 from enum import Enum
-from app.services import firebase_init
+from app.services.firebase_init import get_firebase_app
 
 
 class NotificationTopic(Enum):
@@ -22,6 +22,8 @@ async def notify_all_users(
         topic (NotificationTopic): Topic name to send notification to. Defaults to NotificationTopic.ALL_USERS
     """
     try:
+        from firebase_admin import messaging
+
         message = messaging.Message(
             notification=messaging.Notification(
                 title=title,
@@ -30,7 +32,7 @@ async def notify_all_users(
             topic=topic.value
         )
 
-        response = messaging.send(message)
+        response = messaging.send(message, app=get_firebase_app())
         logger.info(f"Notification sent to topic '{topic.value}': {response}")
         return SuccessResponse(
             message=f"Notification sent to topic {topic.value}",
@@ -57,6 +59,8 @@ async def notify_user(
     Returns:
         SuccessResponse: Contains a message saying "Notification sent to {device token}" and a data value equal to a message ID from Firebase.
     """
+    from firebase_admin import messaging
+
     message = messaging.Message(
         notification=messaging.Notification(
             title=title,
@@ -66,7 +70,7 @@ async def notify_user(
     )
 
     try:
-        response = messaging.send(message)
+        response = messaging.send(message, app=get_firebase_app())
         return SuccessResponse(
             message=f"Notification sent to {device_token}",
             data=response
@@ -74,4 +78,23 @@ async def notify_user(
     
     except Exception as e:
         logger.error("Error sending notification to device: {}", str(e), exc_info=True)
-        raise
\ No newline at end of file
+        raise
+    
+    
+def subscribe_to_topic(
+    tokens: List[str],
+    topic: NotificationTopic = NotificationTopic.ALL_USERS
+):
+    """Subscribe devices to a Firebase Cloud Messaging topic
+
+    Args:
+        tokens (List[str]): Device tokens to subscribe
+        topic (NotificationTopic): Topic to subscribe the devices to. Defaults to NotificationTopic.ALL_USERS
+    """
+    from firebase_admin import messaging
+
+    return messaging.subscribe_to_topic(
+        tokens=tokens,
+        topic=topic.value,
+        app=get_firebase_app()
+    )
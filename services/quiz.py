@@ -5,13 +5,23 @@ from sqlmodel import func, select
 from sqlalchemy.orm import selectinload
 from app.core.exceptions import ValidationError
 from app.db.models import QuizAttempt, QuizResponse
+from app.core.clients import clients
 from app.core.config import settings
 from app.core.logging import logger
 from app.utils.format_quiz_instruction import format_quiz_instruction
 from app.schemas.quiz_attempt import QuizAttemptStatus, QuizAttemptResponseSchema, QuizResponseSchema
 
 import json
-from google import generativeai
+
+
+def build_gemini_model():
+    from google import generativeai
+
+    generativeai.configure(api_key=settings.GEMINI_KEY)
+    return generativeai.GenerativeModel(model_name='gemini-2.5-flash')
+
+
+clients.register("gemini", build_gemini_model)
 
 
 async def has_completed_adventure_quiz(
@@ -133,8 +143,7 @@ def format_quiz_text_into_request(text: str) -> List[dict]:
     """
     try: 
         
-        generativeai.configure(api_key=settings.GEMINI_KEY)
-        model = generativeai.GenerativeModel(model_name='gemini-2.5-flash')
+        model = clients.get("gemini")
         
         prompt = f"""
         QUIZ:
@@ -1,24 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+from typing import List
+
 from app.core.logging import logger
 from app.core.config import settings
-import boto3
+from app.core.clients import clients
+
+
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 50))
+S3_CONNECT_TIMEOUT_SECONDS = float(os.environ.get("S3_CONNECT_TIMEOUT_SECONDS", 5))
+S3_READ_TIMEOUT_SECONDS = float(os.environ.get("S3_READ_TIMEOUT_SECONDS", 30))
+S3_MAX_ATTEMPTS = int(os.environ.get("S3_MAX_ATTEMPTS", 5))
+
+
+def build_s3_client():
+    import boto3
+    from botocore.config import Config
 
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.S3_USER_SECRET_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.S3_USER_SECRET_ACCESS_KEY,
+        config=Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            connect_timeout=S3_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=S3_READ_TIMEOUT_SECONDS,
+            retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "standard"},
+        ),
+    )
 
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=settings.S3_USER_SECRET_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.S3_USER_SECRET_ACCESS_KEY,
+
+clients.register("s3", build_s3_client)
+
+# delete_objects accepts at most 1,000 keys per call.
+S3_DELETE_BATCH_SIZE = 1000
+S3_DELETE_MAX_WORKERS = int(os.environ.get("S3_DELETE_MAX_WORKERS", 8))
+
+# Shared by every bulk delete, so concurrent deletes running on the async facade's executor can't each start a pool
+# of their own.
+s3_delete_executor = ThreadPoolExecutor(
+    max_workers=S3_DELETE_MAX_WORKERS,
+    thread_name_prefix="s3-delete"
 )
 
 
+def get_s3_client():
+    return clients.get("s3")
+
+
 def delete_s3_folder_contents(
     bucket: str, 
     url_or_prefix: str, 
-) -> None:
+) -> dict:
     
     """
     Delete all objects under a given S3 prefix. The prefix is extracted from a full URL or provided directly.
+
+    Keys are listed page by page. Each page of up to S3_DELETE_BATCH_SIZE keys is deleted with one delete_objects call
+    on s3_delete_executor while later pages are still being listed.
+
+    Args:
+        bucket (str): S3 bucket name.
+        url_or_prefix (str): Key prefix, or the URL of an object in the folder to empty.
+
+    Raises:
+        Exception: If listing the keys fails. Keys that fail to delete are reported in the summary instead.
+
+    Returns:
+        dict: Summary with the keys "prefix", "objects" (number deleted), "bytes" (their total size), "errors"
+        (list of {"key", "code", "message"} for keys that couldn't be deleted) and "elapsed_seconds".
     """
     try:
+        start = time.perf_counter()
         prefix = url_or_prefix
         if ".amazonaws.com/" in url_or_prefix:
             prefix = url_or_prefix.split(".amazonaws.com/")[1]
@@ -26,18 +80,113 @@ def delete_s3_folder_contents(
 
         logger.info(f"Deleting all S3 files under prefix: {prefix}")
 
-        response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-        if "Contents" in response:
-            keys = [{"Key": obj["Key"]} for obj in response["Contents"]]
-            s3_client.delete_objects(Bucket=bucket, Delete={"Objects": keys})
-            for obj in keys:
-                logger.info(f"Deleted from S3: {obj['Key']}")
+        s3_client = get_s3_client()
+        paginator = s3_client.get_paginator("list_objects_v2")
+        sizes = {}
+        futures = []
+
+        pages = paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": S3_DELETE_BATCH_SIZE}
+        )
+        for page in pages:
+            objects = page.get("Contents", [])
+            if not objects:
+                continue
+            for obj in objects:
+                sizes[obj["Key"]] = obj.get("Size", 0)
+            futures.append(s3_delete_executor.submit(delete_s3_keys, bucket, [obj["Key"] for obj in objects]))
+
+        errors = [error for future in futures for error in future.result()]
+
+        failed_keys = {error["key"] for error in errors}
+        summary = {
+            "prefix": prefix,
+            "objects": len(sizes) - len(failed_keys),
+            "bytes": sum(size for key, size in sizes.items() if key not in failed_keys),
+            "errors": errors,
+            "elapsed_seconds": round(time.perf_counter() - start, 3)
+        }
+        logger.info(
+            f"Deleted {summary['objects']} S3 files ({summary['bytes']} bytes) under {prefix} "
+            f"in {summary['elapsed_seconds']}s, {len(errors)} failed"
+        )
+        return summary
                 
     except Exception as e:
         logger.error(f"Error deleting files from S3: {str(e)}")
         raise
+
+
+def delete_s3_keys(
+    bucket: str,
+    keys: List[str]
+) -> List[dict]:
+    """Delete up to S3_DELETE_BATCH_SIZE keys with one delete_objects call.
+
+    Returns:
+        List[dict]: {"key", "code", "message"} for each key S3 couldn't delete. If the call itself fails, every key is
+        reported with the exception as its message.
+    """
+    try:
+        response = get_s3_client().delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+        )
+    except Exception as e:
+        logger.error(f"Error deleting batch of {len(keys)} files from S3: {str(e)}")
+        return [{"key": key, "code": type(e).__name__, "message": str(e)} for key in keys]
+
+    return [
+        {"key": error.get("Key"), "code": error.get("Code"), "message": error.get("Message")}
+        for error in response.get("Errors", [])
+    ]
     
     
+def get_s3_key(url_or_key: str) -> str:
+    """Get an object's key from its S3 URL. Keys are returned unchanged."""
+    if url_or_key.startswith("https://"):
+        # Example: https://my-bucket.s3.amazonaws.com/uploads/videos/12345.mp4
+        return url_or_key.split(".amazonaws.com/")[1]
+    return url_or_key
+
+
+def delete_s3_files(
+    bucket: str,
+    urls_or_keys: List[str]
+) -> dict:
+    """Delete many files from S3 with batched delete_objects calls of up to S3_DELETE_BATCH_SIZE keys each.
+
+    Batches run concurrently on s3_delete_executor. Empty values are skipped and duplicates are
+    deleted once.
+
+    Args:
+        bucket (str): S3 bucket name.
+        urls_or_keys (List[str]): Full S3 URLs or raw keys.
+
+    Returns:
+        dict: Summary with the keys "objects" (number deleted) and "errors" (list of {"key", "code", "message"} for
+        keys that couldn't be deleted).
+    """
+    keys = list(dict.fromkeys(get_s3_key(url_or_key) for url_or_key in urls_or_keys if url_or_key))
+    batches = [keys[i:i + S3_DELETE_BATCH_SIZE] for i in range(0, len(keys), S3_DELETE_BATCH_SIZE)]
+    if not batches:
+        return {"objects": 0, "errors": []}
+
+    errors = [
+        error
+        for batch_errors in s3_delete_executor.map(lambda batch: delete_s3_keys(bucket, batch), batches)
+        for error in batch_errors
+    ]
+
+    logger.info(f"Deleted {len(keys) - len(errors)} files from S3 bucket {bucket}, {len(errors)} failed")
+    return {
+        "objects": len(keys) - len(errors),
+        "errors": errors
+    }
+
+
 def delete_s3_file(
     bucket: str, 
     url_or_key: str, 
@@ -46,12 +195,9 @@ def delete_s3_file(
     Delete a single file from S3. Accepts either a full S3 URL or a raw key.
     """
     try:
-        key = url_or_key
-        if url_or_key.startswith("https://"):
-            # Example: https://my-bucket.s3.amazonaws.com/uploads/videos/12345.mp4
-            key = url_or_key.split(".amazonaws.com/")[1]
+        key = get_s3_key(url_or_key)
         
-        s3_client.delete_object(Bucket=bucket, Key=key)
+        get_s3_client().delete_object(Bucket=bucket, Key=key)
         logger.info(f"Deleted from S3: {key}")
     except Exception as e:
         logger.error(f"Error deleting file from S3: {str(e)}")
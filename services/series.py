@@ -1,16 +1,23 @@
-from sqlmodel import select
+from sqlmodel import func, select
 from uuid import UUID
 from app.db.session import AsyncSession
 from app.db.models import Series, Adventure
 from app.core.logging import logger
-from typing import List
+from typing import List, Optional
 from app.schemas.series import SeriesResponse, SeriesContentType
+from app.utils.tiered_cache import TieredCache
+
+
+# Holds the list of video series under "video", and series name (lowercased) -> series ID under "id:<name>". Names that
+# don't exist aren't cached, so a new series is found straight away.
+series_cache = TieredCache("series", cache_none=False)
 
 
 async def get_video_series(
     session: AsyncSession,
 ) -> List[SeriesResponse]:
-    try:
+    
+    async def load_video_series() -> List[SeriesResponse]:
         series_query = (
             select(Series)
             .where(Series.content == "video")
@@ -28,11 +35,46 @@ async def get_video_series(
             for s in series
         ]
     
+    try:
+        return await series_cache.get_or_load("video", load_video_series, List[SeriesResponse])
+    
     except Exception as e:
         logger.error("Error getting video series: {}", str(e), exc_info=True)
         raise
 
 
+async def get_series_id_by_name(
+    name: str,
+    session: AsyncSession
+) -> Optional[UUID]:
+    """Look up a series' ID by name, case-insensitively. Served from series_cache after the first lookup.
+
+    Args:
+        name (str): Series name.
+        session (AsyncSession): Asynchronous database session. Only used on a cache miss.
+
+    Returns:
+        Optional[UUID]: The series' ID, or None if no series has that name.
+    """
+    async def load_series_id() -> Optional[UUID]:
+        result = await session.exec(
+            select(Series.id).where(func.lower(Series.name) == name.lower())
+        )
+        return result.first()
+
+    try:
+        return await series_cache.get_or_load(f"id:{name.lower()}", load_series_id, Optional[UUID])
+
+    except Exception as e:
+        logger.error("Error getting series ID by name: {}", str(e), exc_info=True)
+        raise
+
+
+async def invalidate_series_lookups() -> None:
+    """Drop cached series lists and name lookups on every instance. Call after creating, renaming or deleting a series."""
+    await series_cache.clear()
+
+
 async def get_series_adventures_count(
     series_id: UUID,
     session: AsyncSession
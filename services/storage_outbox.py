@@ -0,0 +1,202 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import os
+from typing import List, Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.logging import logger
+from app.db.outbox import StorageDeletion, StorageProvider, utc_now
+from app.db.session import get_session
+from app.services.async_s3 import delete_s3_files, delete_s3_folder_contents
+from app.services.s3 import get_s3_key
+from app.utils.async_gcs import delete_blobs_from_gcs
+from app.utils.gcs import parse_gcs_public_url
+
+
+STORAGE_DELETION_BATCH_SIZE = int(os.environ.get("STORAGE_DELETION_BATCH_SIZE", 100))
+STORAGE_DELETION_POLL_SECONDS = float(os.environ.get("STORAGE_DELETION_POLL_SECONDS", 5))
+STORAGE_DELETION_BASE_BACKOFF_SECONDS = int(os.environ.get("STORAGE_DELETION_BASE_BACKOFF_SECONDS", 30))
+STORAGE_DELETION_MAX_BACKOFF_SECONDS = int(os.environ.get("STORAGE_DELETION_MAX_BACKOFF_SECONDS", 3600))
+
+worker_session = asynccontextmanager(get_session)
+
+
+def enqueue_gcs_deletion(
+    session: AsyncSession,
+    public_url: Optional[str]
+) -> None:
+    """Queue a GCS object for deletion once the session's transaction commits. Does nothing if public_url is empty.
+
+    URLs that aren't valid public GCS URLs, e.g. from legacy rows, are logged and skipped rather than raised, so they
+    can't fail the delete they're part of.
+
+    Args:
+        session (AsyncSession): Session of the transaction that orphans the object. The caller commits it.
+        public_url (Optional[str]): Object's public GCS URL.
+    """
+    if not public_url:
+        return
+
+    try:
+        bucket_name, _ = parse_gcs_public_url(public_url)
+    except ValueError as e:
+        logger.error(f"Not queueing GCS deletion of unparseable URL {public_url}: {e}")
+        return
+
+    session.add(StorageDeletion(
+        provider=StorageProvider.GCS.value,
+        bucket=bucket_name,
+        target=public_url
+    ))
+
+
+def enqueue_s3_deletion(
+    session: AsyncSession,
+    bucket: str,
+    url_or_key: str,
+    is_prefix: bool = False
+) -> None:
+    """Queue an S3 object, or every object under an S3 prefix, for deletion once the session's transaction commits.
+
+    Args:
+        session (AsyncSession): Session of the transaction that orphans the objects. The caller commits it.
+        bucket (str): S3 bucket name.
+        url_or_key (str): Object URL or key, or the prefix if is_prefix is True.
+        is_prefix (bool, optional): Delete everything under url_or_key. Defaults to False.
+    """
+    session.add(StorageDeletion(
+        provider=StorageProvider.S3.value,
+        bucket=bucket,
+        target=url_or_key,
+        is_prefix=is_prefix
+    ))
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff from STORAGE_DELETION_BASE_BACKOFF_SECONDS, capped at STORAGE_DELETION_MAX_BACKOFF_SECONDS."""
+    seconds = STORAGE_DELETION_BASE_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, STORAGE_DELETION_MAX_BACKOFF_SECONDS))
+
+
+async def delete_s3_prefix(deletion: StorageDeletion) -> None:
+    summary = await delete_s3_folder_contents(deletion.bucket, deletion.target)
+    if summary["errors"]:
+        raise RuntimeError(f"{len(summary['errors'])} files under {summary['prefix']} couldn't be deleted: {summary['errors'][0]}")
+
+
+async def delete_bucket_objects(deletions: List[StorageDeletion]) -> dict:
+    """Delete a batch of objects from one bucket. GCS objects go through the GCS batch endpoint and S3 files through
+    batched delete_objects calls. S3 prefixes are purged one at a time.
+
+    Returns:
+        dict: Maps the ID of each deletion that failed to its error message.
+    """
+    failures = {}
+
+    if deletions[0].provider == StorageProvider.GCS.value:
+        try:
+            result = await delete_blobs_from_gcs([deletion.target for deletion in deletions])
+        except Exception as e:
+            return {deletion.id: str(e) for deletion in deletions}
+        for deletion in deletions:
+            if deletion.target in result["failed"]:
+                failures[deletion.id] = result["failed"][deletion.target]
+        return failures
+
+    files = [deletion for deletion in deletions if not deletion.is_prefix]
+    if files:
+        try:
+            summary = await delete_s3_files(files[0].bucket, [deletion.target for deletion in files])
+            errors = {error["key"]: f"{error['code']}: {error['message']}" for error in summary["errors"]}
+            for deletion in files:
+                if get_s3_key(deletion.target) in errors:
+                    failures[deletion.id] = errors[get_s3_key(deletion.target)]
+        except Exception as e:
+            failures.update({deletion.id: str(e) for deletion in files})
+
+    for deletion in deletions:
+        if not deletion.is_prefix:
+            continue
+        try:
+            await delete_s3_prefix(deletion)
+        except Exception as e:
+            failures[deletion.id] = str(e)
+    return failures
+
+
+async def drain_storage_deletions(
+    session: AsyncSession,
+    batch_size: int = STORAGE_DELETION_BATCH_SIZE
+) -> int:
+    """Delete one batch of queued storage objects that are due.
+
+    Rows are locked with FOR UPDATE SKIP LOCKED, so several instances can drain the queue without deleting the same
+    object twice. Deletions are grouped by bucket and buckets are processed concurrently. Successful rows are removed.
+    Failed rows stay queued and are retried with exponential backoff.
+
+    Args:
+        session (AsyncSession): Asynchronous database session. Committed before returning.
+        batch_size (int, optional): Most rows to claim. Defaults to STORAGE_DELETION_BATCH_SIZE.
+
+    Returns:
+        int: Number of rows claimed. 0 means nothing was due.
+    """
+    result = await session.exec(
+        select(StorageDeletion)
+        .where(StorageDeletion.next_attempt_at <= utc_now())
+        .order_by(StorageDeletion.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    deletions = result.all()
+    if not deletions:
+        await session.commit()
+        return 0
+
+    by_bucket = defaultdict(list)
+    for deletion in deletions:
+        by_bucket[(deletion.provider, deletion.bucket)].append(deletion)
+
+    results = await asyncio.gather(*(delete_bucket_objects(group) for group in by_bucket.values()))
+    failures = {deletion_id: error for result in results for deletion_id, error in result.items()}
+
+    for deletion in deletions:
+        if deletion.id in failures:
+            deletion.attempts += 1
+            deletion.last_error = failures[deletion.id][:1000]
+            deletion.next_attempt_at = utc_now() + get_retry_delay(deletion.attempts)
+            logger.warning(
+                f"Deleting {deletion.provider} object {deletion.target} failed (attempt {deletion.attempts}): {deletion.last_error}"
+            )
+        else:
+            await session.delete(deletion)
+
+    await session.commit()
+    logger.info(f"Storage deletion batch: {len(deletions) - len(failures)} deleted, {len(failures)} failed")
+    return len(deletions)
+
+
+async def run_storage_deletion_worker(stop_event: asyncio.Event) -> None:
+    """Drain the storage deletion queue until stop_event is set. Runs as a background task started in the app's lifespan.
+
+    Full batches are followed immediately by the next one. Otherwise the worker waits STORAGE_DELETION_POLL_SECONDS.
+    """
+    while not stop_event.is_set():
+        claimed = 0
+        try:
+            async with worker_session() as session:
+                claimed = await drain_storage_deletions(session)
+        except Exception as e:
+            logger.error("Error draining storage deletion queue: {}", str(e), exc_info=True)
+
+        if claimed >= STORAGE_DELETION_BATCH_SIZE:
+            continue
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=STORAGE_DELETION_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
@@ -1,10 +1,15 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db.models import Theme, AdventureTheme, Adventure, Video, eBook
 from app.core.logging import logger
 from app.schemas.theme import ThemeSchema
+from app.utils.tiered_cache import TieredCache
+
+
+# Theme name (lowercased) -> theme ID. Names that don't exist aren't cached, so a new theme is found straight away.
+theme_ids_cache = TieredCache("theme_ids", cache_none=False)
 
 
 async def theme_exists(
@@ -28,6 +33,38 @@ async def theme_exists(
         raise
 
 
+async def get_theme_id_by_name(
+    name: str,
+    session: AsyncSession
+) -> Optional[UUID]:
+    """Look up a theme's ID by name, case-insensitively. Served from theme_ids_cache after the first lookup.
+
+    Args:
+        name (str): Theme name.
+        session (AsyncSession): Asynchronous database session. Only used on a cache miss.
+
+    Returns:
+        Optional[UUID]: The theme's ID, or None if no theme has that name.
+    """
+    async def load_theme_id() -> Optional[UUID]:
+        result = await session.exec(
+            select(Theme.id).where(func.lower(Theme.name) == name.lower())
+        )
+        return result.first()
+
+    try:
+        return await theme_ids_cache.get_or_load(name.lower(), load_theme_id, Optional[UUID])
+
+    except Exception as e:
+        logger.error("Error getting theme ID by name: {}", str(e), exc_info=True)
+        raise
+
+
+async def invalidate_theme_lookups() -> None:
+    """Drop cached theme name lookups on every instance. Call after creating, renaming or deleting a theme."""
+    await theme_ids_cache.clear()
+
+
 async def get_themes_assigned_to_videos(
     session: AsyncSession,
     offset: int,
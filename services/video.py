@@ -1,10 +1,12 @@
-from app.db.models import Video, Adventure, Series, Theme, AdventureTheme
+from app.db.models import Video, Adventure, AdventureTheme
 from app.schemas.adventure import AdventurePreview
 from app.db.session import AsyncSession
 from sqlmodel import select, func
 from sqlalchemy.orm import joinedload
 from typing import List, Optional
 from app.core.logging import logger
+from app.services.series import get_series_id_by_name
+from app.services.theme import get_theme_id_by_name
 
 
 async def get_new_videos(
@@ -44,24 +46,14 @@ async def get_new_videos(
         )
 
         if series_param:
-            series_result = await session.exec(
-                select(Series).where(
-                    func.lower(Series.name) == series_param.lower()
-                )
-            )
-            series = series_result.first()
-            if series:
-                videos_query = videos_query.where(Adventure.series_id == series.id)
+            series_id = await get_series_id_by_name(series_param, session)
+            if series_id:
+                videos_query = videos_query.where(Adventure.series_id == series_id)
 
         if theme_param:
-            theme_result = await session.exec(
-                select(Theme).where(
-                    func.lower(Theme.name) == theme_param.lower()
-                )
-            )
-            theme = theme_result.first()
-            if theme:
-                videos_query = videos_query.join(AdventureTheme).where(AdventureTheme.theme_id == theme.id)
+            theme_id = await get_theme_id_by_name(theme_param, session)
+            if theme_id:
+                videos_query = videos_query.join(AdventureTheme).where(AdventureTheme.theme_id == theme_id)
 
         if q:
             cleaned_query = " & ".join([word + ":*" for word in q.split()])
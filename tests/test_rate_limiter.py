@@ -0,0 +1,39 @@
+import pytest
+from fastapi import Request
+
+from app.core.rate_limiter import RateLimiter, get_remote_address, parse_limit
+
+
+def make_request(forwarded_for: str) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(b"x-forwarded-for", forwarded_for.encode())],
+        "client": ("169.254.1.1", 443),
+    })
+
+
+def test_parse_limit():
+    assert parse_limit("3/minute") == (3, 60)
+    assert parse_limit("100 / hours") == (100, 3600)
+
+    with pytest.raises(ValueError):
+        parse_limit("3 per minute")
+
+
+def test_local_bucket_admits_up_to_limit_and_records_hits():
+    limiter = RateLimiter()
+
+    results = [limiter.hit_local("scope", "user:1", 3, 60)[0] for _ in range(4)]
+
+    assert results == [True, True, True, False]
+    assert limiter.pending_hits[("scope", "user:1", 3, 60)] == 3
+
+
+def test_remote_address_is_entry_appended_by_proxy():
+    first = get_remote_address(make_request("203.0.113.5"))
+    second = get_remote_address(make_request("198.51.100.7"))
+    spoofed = get_remote_address(make_request("10.9.8.7, 203.0.113.5"))
+
+    assert first == "203.0.113.5"
+    assert second == "198.51.100.7"
+    assert spoofed == "203.0.113.5"
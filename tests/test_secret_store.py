@@ -0,0 +1,55 @@
+import time
+
+from app.core.secret_store import SecretStore
+
+
+def test_secret_is_loaded_once_and_served_from_memory():
+    calls = []
+
+    def loader(name: str) -> str:
+        calls.append(name)
+        return f"{name}-value"
+
+    store = SecretStore(loader=loader, ttl_seconds=60)
+
+    assert store.get("SECRET_KEY") == "SECRET_KEY-value"
+    assert store.get("SECRET_KEY") == "SECRET_KEY-value"
+    assert calls == ["SECRET_KEY"]
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 1
+
+
+def test_secret_is_refreshed_in_background_before_expiry():
+    values = iter(["old", "new"])
+    store = SecretStore(loader=lambda name: next(values), ttl_seconds=1, refresh_ahead_ratio=0.1)
+
+    assert store.get("DB_PASSWORD") == "old"
+    time.sleep(0.2)
+    assert store.get("DB_PASSWORD") == "old"  # served from cache while refreshing
+
+    for _ in range(50):
+        if store.stats()["refreshes"]:
+            break
+        time.sleep(0.01)
+
+    assert store.get("DB_PASSWORD") == "new"
+
+
+def test_stale_secret_is_served_when_loader_fails():
+    values = iter(["value", None])
+    store = SecretStore(loader=lambda name: next(values), ttl_seconds=0.05)
+
+    assert store.get("GEMINI_KEY") == "value"
+    time.sleep(0.1)
+    assert store.get("GEMINI_KEY") == "value"
+
+
+def test_known_secret_names_come_from_settings_properties():
+    from app.core.config import Settings
+
+    names = Settings(ENV="dev").known_secret_names()
+
+    assert "REDIS_URL" in names
+    assert "DEV_INSTANCE_CONNECTION_NAME" in names
+    assert "VIDEO_PROCESSING_TOPIC_NAME" not in names
+    assert len(names) == len(set(names))
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.utils.single_flight import load_with_redis_lock, single_flight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_load():
+    calls = []
+
+    @single_flight("item:{item_id}")
+    async def load_item(item_id: str) -> dict:
+        calls.append(item_id)
+        await asyncio.sleep(0.05)
+        return {"id": item_id}
+
+    results = await asyncio.gather(*(load_item("a") for _ in range(10)), load_item("b"))
+
+    assert calls.count("a") == 1
+    assert calls.count("b") == 1
+    assert results[0] == {"id": "a"}
+    assert results[-1] == {"id": "b"}
+
+
+class FakeRedis:
+    """Enough of the Redis client for load_with_redis_lock. Expiry is ignored."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_instances_waiting_on_lock_read_leader_result(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("app.utils.single_flight.get_redis_client", lambda: redis)
+    monkeypatch.setattr("app.utils.single_flight.SINGLE_FLIGHT_POLL_INTERVAL_SECONDS", 0.01)
+    calls = []
+
+    async def load_item() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"id": "a"}
+
+    # Each call stands in for a different instance, so the in-process coalescing doesn't apply.
+    results = await asyncio.gather(*(load_with_redis_lock("item:a", load_item) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert results == [{"id": "a"}] * 5
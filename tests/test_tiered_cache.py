@@ -0,0 +1,109 @@
+import asyncio
+
+import orjson
+import pytest
+
+from app.utils.cache import OrjsonCoder
+from app.utils.tiered_cache import TieredCache, apply_eviction, tiered_caches
+
+
+def test_eviction_message_drops_local_entries():
+    cache = TieredCache("test_eviction")
+    try:
+        cache.local.set("a", 1)
+        cache.local.set("b", 2)
+
+        apply_eviction(orjson.dumps({"cache": "test_eviction", "keys": ["a"]}))
+        assert cache.local.get("a") is None
+        assert cache.local.get("b") == 2
+
+        apply_eviction(orjson.dumps({"cache": "test_eviction", "keys": None}))
+        assert cache.local.get("b") is None
+    finally:
+        tiered_caches.pop("test_eviction", None)
+
+
+class FakeRedis:
+    """Enough of the Redis client for TieredCache, with VERSIONED_SET_SCRIPT's logic in Python."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def publish(self, channel, message):
+        pass
+
+    def pipeline(self, transaction=False):
+        return FakePipeline()
+
+    def register_script(self, script):
+        async def versioned_set(keys, args):
+            stored = self.store.get(keys[1])
+            if stored is not None and int(stored) > int(args[1]):
+                return 0
+            self.store[keys[0]] = args[0]
+            self.store[keys[1]] = str(args[1])
+            return 1
+        return versioned_set
+
+
+class FakePipeline:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    async def execute(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_load_started_before_write_through_cant_restore_old_version(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("app.utils.tiered_cache.get_redis_client", lambda: redis)
+    cache = TieredCache("test_versioned", version=lambda value: value["version"])
+    try:
+        loaded = asyncio.Event()
+        release = asyncio.Event()
+
+        async def load_old_row():
+            loaded.set()
+            await release.wait()
+            return {"version": 1}
+
+        stale_read = asyncio.ensure_future(cache.get_or_load("user", load_old_row))
+        await loaded.wait()
+        await cache.set("user", {"version": 2})
+        release.set()
+
+        assert await stale_read == {"version": 2}
+        assert OrjsonCoder.decode(redis.store[cache.get_redis_key("user")]) == {"version": 2}
+        assert cache.local.get("user") == {"version": 2}
+    finally:
+        tiered_caches.pop("test_versioned", None)
+
+
+@pytest.mark.asyncio
+async def test_misses_arent_cached_with_cache_none_off(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("app.utils.tiered_cache.get_redis_client", lambda: redis)
+    cache = TieredCache("test_cache_none", cache_none=False)
+    try:
+        calls = []
+
+        async def load_missing_name():
+            calls.append(1)
+            return None
+
+        assert await cache.get_or_load("new theme", load_missing_name) is None
+        assert await cache.get_or_load("new theme", load_missing_name) is None
+        assert len(calls) == 2
+        assert redis.store == {}
+    finally:
+        tiered_caches.pop("test_cache_none", None)
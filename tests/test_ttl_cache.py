@@ -0,0 +1,25 @@
+import time
+
+from app.utils.ttl_cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=10, ttl_seconds=0.05)
+    cache.set("url", {"size": 1})
+
+    assert cache.get("url") == {"size": 1}
+    time.sleep(0.1)
+    assert cache.get("url") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted_when_full():
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
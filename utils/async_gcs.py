@@ -0,0 +1,92 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from tempfile import SpooledTemporaryFile
+from typing import List
+
+from app.utils import gcs
+
+
+# GCS calls run on their own bounded pool so a burst of slow storage calls can't starve the default executor.
+GCS_MAX_CONCURRENT_CALLS = int(os.environ.get("GCS_MAX_CONCURRENT_CALLS", 16))
+
+gcs_executor = ThreadPoolExecutor(
+    max_workers=GCS_MAX_CONCURRENT_CALLS,
+    thread_name_prefix="gcs"
+)
+
+
+async def run_in_gcs_executor(func, *args, **kwargs):
+    """Run a blocking GCS call on the GCS executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(gcs_executor, partial(func, *args, **kwargs))
+
+
+async def delete_blob_from_gcs(blob_public_url: str) -> None:
+    """Async version of app.utils.gcs.delete_blob_from_gcs."""
+    return await run_in_gcs_executor(gcs.delete_blob_from_gcs, blob_public_url)
+
+
+async def delete_blobs_from_gcs(blob_public_urls: List[str]) -> dict:
+    """Async version of app.utils.gcs.delete_blobs_from_gcs."""
+    return await run_in_gcs_executor(gcs.delete_blobs_from_gcs, blob_public_urls)
+
+
+async def get_file_metadata_from_gcs_public_url(gcs_public_url: str) -> dict:
+    """Async version of app.utils.gcs.get_file_metadata_from_gcs_public_url."""
+    return await run_in_gcs_executor(gcs.get_file_metadata_from_gcs_public_url, gcs_public_url)
+
+
+async def download_file_from_gcs(
+    public_gcs_url: str,
+    local_path: str
+) -> str:
+    """Async version of app.utils.gcs.download_file_from_gcs."""
+    return await run_in_gcs_executor(gcs.download_file_from_gcs, public_gcs_url, local_path)
+
+
+async def download_file_from_gcs_to_buffer(
+    public_gcs_url: str,
+    max_bytes: int = gcs.GCS_DOWNLOAD_MAX_BYTES
+) -> SpooledTemporaryFile:
+    """Async version of app.utils.gcs.download_file_from_gcs_to_buffer."""
+    return await run_in_gcs_executor(gcs.download_file_from_gcs_to_buffer, public_gcs_url, max_bytes)
+
+
+async def get_gcs_upload_signed_url(
+    filename: str,
+    folder: str,
+    content_type: str,
+    bucket_name: str
+) -> dict:
+    """Async version of app.utils.gcs.get_gcs_upload_signed_url."""
+    return await run_in_gcs_executor(gcs.get_gcs_upload_signed_url, filename, folder, content_type, bucket_name)
+
+
+def _sign_upload_urls(targets: list) -> list:
+    return [gcs.get_gcs_upload_signed_url(**target) for target in targets]
+
+
+async def get_gcs_upload_signed_urls(targets: list) -> list:
+    """Sign upload URLs for a batch of files concurrently on the GCS executor.
+
+    Signing happens locally with the cached storage admin credentials, so no request is made to GCS. The batch is split
+    into one chunk per executor worker rather than one task per URL, which keeps scheduling overhead low for large batches.
+
+    Args:
+        targets (list): Dicts of get_gcs_upload_signed_url arguments, as returned by app.utils.gcs.prepare_upload_targets.
+
+    Raises:
+        InternalServerError: If any URL can't be signed.
+
+    Returns:
+        list: Dicts with the keys "upload_url" and "public_url", in the same order as targets.
+    """
+    if not targets:
+        return []
+
+    chunk_size = -(-len(targets) // GCS_MAX_CONCURRENT_CALLS)
+    chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+    results = await asyncio.gather(*(run_in_gcs_executor(_sign_upload_urls, chunk) for chunk in chunks))
+    return [urls for chunk in results for urls in chunk]
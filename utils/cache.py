@@ -1,16 +1,207 @@
-import redis
-from app.core.config import settings
+from contextvars import ContextVar
+from datetime import date, datetime
+from enum import Enum
+import hashlib
+import inspect
+import os
+from typing import Any, Callable, Optional, Tuple
 from uuid import UUID
 
+import orjson
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
 
-async def get_redis_client():
-    return redis.Redis.from_url(settings.REDIS_URL)
+from app.core.logging import logger
+from app.core.redis_pool import get_redis_client
 
 
-async def invalidate_adventure_cache(adventure_id: UUID):
-    redis = await get_redis_client()
-    pattern = f"fastapi-cache:*adventure*{adventure_id}*"
-    keys = await redis.keys(pattern)
-    if keys:
-        await redis.delete(*keys)
-    await redis.close()
\ No newline at end of file
+CACHE_PREFIX = "fastapi-cache"
+
+# Tags are appended to cache keys after TAG_SEPARATOR, e.g. "fastapi-cache::<hash>|adventure:<id>,ebook:<id>".
+TAG_SEPARATOR = "|"
+TAG_KEY_PREFIX = f"{CACHE_PREFIX}:tag:"
+
+# Tag sets outlive the entries they point to, so an entry is always reachable from its tags until it expires.
+CACHE_TAG_TTL_SECONDS = int(os.environ.get("CACHE_TAG_TTL_SECONDS", 86400))
+
+# Arguments that differ on every call without changing the result. They're left out of cache keys.
+UNKEYED_ARGUMENT_TYPES = (AsyncSession, Session, Request, Response)
+
+# Tags added while a cached function runs, e.g. tags that depend on the loaded data rather than the arguments.
+pending_cache_tags: ContextVar[Tuple[str, ...]] = ContextVar("pending_cache_tags", default=())
+
+
+def get_tag_key(tag: str) -> str:
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def normalize_key_argument(value: Any) -> Any:
+    if isinstance(value, (UUID, Enum, date, datetime)):
+        return str(value.value if isinstance(value, Enum) else value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (list, tuple, set, frozenset)):
+        values = [normalize_key_argument(item) for item in value]
+        return sorted(values, key=repr) if isinstance(value, (set, frozenset)) else values
+    if isinstance(value, dict):
+        return {str(key): normalize_key_argument(item) for key, item in value.items()}
+    return value
+
+
+def get_key_arguments(func, args: tuple, kwargs: dict) -> dict:
+    """Bind a call's arguments to func's parameter names, dropping sessions, requests and responses.
+
+    Binding by name means f(id, session) and f(adventure_id=id, session=session) share a cache entry.
+    """
+    arguments = inspect.signature(func).bind_partial(*args, **kwargs).arguments
+    return {
+        name: normalize_key_argument(value)
+        for name, value in arguments.items()
+        if not isinstance(value, UNKEYED_ARGUMENT_TYPES)
+    }
+
+
+def tagged_key_builder(*tag_templates: str) -> Callable:
+    """Build a fastapi_cache key builder that keys entries on the cached function's domain arguments and tags each
+    entry with tags formatted from them.
+
+    The database session and the request and response objects are ignored, since they're different on every call.
+
+    Args:
+        *tag_templates (str): Tags with placeholders for argument names, e.g. "adventure:{adventure_id}".
+
+    Returns:
+        Callable: Key builder to pass as @cache(key_builder=...).
+    """
+    def key_builder(
+        func,
+        namespace: str = "",
+        *,
+        request=None,
+        response=None,
+        args: tuple = (),
+        kwargs: Optional[dict] = None
+    ) -> str:
+        arguments = get_key_arguments(func, args, kwargs or {})
+        digest = hashlib.md5(
+            f"{func.__module__}:{func.__name__}:".encode() + orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        key = f"{namespace}:{digest}"
+
+        if not tag_templates:
+            return key
+
+        tags = [template.format(**arguments) for template in tag_templates]
+        return f"{key}{TAG_SEPARATOR}{','.join(tags)}"
+
+    return key_builder
+
+
+def add_cache_tags(*tags: str) -> None:
+    """Tag the entry the surrounding @cache-decorated function is about to write, e.g. with the IDs of related rows it loaded."""
+    pending_cache_tags.set(pending_cache_tags.get() + tags)
+
+
+def get_key_tags(key: str) -> Tuple[str, ...]:
+    if TAG_SEPARATOR not in key:
+        return ()
+    return tuple(tag for tag in key.rsplit(TAG_SEPARATOR, 1)[1].split(",") if tag)
+
+
+def encode_cache_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class OrjsonCoder(Coder):
+    """Serializes cached values with orjson. Pydantic schemas are dumped to JSON and validated back into the cached
+    function's return annotation by fastapi_cache on a hit, so annotate cached functions with their schema type."""
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(value, default=encode_cache_default)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+class TaggedRedisBackend(RedisBackend):
+    """Redis backend that adds each cached key to a Redis set per tag, so entries can be invalidated by tag
+    without scanning the keyspace."""
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        tags = set(get_key_tags(key)) | set(pending_cache_tags.get())
+        pending_cache_tags.set(())
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=expire)
+            for tag in tags:
+                tag_key = get_tag_key(tag)
+                pipe.sadd(tag_key, key)
+                if expire:
+                    pipe.expire(tag_key, max(expire, CACHE_TAG_TTL_SECONDS))
+                else:
+                    pipe.persist(tag_key)
+            await pipe.execute()
+
+
+async def invalidate_cache_tags(*tags: str) -> int:
+    """Delete every cached entry tagged with any of tags.
+
+    Costs one round trip to read the tag sets and one pipelined round trip to delete their members, however many keys
+    are cached in total. Errors are logged rather than raised, so a Redis outage doesn't fail the write that triggered
+    the invalidation. Entries then expire on their own.
+
+    Args:
+        *tags (str): Tags to invalidate, e.g. "adventure:<id>".
+
+    Returns:
+        int: Number of cache entries deleted.
+    """
+    if not tags:
+        return 0
+
+    try:
+        redis = get_redis_client()
+        tag_keys = [get_tag_key(tag) for tag in tags]
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+
+        keys = set().union(*members)
+        if not keys:
+            return 0
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*keys)
+            # Remove only the members read above, so entries tagged in the meantime stay reachable.
+            for tag_key, tag_members in zip(tag_keys, members):
+                if tag_members:
+                    pipe.srem(tag_key, *tag_members)
+            results = await pipe.execute()
+
+        logger.info(f"Invalidated {results[0]} cache entries for tags {', '.join(tags)}")
+        return results[0]
+
+    except Exception as e:
+        logger.error("Error invalidating cache tags {}: {}", tags, str(e), exc_info=True)
+        return 0
+
+
+async def invalidate_adventure_cache(adventure_id: UUID) -> int:
+    return await invalidate_cache_tags(f"adventure:{adventure_id}")
+
+
+async def invalidate_ebook_cache(ebook_id: UUID) -> int:
+    return await invalidate_cache_tags(f"ebook:{ebook_id}")
@@ -1,12 +1,19 @@
-import boto3
 from app.core.config import settings
+from app.core.clients import clients
+
+
+def build_ses_client():
+    import boto3
+    return boto3.client(
+        "ses",
+        region_name=settings.AWS_S3_REGION_NAME,
+        aws_access_key_id=settings.EMAIL_USER_AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.EMAIL_USER_AWS_SECRET_ACCESS_KEY,
+    )
+
+
+clients.register("ses", build_ses_client)
 
-ses_client = boto3.client(
-    "ses",
-    region_name=settings.AWS_S3_REGION_NAME,
-    aws_access_key_id=settings.EMAIL_USER_AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.EMAIL_USER_AWS_SECRET_ACCESS_KEY,
-)
 
 def send_email(
     to_email: str, 
@@ -14,7 +21,7 @@ def send_email(
     body_html: str, 
     body_text: str = ""
 ):
-    response = ses_client.send_email(
+    response = clients.get("ses").send_email(
         Source="no-reply@wonderspaced.com",  
         Destination={"ToAddresses": [to_email]},
         Message={
@@ -2,7 +2,7 @@ from enum import Enum
 import os
 from pathlib import Path
 import re
-from typing import List, Optional
+from typing import IO, List, Optional, Union
 import uuid
 
 from docx import Document
@@ -144,26 +144,19 @@ def validate_file_extension(
         )
         
         
-def extract_pdf_text(file_path: str) -> str:
+def extract_pdf_text(file: Union[str, IO[bytes]]) -> str:
     try:
-        reader = PdfReader(file_path)
-        text = ""
-        for i, page in enumerate(reader.pages):
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
-        return text.strip()
+        reader = PdfReader(file)
+        return "\n".join(page.extract_text() or "" for page in reader.pages).strip()
     except Exception as e:
         logger.error(f"Error extracting text from pdf: {str(e)}")
         raise
 
 
-def extract_docx_text(file_path: str) -> str:
+def extract_docx_text(file: Union[str, IO[bytes]]) -> str:
     try:
-        doc = Document(file_path)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text.strip()
+        doc = Document(file)
+        return "\n".join(para.text for para in doc.paragraphs).strip()
     except Exception as e:
         logger.error(f"Error extracting text from docx: {str(e)}")
         raise
@@ -171,12 +164,25 @@ def extract_docx_text(file_path: str) -> str:
 
 def extract_text(
     extension: str,
-    file_path: str
+    file: Union[str, IO[bytes]]
 ) -> str:
+    """Extract the text of a PDF or DOCX document.
+
+    Args:
+        extension (str): File extension, "pdf" or "docx".
+        file (Union[str, IO[bytes]]): Path to the document, or a binary file object holding it, e.g. a buffer from
+            download_file_from_gcs_to_buffer. File objects are read from their current position.
+
+    Raises:
+        ValidationError: If extension is neither "pdf" nor "docx".
+
+    Returns:
+        str: The document's text.
+    """
     if extension == FileExtension.DOCX.value:
-        return extract_docx_text(file_path)
+        return extract_docx_text(file)
     elif extension == FileExtension.PDF.value:
-        return extract_pdf_text(file_path)
+        return extract_pdf_text(file)
     else:
         logger.error(f"Invalid extension: {extension}")
-        raise ValidationError(message=f"Invalid extension: {extension}")
\ No newline at end of file
+        raise ValidationError(message=f"Invalid extension: {extension}")
@@ -1,28 +1,153 @@
+from collections import defaultdict
 from datetime import timedelta
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
-import requests
+from typing import List
+from tempfile import SpooledTemporaryFile
 from urllib.parse import urlparse
 
-from app.core.exceptions import InternalServerError, ValidationError
+from app.core.clients import clients
+from app.core.exceptions import ErrorCode, InternalServerError, ValidationError
 from app.core.logging import logger
 from app.core.config import settings
+from app.schemas.file_upload import UploadKind
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
-from google.oauth2 import service_account
 
-from app.utils.file import FileExtension, generate_unique_filename, get_file_content_type, validate_file_extension
+from app.utils.file import FileExtension, convert_from_bytes_to_mb, generate_unique_filename, get_file_content_type, get_file_extension, validate_file_extension
+from app.utils.ttl_cache import TTLCache
     
 
 GCS_PUBLIC_OBJECT_BASE_URL = "https://storage.googleapis.com/"
+GCS_HTTP_POOL_CONNECTIONS = int(os.environ.get("GCS_HTTP_POOL_CONNECTIONS", 4))
+GCS_HTTP_POOL_MAXSIZE = int(os.environ.get("GCS_HTTP_POOL_MAXSIZE", 32))
+# Downloads larger than GCS_DOWNLOAD_MAX_BYTES are rejected. Those larger than GCS_DOWNLOAD_SPOOL_BYTES spill from memory to a temp file.
+GCS_DOWNLOAD_MAX_BYTES = int(os.environ.get("GCS_DOWNLOAD_MAX_BYTES", 20 * 1024 * 1024))
+GCS_DOWNLOAD_SPOOL_BYTES = int(os.environ.get("GCS_DOWNLOAD_SPOOL_BYTES", 20 * 1024 * 1024))
+GCS_DOWNLOAD_TIMEOUT_SECONDS = int(os.environ.get("GCS_DOWNLOAD_TIMEOUT_SECONDS", 600))
+# The GCS batch endpoint accepts at most 100 calls per request.
+GCS_BATCH_MAX_CALLS = 100
+GCS_METADATA_CACHE_SIZE = int(os.environ.get("GCS_METADATA_CACHE_SIZE", 1024))
+GCS_METADATA_CACHE_TTL_SECONDS = int(os.environ.get("GCS_METADATA_CACHE_TTL_SECONDS", 60))
+
+# Object metadata keyed by public URL. Upload and processing flows look up the same object several times in a short window.
+gcs_metadata_cache = TTLCache(maxsize=GCS_METADATA_CACHE_SIZE, ttl_seconds=GCS_METADATA_CACHE_TTL_SECONDS)
+
+IMAGE_EXTENSIONS = [FileExtension.JPG.value, FileExtension.JPEG.value, FileExtension.PNG.value]
+
+# Allowed extensions, settings folder and settings bucket for each kind of upload. Folders and buckets are
+# settings attribute names so the secrets behind them are only read when a URL is signed.
+UPLOAD_KIND_RULES = {
+    UploadKind.VIDEO: ([FileExtension.MP4.value], "VIDEOS_FOLDER", "GCS_TEMP_FILES_BUCKET"),
+    UploadKind.EBOOK: ([FileExtension.PDF.value], "EBOOKS_FOLDER", "GCS_PERMANENT_FILES_BUCKET"),
+    UploadKind.THUMBNAIL: (IMAGE_EXTENSIONS, "THUMBNAILS_FOLDER", "GCS_PERMANENT_FILES_BUCKET"),
+    UploadKind.AVATAR: (IMAGE_EXTENSIONS, "AVATARS_FOLDER", "GCS_PERMANENT_FILES_BUCKET"),
+    UploadKind.THEME_ICON: (IMAGE_EXTENSIONS, "THEME_ICONS_FOLDER", "GCS_PERMANENT_FILES_BUCKET"),
+    UploadKind.QUIZ: ([FileExtension.PDF.value, FileExtension.DOCX.value], "QUIZZES_FOLDER", "GCS_TEMP_FILES_BUCKET"),
+}
+
+
+def build_storage_admin_credentials():
+    from google.oauth2 import service_account
+
+    storage_admin_sa_key_json_str = settings.STORAGE_ADMIN_SERVICE_ACCOUNT_KEY
+    storage_admin_sa_info = json.loads(storage_admin_sa_key_json_str)
+    return service_account.Credentials.from_service_account_info(storage_admin_sa_info)
+
+
+clients.register("gcs_credentials", build_storage_admin_credentials)
+
+
+def get_storage_admin_credentials():
+    """Storage admin service account credentials, loaded on first use."""
+    return clients.get("gcs_credentials")
+
+
+def build_storage_client() -> storage.Client:
+    """Build the process-wide storage client on an HTTP session whose connection pool is sized for concurrent GCS calls."""
+    from google.auth.credentials import with_scopes_if_required
+    from google.auth.transport.requests import AuthorizedSession
+    from requests.adapters import HTTPAdapter
+
+    # Bucket handles hold the client they were made on, so handles of a client that was reset must not be reused.
+    get_bucket.cache_clear()
+
+    credentials = with_scopes_if_required(get_storage_admin_credentials(), storage.Client.SCOPE)
+    http = AuthorizedSession(credentials)
+    http.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=GCS_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=GCS_HTTP_POOL_MAXSIZE,
+        )
+    )
+    return storage.Client(
+        credentials=credentials,
+        project=credentials.project_id,
+        _http=http
+    )
+
+
+clients.register("gcs", build_storage_client)
+
+
+def get_storage_client() -> storage.Client:
+    """Shared storage client. Reusing it keeps TLS connections to GCS warm between calls."""
+    return clients.get("gcs")
+
+
+@lru_cache(maxsize=32)
+def get_bucket(bucket_name: str) -> storage.Bucket:
+    """Cached bucket handle on the shared storage client. Creating a handle doesn't make a request."""
+    return get_storage_client().bucket(bucket_name)
+
 
-storage_admin_sa_key_json_str = settings.STORAGE_ADMIN_SERVICE_ACCOUNT_KEY
-storage_admin_sa_info = json.loads(storage_admin_sa_key_json_str)
-storage_admin_sa_credentials = service_account.Credentials.from_service_account_info(storage_admin_sa_info)
-project = storage_admin_sa_credentials.project_id
+def get_gcs_pool_stats() -> dict:
+    """Connection pool usage of the shared storage client, per host.
+
+    Returns:
+        dict: Maps each host to the number of connections opened, requests made, idle connections and the pool's max size.
+        Empty if the storage client hasn't been built yet.
+    """
+    if not clients.is_built("gcs"):
+        return {}
+
+    adapter = get_storage_client()._http.get_adapter(GCS_PUBLIC_OBJECT_BASE_URL)
+    stats = {}
+    for key in list(adapter.poolmanager.pools.keys()):
+        pool = adapter.poolmanager.pools.get(key)
+        if pool is None:
+            continue
+        stats[pool.host] = {
+            "connections_opened": pool.num_connections,
+            "requests": pool.num_requests,
+            "idle_connections": pool.pool.qsize() if pool.pool else 0,
+            "max_size": pool.pool.maxsize if pool.pool else 0,
+        }
+    return stats
 
     
 
+def parse_gcs_public_url(gcs_public_url: str) -> tuple:
+    """Split a public GCS URL into its bucket and blob names.
+
+    Args:
+        gcs_public_url (str): URL of the format "https://storage.googleapis.com/{bucket_name}/{folder}/{filename}"
+
+    Raises:
+        ValueError: If the URL has no blob path after the bucket name.
+
+    Returns:
+        tuple: (bucket_name, blob_name)
+    """
+    path_parts = urlparse(gcs_public_url).path.lstrip("/").split("/", 1)
+    if len(path_parts) < 2 or not path_parts[1]:
+        raise ValueError(f"Invalid GCS URL format: {gcs_public_url}")
+    return path_parts[0], path_parts[1]
+
+
 def delete_blob_from_gcs(blob_public_url: str) -> None:
     """Delete from blob from GCS by getting the blob and bucket names from its public GCS URL.
 
@@ -34,27 +159,17 @@ def delete_blob_from_gcs(blob_public_url: str) -> None:
     """
     
     try:
-        storage_client = storage.Client(
-            credentials=storage_admin_sa_credentials,
-            project=project
-        )
-        parsed_url = urlparse(blob_public_url)
-        
-        # Extract bucket name & blob path
-        path_parts = parsed_url.path.lstrip("/").split("/", 1)
-        if len(path_parts) < 2:
-            raise ValueError(f"Invalid GCS URL format: {blob_public_url}")
-
-        bucket_name, blob_name = path_parts
-        bucket = storage_client.bucket(bucket_name)
+        bucket_name, blob_name = parse_gcs_public_url(blob_public_url)
+        bucket = get_bucket(bucket_name)
         blob = bucket.blob(blob_name)
 
         logger.info(f"Deleting: {bucket_name}/{blob_name}")
+        gcs_metadata_cache.invalidate(blob_public_url)
 
-        if blob.exists():
+        try:
             blob.delete()
             logger.info(f"File {blob_name} deleted from {bucket_name}.")
-        else:
+        except NotFound:
             logger.info(f"File {blob_name} not found in {bucket_name}.")
 
     except Exception as e:
@@ -62,9 +177,69 @@ def delete_blob_from_gcs(blob_public_url: str) -> None:
         raise 
 
 
+def delete_blobs_from_gcs(blob_public_urls: List[str]) -> dict:
+    """Delete many blobs from GCS through the batch endpoint, sending up to GCS_BATCH_MAX_CALLS deletes per HTTP request.
+
+    URLs are grouped by bucket. A blob that doesn't exist counts as deleted. Empty URLs are skipped.
+
+    Args:
+        blob_public_urls (List[str]): Public URLs of the blobs to delete.
+
+    Raises:
+        ValueError: If a URL isn't a valid public GCS URL.
+
+    Returns:
+        dict: Contains the keys "deleted" (URLs deleted or already missing) and "failed" (maps each URL that couldn't
+        be deleted to its error message).
+    """
+    by_bucket = defaultdict(list)
+    for url in dict.fromkeys(url for url in blob_public_urls if url):
+        bucket_name, blob_name = parse_gcs_public_url(url)
+        by_bucket[bucket_name].append((url, blob_name))
+
+    deleted = []
+    failed = {}
+    client = get_storage_client()
+
+    for bucket_name, blobs in by_bucket.items():
+        bucket = get_bucket(bucket_name)
+
+        for start in range(0, len(blobs), GCS_BATCH_MAX_CALLS):
+            chunk = blobs[start:start + GCS_BATCH_MAX_CALLS]
+            for url, _ in chunk:
+                gcs_metadata_cache.invalidate(url)
+
+            try:
+                # Calls made inside the block are queued and sent as one request when it exits.
+                with client.batch(raise_exception=False) as batch:
+                    for _, blob_name in chunk:
+                        bucket.delete_blob(blob_name)
+                # delete_blob returns nothing, so per-blob results are only available from the batch itself.
+                responses = batch._responses
+
+            except Exception as e:
+                logger.error(f"Error deleting batch of {len(chunk)} blobs from {bucket_name}: {e}")
+                failed.update({url: str(e) for url, _ in chunk})
+                continue
+
+            # Sub-responses come back in the order the calls were queued.
+            for (url, _), response in zip(chunk, responses):
+                if response.status_code < 300 or response.status_code == 404:
+                    deleted.append(url)
+                else:
+                    failed[url] = f"{response.status_code}: {response.text}"
+
+    logger.info(f"Deleted {len(deleted)} blobs from GCS, {len(failed)} failed.")
+    return {
+        "deleted": deleted,
+        "failed": failed
+    }
+
+
 def get_file_metadata_from_gcs_public_url(gcs_public_url: str)-> dict:
     
-    """Retrieves file metadata (name, extension, size) from a public GCS URL.
+    """Retrieves file metadata (name, extension, size) from a public GCS URL. Results are cached by URL for
+    GCS_METADATA_CACHE_TTL_SECONDS, so repeated lookups of the same object don't go back to GCS.
 
     Args:
         gcs_url (str): The public GCS URL of the file
@@ -78,34 +253,32 @@ def get_file_metadata_from_gcs_public_url(gcs_public_url: str)-> dict:
     """
 
     try:
-        storage_client = storage.Client(
-            credentials=storage_admin_sa_credentials,
-            project=project
-        )
-        parsed_url = urlparse(gcs_public_url)
-        # Extract bucket name & blob path
-        path_parts = parsed_url.path.lstrip("/").split("/", 1)
-        if len(path_parts) < 2:
-            raise ValueError(f"Invalid GCS URL format: {gcs_public_url}")
-
-        bucket_name, blob_name = path_parts
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        bucket_name, blob_name = parse_gcs_public_url(gcs_public_url)
+
+        metadata = gcs_metadata_cache.get(gcs_public_url)
+        if metadata is not None:
+            return dict(metadata)
 
-        if not blob.exists():
+        blob = get_bucket(bucket_name).blob(blob_name)
+
+        # One GET for the object's metadata. A missing object comes back as NotFound, so no separate exists() call is needed.
+        try:
+            blob.reload()
+        except NotFound:
             raise FileNotFoundError(f"GCS object not found: {gcs_public_url}")
-        
-        blob.reload()
 
         file_name = os.path.basename(blob_name)
         file_extension = os.path.splitext(file_name)[1].lstrip(".").lower()
         file_size = blob.size
 
-        return {
+        metadata = {
             "name": file_name,
             "extension": file_extension,
             "size": file_size,
         }
+        gcs_metadata_cache.set(gcs_public_url, metadata)
+
+        return dict(metadata)
 
     except ValueError as e:
         logger.error(f"Invalid GCS URL: {e}")
@@ -136,27 +309,93 @@ def download_file_from_gcs(
     """
 
     try:
-        response = requests.get(public_gcs_url, stream=True, timeout=600) 
-        response.raise_for_status()  
+        bucket_name, blob_name = parse_gcs_public_url(public_gcs_url)
 
         # Create necessary directories
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(local_path, "wb") as f:  
-            for chunk in response.iter_content(chunk_size=8192): 
-                f.write(chunk)
-
+        # Downloaded on the shared storage client, so the connection to GCS is reused.
+        get_bucket(bucket_name).blob(blob_name).download_to_filename(local_path, timeout=GCS_DOWNLOAD_TIMEOUT_SECONDS)
         return local_path
 
-    except requests.exceptions.RequestException as e:
+    except Exception as e:
         logger.error(f"Error downloading from GCS: {str(e)}", exc_info=True)
         raise
 
+    
+class SizeCappedWriter:
+    """Writes to a file object, raising once more than max_bytes have been written."""
+
+    def __init__(self, file, max_bytes: int):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            raise_file_too_large(self.max_bytes)
+        return self.file.write(data)
+
+
+def download_file_from_gcs_to_buffer(
+    public_gcs_url: str,
+    max_bytes: int = GCS_DOWNLOAD_MAX_BYTES
+) -> SpooledTemporaryFile:
+    """Streams a file from a public GCS URL into a size-capped buffer instead of a file on disk (synchronous).
+
+    The buffer stays in memory up to GCS_DOWNLOAD_SPOOL_BYTES. It's downloaded on the shared storage client. Objects
+    whose cached metadata already shows them to be too large aren't downloaded, and the download stops as soon as it
+    passes max_bytes. The caller must close the buffer.
+
+    Args:
+        public_gcs_url (str): File's public GCS URL
+        max_bytes (int, optional): Largest file accepted. Defaults to GCS_DOWNLOAD_MAX_BYTES.
+
+    Raises:
+        ValueError: If GCS URL format is invalid.
+        FileNotFoundError: If GCS object not found.
+        ValidationError: If the file is larger than max_bytes.
+
+    Returns:
+        SpooledTemporaryFile: Buffer holding the file's contents, positioned at the start.
+    """
+    bucket_name, blob_name = parse_gcs_public_url(public_gcs_url)
+
+    metadata = gcs_metadata_cache.get(public_gcs_url)
+    if metadata is not None and (metadata["size"] or 0) > max_bytes:
+        raise_file_too_large(max_bytes)
+
+    buffer = SpooledTemporaryFile(max_size=GCS_DOWNLOAD_SPOOL_BYTES)
+
+    try:
+        blob = get_bucket(bucket_name).blob(blob_name)
+        try:
+            blob.download_to_file(SizeCappedWriter(buffer, max_bytes), timeout=GCS_DOWNLOAD_TIMEOUT_SECONDS)
+        except NotFound:
+            raise FileNotFoundError(f"GCS object not found: {public_gcs_url}")
+
+        buffer.seek(0)
+        return buffer
+
+    except (FileNotFoundError, ValidationError) as e:
+        buffer.close()
+        logger.error(e)
+        raise
+
     except Exception as e:
+        buffer.close()
         logger.error(f"Error downloading from GCS: {str(e)}", exc_info=True)
         raise
 
-    
+
+def raise_file_too_large(max_bytes: int) -> None:
+    raise ValidationError(
+        error_code=ErrorCode.FILE_TOO_LARGE.value,
+        message=f"File is larger than the {convert_from_bytes_to_mb(max_bytes)} MB limit."
+    )
+
+
 def get_gcs_upload_signed_url(
     filename: str,
     folder: str,
@@ -179,12 +418,8 @@ def get_gcs_upload_signed_url(
         dict: Contains the keys, "upload_url" and "public_url". Upload file to GCS via the upload URL, and access via the public URL once retrieved.
     """
     try:        
-        storage_client = storage.Client(
-            credentials=storage_admin_sa_credentials,
-            project=project
-        )
         
-        bucket = storage_client.bucket(bucket_name) 
+        bucket = get_bucket(bucket_name)
         blob = bucket.blob(f"{folder}/{filename}")
 
         upload_url = blob.generate_signed_url(
@@ -208,74 +443,47 @@ def get_gcs_upload_signed_url(
         raise InternalServerError()
 
 
+def get_upload_target(kind: UploadKind, filename: str) -> dict:
+    """Work out where a file of the given kind is uploaded to, from UPLOAD_KIND_RULES. Doesn't check its extension.
+
+    Returns:
+        dict: The keys "filename" (unique name to upload as), "folder", "content_type" and "bucket_name", i.e. the
+        arguments of get_gcs_upload_signed_url.
+    """
+    _, folder_setting, bucket_setting = UPLOAD_KIND_RULES[kind]
+    return {
+        "filename": generate_unique_filename(filename),
+        "folder": getattr(settings, folder_setting),
+        "content_type": get_file_content_type(filename),
+        "bucket_name": getattr(settings, bucket_setting)
+    }
+
+
+def get_upload_kind_signed_url(kind: UploadKind, filename: str) -> dict:
+    """Check a file's extension against the rules of its kind, then get its signed upload URL and public URL.
+
+    Raises:
+        ValidationError: If the file's extension isn't allowed for its kind.
+    """
+    validate_file_extension(filename, UPLOAD_KIND_RULES[kind][0])
+    return get_gcs_upload_signed_url(**get_upload_target(kind, filename))
+
+
 def get_avatar_signed_url(filename) -> dict:
-    try:
-        validate_file_extension(
-            filename, 
-            [FileExtension.JPG.value, FileExtension.JPEG.value, FileExtension.PNG.value]
-        )        
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.AVATARS_FOLDER, 
-            content_type, 
-            settings.GCS_PERMANENT_FILES_BUCKET
-        )
-    except ValidationError as e:
-        raise
+    return get_upload_kind_signed_url(UploadKind.AVATAR, filename)
 
 
 def get_thumbnail_signed_url(filename: str) -> dict:
-    try:
-        validate_file_extension(
-            filename, 
-            [FileExtension.JPG.value, FileExtension.JPEG.value, FileExtension.PNG.value]
-        )        
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.THUMBNAILS_FOLDER, 
-            content_type, 
-            settings.GCS_PERMANENT_FILES_BUCKET
-        )
-    except ValidationError as e:
-        raise
+    return get_upload_kind_signed_url(UploadKind.THUMBNAIL, filename)
 
 
 def get_theme_icon_signed_url(filename: str) -> dict:
-    try:
-        validate_file_extension(
-            filename, 
-            [FileExtension.JPG.value, FileExtension.JPEG.value, FileExtension.PNG.value]
-        )
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.THEME_ICONS_FOLDER, 
-            content_type, 
-            settings.GCS_PERMANENT_FILES_BUCKET
-        )
-    except ValidationError as e:
-        raise
+    return get_upload_kind_signed_url(UploadKind.THEME_ICON, filename)
     
 
 def get_video_signed_url(filename: str) -> dict:
     try:
-        validate_file_extension(
-            filename, 
-            [FileExtension.MP4.value]
-        )
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.VIDEOS_FOLDER, 
-            content_type, 
-            settings.GCS_TEMP_FILES_BUCKET
-        )
+        return get_upload_kind_signed_url(UploadKind.VIDEO, filename)
     except ValidationError as e:
         logger.error("Video extension not allowed: {}", str(e), exc_info=True)
         raise
@@ -283,18 +491,7 @@ def get_video_signed_url(filename: str) -> dict:
 
 def get_ebook_signed_url(filename) -> dict:
     try:       
-        validate_file_extension(
-            filename, 
-            [FileExtension.PDF.value]
-        )
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.EBOOKS_FOLDER, 
-            content_type, 
-            settings.GCS_PERMANENT_FILES_BUCKET
-        )
+        return get_upload_kind_signed_url(UploadKind.EBOOK, filename)
     except ValidationError as e:
         logger.error("eBook extension not allowed: {}", str(e), exc_info=True)
         raise
@@ -302,18 +499,48 @@ def get_ebook_signed_url(filename) -> dict:
    
 def get_quiz_signed_url(filename) -> dict:
     try:       
-        validate_file_extension(
-            filename, 
-            [FileExtension.PDF.value, FileExtension.DOCX.value]
-        )
-        content_type = get_file_content_type(filename)
-        filename = generate_unique_filename(filename)
-        return get_gcs_upload_signed_url(
-            filename, 
-            settings.QUIZZES_FOLDER, 
-            content_type, 
-            settings.GCS_TEMP_FILES_BUCKET
-        )
+        return get_upload_kind_signed_url(UploadKind.QUIZ, filename)
     except ValidationError as e:
         logger.error("Quiz extension not allowed: {}", str(e), exc_info=True)
-        raise
\ No newline at end of file
+        raise
+
+
+def prepare_upload_targets(files: list) -> list:
+    """Validate a batch of files to upload and work out where each one goes, before any URL is signed.
+
+    Every file is checked, so one request reports all the files with unsupported extensions instead of the first.
+
+    Args:
+        files (list): Items with "kind" (UploadKind) and "filename" attributes, e.g. schemas.file_upload.UploadFile.
+
+    Raises:
+        ValidationError: If any file's extension isn't allowed for its kind. "data" lists each invalid file.
+
+    Returns:
+        list: One dict per file, in order, as returned by get_upload_target.
+    """
+    targets = []
+    errors = []
+
+    for index, file in enumerate(files):
+        allowed_extensions = UPLOAD_KIND_RULES[file.kind][0]
+
+        if get_file_extension(file.filename) not in allowed_extensions:
+            errors.append({
+                "index": index,
+                "kind": file.kind.value,
+                "filename": file.filename,
+                "allowed_extensions": allowed_extensions
+            })
+            continue
+
+        targets.append(get_upload_target(file.kind, file.filename))
+
+    if errors:
+        raise ValidationError(
+            error_code=ErrorCode.UNSUPPORTED_FILE_TYPE.value,
+            message=f"{len(errors)} of {len(files)} files have unsupported extensions.",
+            data={"files": errors}
+        )
+
+    return targets
@@ -0,0 +1,176 @@
+import asyncio
+from contextlib import asynccontextmanager
+import functools
+import inspect
+import os
+import time
+import typing
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+from pydantic import TypeAdapter
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.logging import logger
+from app.core.redis_pool import get_redis_client
+from app.db.session import get_session
+from app.utils.cache import CACHE_PREFIX, OrjsonCoder, add_cache_tags, get_key_arguments, pending_cache_tags
+
+
+# How long an instance may hold the load lock for a key. Followers stop waiting and load themselves after this.
+SINGLE_FLIGHT_LOCK_TTL_MS = int(os.environ.get("SINGLE_FLIGHT_LOCK_TTL_MS", 10000))
+SINGLE_FLIGHT_POLL_INTERVAL_SECONDS = float(os.environ.get("SINGLE_FLIGHT_POLL_INTERVAL_SECONDS", 0.05))
+# The leader's result is kept just long enough for followers polling on other instances to read it.
+SINGLE_FLIGHT_RESULT_TTL_MS = int(os.environ.get("SINGLE_FLIGHT_RESULT_TTL_MS", 5000))
+
+# Deletes the lock only if it's still held by the token that took it, so a leader that overran the TTL can't release
+# the lock of the instance that took over.
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Loads in flight in this process by key.
+in_flight: Dict[str, asyncio.Task] = {}
+
+# Sessions of shared loads, which mustn't borrow a caller's session since the caller's request may end first.
+loader_session = asynccontextmanager(get_session)
+
+
+def get_lock_key(key: str) -> str:
+    return f"{CACHE_PREFIX}:single-flight:lock:{key}"
+
+
+def get_result_key(key: str) -> str:
+    return f"{CACHE_PREFIX}:single-flight:result:{key}"
+
+
+async def load_with_redis_lock(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    type_: Any = None
+) -> Any:
+    """Run loader on one instance at a time for key. Instances that don't get the lock wait for the leader's result.
+
+    The result key is checked before every attempt at the lock and again after taking it, since the leader publishes
+    its result before releasing the lock and a follower that takes the freed lock would otherwise load again.
+
+    Falls back to running loader directly if Redis is unavailable, if the leader doesn't publish a result before its
+    lock expires, or if the lock is released without a result, e.g. because the leader's load failed.
+    """
+    def decode(cached: bytes) -> Any:
+        value = OrjsonCoder.decode(cached)
+        return TypeAdapter(type_).validate_python(value) if type_ is not None else value
+
+    try:
+        redis = get_redis_client()
+        lock_key = get_lock_key(key)
+        result_key = get_result_key(key)
+        token = uuid.uuid4().hex
+
+        deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TTL_MS / 1000
+        while True:
+            cached = await redis.get(result_key)
+            if cached is not None:
+                return decode(cached)
+
+            if await redis.set(lock_key, token, nx=True, px=SINGLE_FLIGHT_LOCK_TTL_MS):
+                break
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for single-flight load of {key}, loading it here")
+                return await loader()
+            await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL_SECONDS)
+
+    except Exception as e:
+        logger.error("Error coordinating single-flight load of {}: {}", key, str(e), exc_info=True)
+        return await loader()
+
+    try:
+        # The previous leader may have published between the read above and taking the lock.
+        try:
+            cached = await redis.get(result_key)
+            if cached is not None:
+                return decode(cached)
+        except Exception as e:
+            logger.error("Error reading single-flight result of {}: {}", key, str(e), exc_info=True)
+
+        value = await loader()
+        try:
+            await redis.set(result_key, OrjsonCoder.encode(value), px=SINGLE_FLIGHT_RESULT_TTL_MS)
+        except Exception as e:
+            logger.error("Error publishing single-flight result of {}: {}", key, str(e), exc_info=True)
+        return value
+
+    finally:
+        try:
+            await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.error("Error releasing single-flight lock of {}: {}", key, str(e), exc_info=True)
+
+
+def single_flight(key_template: str, distributed: bool = False) -> Callable:
+    """Coalesce concurrent calls of an async loader that share a key into one call.
+
+    Within a process, callers await the same task, so cancelling one caller doesn't cancel the load for the others.
+    An AsyncSession argument is replaced by a session the task opens itself, so the load doesn't fail for everyone if
+    the first caller's request ends and its session is closed. With distributed=True, a Redis lock also makes instances
+    wait for one leader and read its result instead of loading too. Cache tags added by the loader with add_cache_tags
+    are applied for every caller.
+
+    Place it below @cache, so only cache misses are coalesced:
+
+        @cache(expire=300, key_builder=tagged_key_builder("adventure:{adventure_id}"))
+        @single_flight("adventure:{adventure_id}", distributed=True)
+        async def get_adventure_query_result(adventure_id: UUID, session: AsyncSession) -> Optional[AdventureDetail]:
+
+    Args:
+        key_template (str): Key with placeholders for argument names, e.g. "adventure:{adventure_id}".
+            Calls whose keys differ run independently.
+        distributed (bool, optional): Also coalesce across instances. Defaults to False.
+
+    Returns:
+        Callable: Decorator for the loader.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        type_hints = typing.get_type_hints(func)
+        return_type = type_hints.get("return")
+        session_param = next((name for name, hint in type_hints.items() if hint is AsyncSession), None)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = f"{func.__module__}.{func.__name__}:{key_template.format(**get_key_arguments(func, args, kwargs))}"
+
+            task = in_flight.get(key)
+            if task is None:
+                async def load_on_own_session():
+                    if session_param is None:
+                        return await func(*args, **kwargs)
+
+                    bound = signature.bind(*args, **kwargs)
+                    async with loader_session() as session:
+                        bound.arguments[session_param] = session
+                        return await func(*bound.args, **bound.kwargs)
+
+                async def load():
+                    pending_cache_tags.set(())
+                    if distributed:
+                        value = await load_with_redis_lock(key, load_on_own_session, return_type)
+                    else:
+                        value = await load_on_own_session()
+                    return value, pending_cache_tags.get()
+
+                task = asyncio.ensure_future(load())
+                in_flight[key] = task
+                task.add_done_callback(lambda done: in_flight.pop(key) if in_flight.get(key) is done else None)
+
+            value, tags = await asyncio.shield(task)
+            add_cache_tags(*tags)
+            return value
+
+        return wrapper
+
+    return decorator
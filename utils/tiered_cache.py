@@ -0,0 +1,272 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.logging import logger
+from app.core.redis_pool import get_redis_client
+from app.utils.cache import CACHE_PREFIX, CACHE_TAG_TTL_SECONDS, OrjsonCoder, get_tag_key, invalidate_cache_tags
+from app.utils.ttl_cache import TTLCache
+
+
+TIERED_CACHE_LOCAL_MAXSIZE = int(os.environ.get("TIERED_CACHE_LOCAL_MAXSIZE", 1024))
+# Upper bound on how stale an instance's in-process copy can get if it misses an eviction message.
+TIERED_CACHE_LOCAL_TTL_SECONDS = float(os.environ.get("TIERED_CACHE_LOCAL_TTL_SECONDS", 30))
+TIERED_CACHE_REDIS_TTL_SECONDS = int(os.environ.get("TIERED_CACHE_REDIS_TTL_SECONDS", 3600))
+TIERED_CACHE_RESUBSCRIBE_SECONDS = float(os.environ.get("TIERED_CACHE_RESUBSCRIBE_SECONDS", 5))
+TIERED_CACHE_CHANNEL = f"{CACHE_PREFIX}:tiered:evictions"
+
+# Every TieredCache in the process by name, so eviction messages from other instances can find the cache they target.
+tiered_caches: Dict[str, "TieredCache"] = {}
+
+_MISSING = object()
+
+# Writes an entry only if its version isn't lower than the stored one, so a value loaded before a change can't replace
+# the value written through by that change. The version is kept in a companion key, which expires with the entry.
+# KEYS: entry, version. ARGV: encoded value, version, TTL (seconds). Returns 1 if written, 0 if a newer entry is stored.
+VERSIONED_SET_SCRIPT = """
+local stored = redis.call("GET", KEYS[2])
+if stored and tonumber(stored) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[3])
+redis.call("SET", KEYS[2], ARGV[2], "EX", ARGV[3])
+return 1
+"""
+
+
+class TieredCache:
+    """Cache for small, rarely changing data such as avatars, series and themes.
+
+    Reads are served from an in-process LRU first, then from Redis, then from the loader. Invalidating an entry deletes
+    it from Redis and publishes an eviction message, so every instance drops its in-process copy too.
+
+    With a version function, Redis entries are only ever replaced by values with an equal or higher version, and set()
+    writes a changed value through instead of deleting it. A load that read the old value before the change can then no
+    longer put it back in Redis after the change.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        local_maxsize: int = TIERED_CACHE_LOCAL_MAXSIZE,
+        local_ttl_seconds: float = TIERED_CACHE_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds: int = TIERED_CACHE_REDIS_TTL_SECONDS,
+        version: Optional[Callable[[Any], int]] = None,
+        cache_none: bool = True
+    ):
+        if name in tiered_caches:
+            raise ValueError(f"A tiered cache named {name} already exists")
+
+        self.name = name
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.version = version
+        self.cache_none = cache_none
+        self._versioned_set_script = None
+        self._versioned_set_script_client = None
+        self.local = TTLCache(maxsize=local_maxsize, ttl_seconds=local_ttl_seconds)
+        tiered_caches[name] = self
+
+    def get_redis_key(self, key: Hashable) -> str:
+        return f"{CACHE_PREFIX}:tiered:{self.name}:{key}"
+
+    def get_version_key(self, key: Hashable) -> str:
+        return f"{self.get_redis_key(key)}:version"
+
+    def get_tag(self) -> str:
+        return f"tiered:{self.name}"
+
+    def get_versioned_set_script(self):
+        client = get_redis_client()
+        if self._versioned_set_script is None or self._versioned_set_script_client is not client:
+            self._versioned_set_script = client.register_script(VERSIONED_SET_SCRIPT)
+            self._versioned_set_script_client = client
+        return self._versioned_set_script
+
+    async def read(self, key: Hashable, type_: Any = None) -> Any:
+        """Read an entry from Redis into the in-process cache. Returns _MISSING if Redis doesn't have it."""
+        cached = await get_redis_client().get(self.get_redis_key(key))
+        if cached is None:
+            return _MISSING
+
+        value = OrjsonCoder.decode(cached)
+        if type_ is not None:
+            value = TypeAdapter(type_).validate_python(value)
+        self.local.set(key, value)
+        return value
+
+    async def write(self, key: Hashable, value: Any) -> bool:
+        """Write an entry to Redis.
+
+        Returns:
+            bool: False if the cache is versioned and Redis holds a higher version, in which case nothing is written.
+        """
+        redis_key = self.get_redis_key(key)
+        tag_key = get_tag_key(self.get_tag())
+        encoded = OrjsonCoder.encode(value)
+
+        if self.version is not None:
+            written = await self.get_versioned_set_script()(
+                keys=[redis_key, self.get_version_key(key)],
+                args=[encoded, self.version(value), self.redis_ttl_seconds]
+            )
+            if not written:
+                return False
+
+        async with get_redis_client().pipeline(transaction=False) as pipe:
+            if self.version is None:
+                pipe.set(redis_key, encoded, ex=self.redis_ttl_seconds)
+                # Tagged so clear() can find every Redis entry of this cache without scanning the keyspace.
+                pipe.sadd(tag_key, redis_key)
+            else:
+                pipe.sadd(tag_key, redis_key, self.get_version_key(key))
+            pipe.expire(tag_key, max(self.redis_ttl_seconds, CACHE_TAG_TTL_SECONDS))
+            await pipe.execute()
+        return True
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        type_: Any = None
+    ) -> Any:
+        """Get a value, loading and caching it on a miss. None is cached like any other value unless the cache was
+        created with cache_none=False.
+
+        Redis errors are logged and the value is loaded instead, so an outage only costs the queries the cache saves.
+
+        Args:
+            key (Hashable): Key within this cache, e.g. a lowercased theme name.
+            loader (Callable[[], Awaitable[Any]]): Loads the value on a miss, e.g. from the database.
+            type_ (Any, optional): Type to validate values read from Redis into, e.g. List[AvatarResponse].
+                Defaults to None, which returns the decoded JSON.
+
+        Returns:
+            Any: The cached or loaded value. Callers share it, so they mustn't mutate it.
+        """
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        redis_key = self.get_redis_key(key)
+        try:
+            value = await self.read(key, type_)
+            if value is not _MISSING:
+                return value
+        except Exception as e:
+            logger.error("Error reading tiered cache {}: {}", redis_key, str(e), exc_info=True)
+
+        value = await loader()
+        if value is None and not self.cache_none:
+            return value
+
+        try:
+            if not await self.write(key, value):
+                # Loaded before a change that has since been written through, so the written value is returned instead.
+                newer = await self.read(key, type_)
+                return value if newer is _MISSING else newer
+        except Exception as e:
+            logger.error("Error writing tiered cache {}: {}", redis_key, str(e), exc_info=True)
+
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        """Write a changed value through to Redis and drop the in-process copies every other instance holds, so they
+        read the new value from Redis.
+
+        Use instead of invalidate() on versioned caches, after the change is committed.
+        """
+        self.local.set(key, value)
+
+        try:
+            await self.write(key, value)
+            await publish_eviction(self.name, [str(key)])
+        except Exception as e:
+            # Other instances catch up once their copies expire.
+            logger.error("Error writing tiered cache {}: {}", self.get_redis_key(key), str(e), exc_info=True)
+
+    async def invalidate(self, *keys: Hashable) -> None:
+        """Drop entries from Redis and from the in-process cache of every instance."""
+        if not keys:
+            return
+
+        for key in keys:
+            self.local.invalidate(key)
+
+        try:
+            redis = get_redis_client()
+            await redis.delete(
+                *(self.get_redis_key(key) for key in keys),
+                *(self.get_version_key(key) for key in keys)
+            )
+            await publish_eviction(self.name, [str(key) for key in keys])
+        except Exception as e:
+            logger.error("Error invalidating tiered cache {}: {}", self.name, str(e), exc_info=True)
+
+    async def clear(self) -> None:
+        """Drop every entry from Redis and from the in-process cache of every instance."""
+        self.local.invalidate()
+
+        await invalidate_cache_tags(self.get_tag())
+        try:
+            await publish_eviction(self.name, None)
+        except Exception as e:
+            logger.error("Error clearing tiered cache {}: {}", self.name, str(e), exc_info=True)
+
+
+async def publish_eviction(
+    cache_name: str,
+    keys: Optional[list]
+) -> None:
+    """Tell every instance to drop keys, or every entry if keys is None, from the named cache's in-process copy."""
+    await get_redis_client().publish(TIERED_CACHE_CHANNEL, orjson.dumps({"cache": cache_name, "keys": keys}))
+
+
+def apply_eviction(message: bytes) -> None:
+    payload = orjson.loads(message)
+    cache = tiered_caches.get(payload.get("cache"))
+    if cache is None:
+        return
+
+    keys = payload.get("keys")
+    if keys is None:
+        cache.local.invalidate()
+        return
+    for key in keys:
+        cache.local.invalidate(key)
+
+
+async def run_cache_eviction_listener(stop_event: asyncio.Event) -> None:
+    """Apply eviction messages published by any instance until stop_event is set. Runs as a background task started
+    in the app's lifespan.
+
+    If the subscription drops, every in-process cache is cleared before resubscribing, since messages sent in the
+    meantime are lost.
+    """
+    while not stop_event.is_set():
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(TIERED_CACHE_CHANNEL)
+            while not stop_event.is_set():
+                message = await pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                try:
+                    apply_eviction(message["data"])
+                except Exception as e:
+                    logger.error("Error applying cache eviction {}: {}", message["data"], str(e), exc_info=True)
+
+        except Exception as e:
+            logger.error("Cache eviction listener disconnected: {}", str(e), exc_info=True)
+            for cache in tiered_caches.values():
+                cache.local.invalidate()
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=TIERED_CACHE_RESUBSCRIBE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+        finally:
+            await pubsub.aclose()